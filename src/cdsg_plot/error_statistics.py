@@ -56,7 +56,8 @@ def violin_plot(
     },
     colors: list = None,
     legend_loc="upper right",
-) -> None:
+    sink=None,
+) -> dict:
     """
     Create a dataframe with columns of errors pre-computed for generating
     violin plots with MAE, RMSE, and MaxAE displayed above each violin.
@@ -65,6 +66,9 @@ def violin_plot(
         df: DataFrame with columns of errors
         df_labels_and_columns: Dictionary of plotted labels along with the df column for data
         output_filename: Name of the output file
+        sink: if given, the figure is rendered in memory instead of to the output file and its
+            bytes are handed to sink, per cdsg_plot.qcdb_plot.save_output. Returns a dictionary
+            of the format written to its file name, or to its bytes when sink is given.
         ylim: list =[-15, 35],
         rcParams: can be set to None if latex is not used
         colors: list of colors for each df column plotted. A default will alternate between blue and green.
@@ -218,9 +222,10 @@ def violin_plot(
     if plt_title is not None:
         plt.title(f"{plt_title}")
     fig.subplots_adjust(bottom=bottom)
-    if output_filename:
+    files_saved = {}
+    if output_filename or sink is not None:
         ext = "png"
-        if len(output_filename.split(".")) > 1:
+        if output_filename and len(output_filename.split(".")) > 1:
             output_basename, ext = (
                 ".".join(output_filename.split(".")[:-1]),
                 output_filename.split(".")[-1],
@@ -228,14 +233,19 @@ def violin_plot(
             path = f"{output_basename}_violin.{ext}"
         else:
             path = output_filename
-        print(f"{path}")
-        plt.savefig(
-            path,
+        if sink is None:
+            print(f"{path}")
+        from cdsg_plot.qcdb_plot import save_output
+
+        # on disk, matplotlib infers the format (appending the default if path lacks an extension)
+        files_saved[ext] = save_output(sink, path, ext, lambda target: plt.savefig(
+            target,
+            format=None if isinstance(target, str) else ext,
             transparent=transparent,
             bbox_inches="tight",
             dpi=dpi,
-        )
-    return
+        ))
+    return files_saved
 
 
 def violin_plot_table(
@@ -263,7 +273,8 @@ def violin_plot_table(
     },
     colors: list = None,
     legend_loc="upper right",
-) -> None:
+    sink=None,
+) -> dict:
     """
     Create a dataframe with columns of errors pre-computed for generating
     violin plots with MAE, RMSE, and MaxAE displayed above each violin.
@@ -272,6 +283,9 @@ def violin_plot_table(
         df: DataFrame with columns of errors
         df_labels_and_columns: Dictionary of plotted labels along with the df column for data
         output_filename: Name of the output file
+        sink: if given, the figure is rendered in memory instead of to the output file and its
+            bytes are handed to sink, per cdsg_plot.qcdb_plot.save_output. Returns a dictionary
+            of the format written to its file name, or to its bytes when sink is given.
         ylim: list =[-15, 35],
         rcParams: can be set to None if latex is not used
         colors: list of colors for each df column plotted. A default will alternate between blue and green.
@@ -454,15 +468,19 @@ def violin_plot_table(
             output_filename.split(".")[-1],
         )
     path = f"{output_basename}_violin.{ext}"
-    print(f"{path}")
-    plt.savefig(
-        path,
+    if sink is None:
+        print(f"{path}")
+    from cdsg_plot.qcdb_plot import save_output
+
+    saved = save_output(sink, path, ext, lambda target: plt.savefig(
+        target,
+        format=ext,
         transparent=transparent,
         bbox_inches="tight",
         dpi=dpi,
-    )
+    ))
     plt.clf()
-    return
+    return {ext: saved}
 
 
 def violin_plot_table_multi(
@@ -494,7 +512,8 @@ def violin_plot_table_multi(
     mcure=None,
     error_labels_position=(0, 0.25),
     violin_alpha=0.6,
-) -> None:
+    sink=None,
+) -> dict:
     """
     Create a dataframe with columns of errors pre-computed for generating
     violin plots with MAE, RMSE, and MaxAE displayed above each violin.
@@ -510,6 +529,9 @@ def violin_plot_table_multi(
         ]
         df_labels_and_columns: Dictionary of plotted labels along with the df column for data
         output_filename: Name of the output file
+        sink: if given, the figure is rendered in memory instead of to the output file and its
+            bytes are handed to sink, per cdsg_plot.qcdb_plot.save_output. Returns a dictionary
+            of the format written to its file name, or to its bytes when sink is given.
         ylim: list =[-15, 35],
         rcParams: can be set to None if latex is not used
         colors: list of colors for each df column plotted. A default will alternate between blue and green.
@@ -746,15 +768,19 @@ def violin_plot_table_multi(
             output_filename.split(".")[-1],
         )
     path = f"{output_basename}_violin.{ext}"
-    print(f"{path}")
-    plt.savefig(
-        path,
+    if sink is None:
+        print(f"{path}")
+    from cdsg_plot.qcdb_plot import save_output
+
+    saved = save_output(sink, path, ext, lambda target: plt.savefig(
+        target,
+        format=ext,
         transparent=transparent,
         bbox_inches="tight",
         dpi=dpi,
-    )
+    ))
     plt.clf()
-    return
+    return {ext: saved}
 
 def violin_plot_table_multi_horizontal(
     dfs,
@@ -783,7 +809,8 @@ def violin_plot_table_multi_horizontal(
     grid_heights=None,
     grid_widths=None,
     mcure=None,
-) -> None:
+    sink=None,
+) -> dict:
     """
     Create a dataframe with columns of errors pre-computed for generating
     violin plots with MAE, RMSE, and MaxAE displayed above each violin.
@@ -797,6 +824,9 @@ def violin_plot_table_multi_horizontal(
         ]
         df_labels_and_columns: Dictionary of plotted labels along with the df column for data
         output_filename: Name of the output file
+        sink: if given, the figure is rendered in memory instead of to the output file and its
+            bytes are handed to sink, per cdsg_plot.qcdb_plot.save_output. Returns a dictionary
+            of the format written to its file name, or to its bytes when sink is given.
         ylim: list =[-15, 35],
         rcParams: can be set to None if latex is not used
         colors: list of colors for each df column plotted. A default will alternate between blue and green.
@@ -1022,15 +1052,19 @@ def violin_plot_table_multi_horizontal(
             output_filename.split(".")[-1],
         )
     path = f"{output_basename}_violin.{ext}"
-    print(f"{path}")
-    plt.savefig(
-        path,
+    if sink is None:
+        print(f"{path}")
+    from cdsg_plot.qcdb_plot import save_output
+
+    saved = save_output(sink, path, ext, lambda target: plt.savefig(
+        target,
+        format=ext,
         transparent=transparent,
         bbox_inches="tight",
         dpi=dpi,
-    )
+    ))
     plt.clf()
-    return
+    return {ext: saved}
 
 
 def convert_deltas_ssapt0(k_label):
@@ -1092,7 +1126,8 @@ def violin_plot_table_multi_SAPT_components(
     ylabel_count=True,
     disable_xtick_labels=False,
     bbox_inches="tight",
-) -> None:
+    sink=None,
+) -> dict:
     """
     TODO: maybe a 4xN grid for the 4 components of SAPT?
     Create a dataframe with columns of errors pre-computed for generating
@@ -1102,6 +1137,9 @@ def violin_plot_table_multi_SAPT_components(
         df: DataFrame with columns of errors
         df_labels_and_columns: Dictionary of plotted labels along with the df column for data
         output_filename: Name of the output file
+        sink: if given, the figure is rendered in memory instead of to the output file and its
+            bytes are handed to sink, per cdsg_plot.qcdb_plot.save_output. Returns a dictionary
+            of the format written to its file name, or to its bytes when sink is given.
         ylim: list =[-15, 35],
         rcParams: can be set to None if latex is not used
         colors: list of colors for each df column plotted. A default will alternate between blue and green.
@@ -1494,18 +1532,22 @@ def violin_plot_table_multi_SAPT_components(
             output_filename.split(".")[-1],
         )
     path = f"{output_basename}_violin.{ext}"
-    print(f"{path}")
+    if sink is None:
+        print(f"{path}")
     if share_y_axis:
         # plt.subplots_adjust(hspace=0.1)
         plt.subplots_adjust(wspace=0.05)
-    plt.savefig(
-        path,
+    from cdsg_plot.qcdb_plot import save_output
+
+    saved = save_output(sink, path, ext, lambda target: plt.savefig(
+        target,
+        format=ext,
         transparent=transparent,
         bbox_inches=bbox_inches,
         dpi=dpi,
-    )
+    ))
     plt.clf()
-    return
+    return {ext: saved}
 
 
 def violin_plot_table_multi_general(
@@ -1555,7 +1597,8 @@ def violin_plot_table_multi_general(
     pm_alpha=1.0,
     zero_alpha=0.5,
     hide_ytick_label_edges=False,
-) -> None:
+    sink=None,
+) -> dict:
     """
     TODO: maybe a 4xN grid for the 4 components of SAPT?
     Create a dataframe with columns of errors pre-computed for generating
@@ -1565,6 +1608,9 @@ def violin_plot_table_multi_general(
         df: DataFrame with columns of errors
         df_labels_and_columns: Dictionary of plotted labels along with the df column for data
         output_filename: Name of the output file
+        sink: if given, the figure is rendered in memory instead of to the output file and its
+            bytes are handed to sink, per cdsg_plot.qcdb_plot.save_output. Returns a dictionary
+            of the format written to its file name, or to its bytes when sink is given.
         ylim: list =[-15, 35],
         rcParams: can be set to None if latex is not used
         colors: list of colors for each df column plotted. A default will alternate between blue and green.
@@ -1884,15 +1930,19 @@ def violin_plot_table_multi_general(
             output_filename.split(".")[-1],
         )
     path = f"{output_basename}_violin.{ext}"
-    print(f"{path}")
-    plt.savefig(
-        path,
+    if sink is None:
+        print(f"{path}")
+    from cdsg_plot.qcdb_plot import save_output
+
+    saved = save_output(sink, path, ext, lambda target: plt.savefig(
+        target,
+        format=ext,
         transparent=transparent,
         bbox_inches="tight",
         dpi=dpi,
-    )
+    ))
     plt.clf()
-    return
+    return {ext: saved}
 
 if __name__ == "__main__":
     # Fake data generated for example
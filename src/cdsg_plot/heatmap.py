@@ -1,22 +1,132 @@
+# linkage matrices by content digest of the clustered array, so heatmaps of
+#   the same model chemistries (ME, MAE, ...) share one clustering per session
+_linkage_cache = {}
 
-def heatmap(dataframe, vmin= -2, vmax=2,  title='Title', xlabel = 'x-label', ylabel=None, color='PiYG', annot=True,annot_fmt = ".2f", annot_fontsize=8, cbar_title = 'Average Error', saveas=None, relpath=False, graphicsformat=["pdf"]):
+
+def cluster_order(values, method="average", metric="euclidean"):
+    """Returns leaf order of the rows of 2D array *values* (NaN taken as 0)
+    from hierarchical clustering with *method* linkage on *metric*
+    distances and optimal leaf ordering. The linkage is cached by the
+    contents of *values*, so repeating a clustering is free.
+
+    """
+    import hashlib
+    import numpy as np
+
+    values = np.nan_to_num(np.asarray(values, dtype=float))
+    if values.shape[0] < 3:
+        return np.arange(values.shape[0])
+    key = (hashlib.sha1(np.ascontiguousarray(values).tobytes()).hexdigest(), values.shape, method, metric)
+    if key not in _linkage_cache:
+        from scipy.cluster import hierarchy
+        from scipy.spatial.distance import pdist
+
+        _linkage_cache[key] = hierarchy.linkage(pdist(values, metric=metric), method=method, optimal_ordering=True)
+    from scipy.cluster.hierarchy import leaves_list
+
+    return leaves_list(_linkage_cache[key])
+
+
+def _cluster(dataframe, cluster, cluster_on):
+    """Returns *dataframe* with rows and/or columns per *cluster* reordered
+    by :py:func:`cluster_order` of DataFrame *cluster_on*, matching by label.
+    Labels absent from *cluster_on* keep their order at the end.
+
+    """
+    if cluster not in ["rows", "columns", "both"]:
+        raise ValueError("""Unknown cluster '%s'; use None, 'rows', 'columns' or 'both'.""" % (cluster))
+    reference = dataframe if cluster_on is None else cluster_on
+    index, columns = dataframe.index, dataframe.columns
+    if cluster in ["rows", "both"]:
+        order = reference.index[cluster_order(reference.to_numpy(dtype=float))]
+        index = [lbl for lbl in order if lbl in dataframe.index] + [lbl for lbl in dataframe.index if lbl not in order]
+    if cluster in ["columns", "both"]:
+        order = reference.columns[cluster_order(reference.to_numpy(dtype=float).T)]
+        columns = [lbl for lbl in order if lbl in dataframe.columns] + [lbl for lbl in dataframe.columns if lbl not in order]
+    return dataframe.loc[index, columns]
+
+
+def _aggregate(values, labels, target, axis):
+    """Returns *values* averaged (NaN-aware) over consecutive blocks along
+    *axis* so at most *target* remain, with each block labeled by its first
+    member from *labels*.
+
+    """
+    import numpy as np
+
+    size = values.shape[axis]
+    if target is None or size <= target:
+        return values, list(labels)
+    block = -(-size // target)
+    nblock = -(-size // block)
+    pad = [(0, 0), (0, 0)]
+    pad[axis] = (0, nblock * block - size)
+    values = np.pad(values, pad, constant_values=np.nan)
+    if axis == 0:
+        values = values.reshape(nblock, block, values.shape[1])
+    else:
+        values = values.reshape(values.shape[0], nblock, block)
+    # all-NaN blocks stay NaN
+    counts = np.sum(~np.isnan(values), axis=axis + 1)
+    sums = np.nansum(values, axis=axis + 1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        values = np.where(counts > 0, sums / counts, np.nan)
+    return values, list(labels)[::block]
+
+
+def heatmap(dataframe, vmin= -2, vmax=2,  title='Title', xlabel = 'x-label', ylabel=None, color='PiYG', annot=True,annot_fmt = ".2f", annot_fontsize=8, cbar_title = 'Average Error', saveas=None, relpath=False, graphicsformat=["pdf"],
+            max_annot=2000, resolution=None, max_ticks=30, cluster=None, cluster_on=None, sink=None):
+    """Saves a heatmap of *dataframe* (rows down, columns across). If
+    *annot*, tables of up to *max_annot* cells are drawn through seaborn
+    with each cell annotated; all others are drawn as a single image
+    without annotations and with at most *max_ticks* labels per axis. *resolution*
+    (rows, columns) first averages blocks of consecutive rows and columns
+    down to that size. *cluster* of 'rows', 'columns', or 'both' reorders
+    those by similarity (see :py:func:`cluster_order`) of *dataframe* or,
+    to give several panels one order, of a common DataFrame *cluster_on*.
+    Returns dictionary of saved files keyed by format, or with *sink* of
+    their bytes, kept in memory per :py:func:`cdsg_plot.qcdb_plot.save_output`.
+
+    """
+    import numpy as np
     import matplotlib.pyplot as plt
-    import seaborn as sns
-    from cdsg_plot.qcdb_plot import expand_saveas
-    sns.heatmap(dataframe, vmin=vmin, vmax=vmax, cmap=color, annot=annot, fmt=annot_fmt, annot_kws={"fontsize":annot_fontsize}, cbar_kws={'label':cbar_title})
-    plt.title(title)
-    plt.xlabel(xlabel)
-    plt.ylabel(ylabel)
+    from cdsg_plot.qcdb_plot import check_sink, expand_saveas, save_output
+
+    if cluster is not None:
+        dataframe = _cluster(dataframe, cluster, cluster_on)
+    if resolution is not None:
+        values = dataframe.to_numpy(dtype=float)
+        values, index = _aggregate(values, dataframe.index, resolution[0], axis=0)
+        values, columns = _aggregate(values, dataframe.columns, resolution[1], axis=1)
+        dataframe = dataframe.__class__(values, index=index, columns=columns)
+
+    fig, ax = plt.subplots()
+    if annot and dataframe.size <= max_annot:
+        import seaborn as sns
+        sns.heatmap(dataframe, vmin=vmin, vmax=vmax, cmap=color, annot=annot, fmt=annot_fmt, annot_kws={"fontsize":annot_fontsize}, cbar_kws={'label':cbar_title}, ax=ax)
+    else:
+        values = np.ma.masked_invalid(dataframe.to_numpy(dtype=float))
+        image = ax.imshow(values, vmin=vmin, vmax=vmax, cmap=color, aspect="auto", interpolation="nearest")
+        fig.colorbar(image, ax=ax, label=cbar_title)
+        for setter, labels in ((ax.set_yticks, dataframe.index), (ax.set_xticks, dataframe.columns)):
+            step = -(-len(labels) // max_ticks)
+            setter(np.arange(0, len(labels), step), [str(lbl) for lbl in labels[::step]])
+        ax.tick_params(axis="x", labelrotation=90)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    check_sink(sink, len(graphicsformat))
     files_saved = {}
     pltfile = expand_saveas(saveas, def_filename='', def_prefix="heatmap", relpath=relpath)
     for ext in graphicsformat:
         savefile = pltfile + "." + ext.lower()
-        plt.savefig(savefile, transparent=True, format=ext, bbox_inches="tight")
-        files_saved[ext.lower()] = savefile
+        files_saved[ext.lower()] = save_output(sink, savefile, ext.lower(), lambda target: plt.savefig(target, transparent=True, format=ext, bbox_inches="tight"))
+    plt.close(fig)
     return files_saved
 
 if __name__ == "__main__":
     import pandas as pd
+    import numpy as np
     import math
     data = {'MP2-CP-adz': [-1.012, 0.8976, -1.4342, 1.6523],
             'MP2-CP-adtz': [0.68763, -0.265523, 0.47563, 0.64323],
@@ -27,3 +137,11 @@ if __name__ == "__main__":
     abs_max = abs(df).values.max()
     abs_max = math.ceil(abs_max)
     heatmap(df, vmin = -1*abs_max, vmax=abs_max, title='Example', saveas='heatmap', graphicsformat=['pdf','png'])
+
+    # large table, drawn as one image at reduced resolution
+    big = pd.DataFrame(np.random.default_rng(0).normal(size=(150, 500)), index=['mc%d' % i for i in range(150)], columns=['sys%d' % i for i in range(500)])
+    heatmap(big, title='Large', resolution=(150, 250), saveas='heatmap_large', graphicsformat=['png'])
+
+    # signed and unsigned panels in one clustered order
+    heatmap(df, vmin = -1*abs_max, vmax=abs_max, title='Clustered ME', cluster='both', cluster_on=abs(df), saveas='heatmap_me', graphicsformat=['png'])
+    heatmap(abs(df), vmin = -1*abs_max, vmax=abs_max, title='Clustered MAE', cluster='both', cluster_on=abs(df), saveas='heatmap_mae', graphicsformat=['png'])
@@ -28,7 +28,13 @@
 
 from __future__ import absolute_import
 from __future__ import print_function
+import sys
+import types
 import collections
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
 
 # thinking now that QCEssential should have one doi and dictionary of
 # citations. that way the doi contains the record of the definition of the
@@ -38,18 +44,67 @@ import collections
 
 # links to GitHub Psi4 files accepted as doi for the present
 
-class Citation(object):
+_setattr = object.__setattr__
+
+
+class Frozen(object):
+    """Base for slotted classes whose instances are immutable once
+    constructed. Constructors assign attributes through
+    ``object.__setattr__``; :py:meth:`_set` does the same for unpickling.
+
+    """
+    __slots__ = ()
+
+    def _set(self, **attrs):
+        for key, value in attrs.items():
+            _setattr(self, key, value)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("""%s objects are immutable""" % (type(self).__name__))
+
+    def __delattr__(self, key):
+        raise AttributeError("""%s objects are immutable""" % (type(self).__name__))
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot)
+                for cls in type(self).__mro__ for slot in getattr(cls, '__slots__', ())}
+
+    def __setstate__(self, state):
+        self._set(**state)
+
+
+def _freeze_citations(citations):
+    """Return read-only view of *citations*, sharing one sentinel when empty."""
+    if not citations:
+        return _no_citations
+    return types.MappingProxyType(collections.OrderedDict(citations))
+
+
+# shared by every QCEssential without literature citations
+_no_citations = types.MappingProxyType(collections.OrderedDict())
+
+
+def _freeze_build(build):
+    """Return *build* with every (nested) list turned into a tuple."""
+    if isinstance(build, (list, tuple)):
+        return tuple(_freeze_build(stage) for stage in build)
+    return build
+
+
+class Citation(Frozen):
     """Class to hold reference to a single published scientific work
 
     """
+    __slots__ = ('doi', 'fullname', 'dsdbid', 'comment')
+
     def __init__(self, doi, fullname=None, dsdbid=None, comment=None):
         """
 
         """
-        self.doi = doi.lower()
-        self.fullname = fullname
-        self.dsdbid = dsdbid
-        self.comment = comment
+        _setattr(self, 'doi', doi.lower())
+        _setattr(self, 'fullname', fullname)
+        _setattr(self, 'dsdbid', dsdbid)
+        _setattr(self, 'comment', comment)
 
     def __str__(self):
         text = ''
@@ -62,29 +117,35 @@ class Citation(object):
         return text
 
 
-class QCEssential(object):
+class QCEssential(Frozen):
     """Class to link literature and external representation of some
     aspect of quantum chemistry (basis set, method, etc.) with a
     shorthand and indexed representation of same.
 
     """
+    __slots__ = ('name', 'fullname', 'latex', 'citations', 'doi', 'comment')
+    _canonical = staticmethod(str.lower)
+
     def __init__(self, name, fullname=None, latex=None, citations=None, doi=None, comment=None):
         """
 
         """
-        self.name = name.lower()
-        self.fullname = fullname
-        if fullname is not None and latex is None:
-            self.latex = fullname
-        else:
-            self.latex = latex
-        # OrderedDict of roles as keys and qcdb.Citation as values
-        if citations is None:
-            self.citations = collections.OrderedDict()
-        else:
-            self.citations = citations
-        self.doi = doi
-        self.comment = comment
+        _setattr(self, 'name', sys.intern(self._canonical(name)))
+        _setattr(self, 'fullname', fullname)
+        _setattr(self, 'latex', fullname if (fullname is not None and latex is None) else latex)
+        # read-only OrderedDict of roles as keys and qcdb.Citation as values
+        _setattr(self, 'citations', _freeze_citations(citations))
+        _setattr(self, 'doi', doi)
+        _setattr(self, 'comment', comment)
+
+    def __getstate__(self):
+        state = Frozen.__getstate__(self)
+        state['citations'] = collections.OrderedDict(self.citations)
+        return state
+
+    def __setstate__(self, state):
+        state = dict(state, name=sys.intern(state['name']), citations=_freeze_citations(state['citations']))
+        Frozen.__setstate__(self, state)
 
     def __str__(self):
         text = ''
@@ -94,7 +155,7 @@ class QCEssential(object):
         text += """  DOI:                  %s\n""" % (self.doi)
         text += """  Literature citations:\n"""
         for rol, cit in self.citations.items():
-            text += """    %17s: %s\n""" (rol, cit.doi)
+            text += """    %17s: %s\n""" % (rol, cit.doi)
         text += """  Comment:              %s\n""" % (self.comment)
         text += """\n"""
         return text
@@ -105,13 +166,17 @@ class Publication(QCEssential):
     publications, presumably containing many quantum chemistry results.
 
     """
+    __slots__ = ('owner',)
+
     def __init__(self, name, fullname=None, latex=None, dsdbid=None, doi=None, comment=None, owner=None):
         primary = Citation(doi=doi, fullname=fullname, dsdbid=dsdbid)
         cits = collections.OrderedDict()
         cits['primary'] = primary
         QCEssential.__init__(self, name=name, fullname=primary.fullname, latex=latex, citations=cits, doi=primary.doi, comment=comment)
-        self.name = name.lower()
-        self.owner = owner.upper()
+        _setattr(self, 'owner', sys.intern(owner.upper()))
+
+    def __setstate__(self, state):
+        QCEssential.__setstate__(self, dict(state, owner=sys.intern(state['owner'])))
 
     def __str__(self):
         text = ''
@@ -131,11 +196,13 @@ class BasisSet(QCEssential):
     """Specialization of :py:class:`QCEssential` for basis sets.
 
     """
+    __slots__ = ('zeta', 'build')
+
     def __init__(self, name, fullname=None, latex=None, citations=None, doi=None, comment=None, zeta=None, build=None):
         QCEssential.__init__(self, name, fullname, latex, citations, doi, comment)
-        self.name = name.lower()
-        self.zeta = zeta
-        self.build = [[self.name]] if build is None else build
+        _setattr(self, 'zeta', zeta)
+        # tuple of CBS stages, each a tuple of basis names or None
+        _setattr(self, 'build', ((self.name,),) if build is None else _freeze_build(build))
 
     def __str__(self):
         text = ''
@@ -147,7 +214,7 @@ class BasisSet(QCEssential):
         text += """  DOI:                  %s\n""" % (self.doi)
         text += """  Literature citations:\n"""
         for rol, cit in self.citations.items():
-            text += """    %17s: %s\n""" (rol, cit.doi)
+            text += """    %17s: %s\n""" % (rol, cit.doi)
         text += """  Comment:              %s\n""" % (self.comment)
         text += """\n"""
         return text
@@ -157,9 +224,11 @@ class Method(QCEssential):
     """Specialization of :py:class:`QCEssential` for quantum chemical methods.
 
     """
+    __slots__ = ()
+    _canonical = staticmethod(str.upper)
+
     def __init__(self, name, fullname=None, latex=None, citations=None, doi=None, comment=None):
         QCEssential.__init__(self, name, fullname, latex, citations, doi, comment)
-        self.name = name.upper()
 
     def __str__(self):
         text = ''
@@ -169,7 +238,7 @@ class Method(QCEssential):
         text += """  DOI:                  %s\n""" % (self.doi)
         text += """  Literature citations:\n"""
         for rol, cit in self.citations.items():
-            text += """    %17s: %s\n""" (rol, cit.doi)
+            text += """    %17s: %s\n""" % (rol, cit.doi)
         text += """  Comment:              %s\n""" % (self.comment)
         text += """\n"""
         return text
@@ -179,9 +248,10 @@ class Error(QCEssential):
     """Specialization of :py:class:`QCEssential` for measures of error.
 
     """
+    __slots__ = ()
+
     def __init__(self, name, fullname=None, latex=None, citations=None, doi=None,  comment=None):
         QCEssential.__init__(self, name, fullname, latex, citations, doi, comment)
-        self.name = name.lower()
 
     def __str__(self):
         text = ''
@@ -191,7 +261,7 @@ class Error(QCEssential):
         text += """  DOI:                  %s\n""" % (self.doi)
         text += """  Literature citations:\n"""
         for rol, cit in self.citations.items():
-            text += """    %17s: %s\n""" (rol, cit.doi)
+            text += """    %17s: %s\n""" % (rol, cit.doi)
         text += """  Comment:              %s\n""" % (self.comment)
         text += """\n"""
         return text
@@ -219,354 +289,499 @@ class Error(QCEssential):
 #        return text
 
 
-_tlist = [
-    Publication('dhdft', doi='', dsdbid='', owner='CAC',
-        fullname=""),
-    Publication('dft', doi='10.1063/1.3545971', dsdbid='Burns:2011:084107', owner='LAB',
-        fullname="""Density-Functional Approaches to Noncovalent Interactions: A Comparison of Dispersion Corrections (DFT-D), Exchange-Hole Dipole Moment (XDM) Theory, and Specialized Functions. L. A. Burns, A. Vazquez-Mayagoitia, B. G. Sumpter, and C. D. Sherrill, J. Chem. Phys. 134(8), 084107/1-25 (2011)"""),
-    Publication('saptone', doi='10.1063/1.4867135', dsdbid='Parker:2014:094106', owner='LAB',
-        fullname="""Levels of Symmetry Adapted Perturbation Theory (SAPT). I. Efficiency and Performance for Interaction Energies. T. M. Parker, L. A. Burns, R. M. Parrish, A. G. Ryno, and C. D. Sherrill, J. Chem. Phys. 140(9), 094106/1-16 (2014)"""),
-    Publication('pt2', doi='10.1063/1.4903765', dsdbid='Burns:2014:234111', owner='LAB',
-        fullname="""Appointing Silver and Bronze Standards for Noncovalent Interactions: A Comparison of Spin-Component-Scaled (SCS), Explicitly Correlated (F12), and Specialized Wavefunction Approaches. L. A. Burns, M. S. Marshall, and C. D. Sherrill, J. Chem. Phys. 141(23), 234111/1-21 (2014)"""),
-    Publication('s22b', doi='10.1063/1.3659142', dsdbid='Marshall:2011:194102', owner='LAB',
-        fullname="""Basis Set Convergence of the Coupled-Cluster Correction, delta_MP2^CCSD(T): Best Practices for Benchmarking Noncovalent Interactions and the Attendant Revision of the S22, NBC10, HBC6, and HSG Databases. M. S. Marshall, L. A. Burns, and C. D. Sherrill, J. Chem. Phys. 135(19), 194102/1-10 (2011)"""),
-    Publication('dilabio', doi='10.1021/ct400149j', dsdbid='Burns:2014:49', owner='LAB',
-        fullname="""Comparing Counterpoise-Corrected, Uncorrected, and Averaged Binding Energies for Benchmarking Noncovalent Interactions. L. A. Burns, M. S. Marshall, and C. D. Sherrill, J. Chem. Theory Comput. 10(1), 49-57 (2014)"""),
-    Publication('achc', doi='10.1021/acs.jctc.5b00588', dsdbid='', owner='TMP',
-        fullname="""Assessment of Empirical Models versus High-Accuracy Ab Initio Methods for Nucleobase Stacking: Evaluating the Importance of Charge Penetration"""),
-    Publication('pt2uncp', doi='', dsdbid='', owner='LAB', fullname=''),
-    Publication('dfit', doi='', dsdbid='', owner='DGAS', fullname=''),
-    Publication('merz3', doi='', dsdbid='', owner='LAB', fullname=''),
-    Publication('bfdbmm', doi='', dsdbid='', owner='LAB', fullname=''),
-    Publication('saptmisc', doi='', dsdbid='', owner='', fullname=''),
-    Publication('bfdbdft', doi='', dsdbid='', owner='', fullname=''),
-    Publication('silver', doi='', dsdbid='', owner='', fullname=''),
-    Publication('anon', doi='', dsdbid='', owner='', fullname=''),
-    Publication('f12dilabio', doi='', dsdbid='', owner='', fullname=''),
-]
-pubs = {}
-for item in _tlist:
-    pubs[item.name] = item
-
-
-_tlist = [
-    BasisSet('dz',         fullname='cc-pVDZ'),
-    BasisSet('jadz',       fullname='jun-cc-pVDZ'),
-    BasisSet('hadz',       fullname='heavy-aug-cc-pVDZ'),
-    BasisSet('adz',        fullname='aug-cc-pVDZ'),
-    BasisSet('addz',       fullname='aug-cc-pV(D+d)Z'),
-    BasisSet('tz',         fullname='cc-pVTZ'),
-    BasisSet('matz',       fullname='may-cc-pVTZ'),
-    BasisSet('jatz',       fullname='jun-cc-pVTZ'),
-    BasisSet('hatz',       fullname='heavy-aug-cc-pVTZ'),
-    BasisSet('atz',        fullname='aug-cc-pVTZ'),
-    BasisSet('qz',         fullname='cc-pVQZ'),
-    BasisSet('aaqz',       fullname='apr-cc-pVQZ'),
-    BasisSet('maqz',       fullname='may-cc-pVQZ'),
-    BasisSet('jaqz',       fullname='jun-cc-pVQZ'),
-    BasisSet('haqz',       fullname='heavy-aug-cc-pVQZ'),
-    BasisSet('aqz',        fullname='aug-cc-pVQZ'),
-    BasisSet('a5z',        fullname='aug-cc-pV5Z'),
-    BasisSet('dtz',        fullname='cc-pVDTZ', build=[None, ['tz', 'dtz']]),
-    BasisSet('jadtz',      fullname='jun-cc-pVDTZ', build=[None, ['jatz', 'jadtz']]),
-    BasisSet('hadtz',      fullname='heavy-aug-cc-pVDTZ', build=[None, ['hatz', 'hadtz']]),
-    BasisSet('adtz',       fullname='aug-cc-pVDTZ', build=[['adtz'], ['atz', 'adtz']]),
-    BasisSet('tqz',        fullname='cc-pVTQZ', build=[None, ['qz', 'tqz']]),
-    BasisSet('matqz',      fullname='may-cc-pVTQZ', build=[None, ['maqz', 'matqz']]),
-    BasisSet('jatqz',      fullname='jun-cc-pVTQZ', build=[None, ['jaqz', 'jatqz']]),
-    BasisSet('hatqz',      fullname='heavy-aug-cc-pVTQZ', build=[None, ['haqz', 'hatqz']]),
-    BasisSet('atqz',       fullname='aug-cc-pVTQZ', build=[['atqz'], ['aqz', 'atqz']]),
-    BasisSet('aq5z',       fullname='aug-cc-pVQ5Z', build=[['aq5z'], ['a5z', 'aq5z']]),
-    BasisSet('a6z',        fullname='aug-cc-pV6Z'),
-    BasisSet('a56z',       fullname='aug-cc-pV56Z', build=[['a56z'], ['a6z', 'a56z']]),
-    BasisSet('atzdz',      fullname='[aTZ; D:DZ]', latex="""[aTZ; $\delta$:DZ]""",
-        build=[None, None, ['atz', 'atz', 'dz']]),
-    BasisSet('adtzdz',     fullname='[aDTZ; D:DZ]', latex="""[aDTZ; $\delta$:DZ]""",
-        build=[None, None, ['atz', 'adtz', 'dz']]),
-    BasisSet('atqzdz',     fullname='[aTQZ; D:DZ]', latex="""[aTQZ; $\delta$:DZ]""",
-        build=[None, None, ['aqz', 'atqz', 'dz']]),
-    BasisSet('atzjadz',    fullname='[aTZ; D:jaDZ]', latex="""[aTZ; $\delta$:jaDZ]""",
-        build=[None, None, ['atz', 'atz', 'jadz']]),
-    BasisSet('adtzjadz',   fullname='[aDTZ; D:jaDZ]', latex="""[aDTZ; $\delta$:jaDZ]""",
-        build=[None, None, ['atz', 'adtz', 'jadz']]),
-    BasisSet('atqzjadz',   fullname='[aTQZ; D:jaDZ]', latex="""[aTQZ; $\delta$:jaDZ]""",
-        build=[None, None, ['aqz', 'atqz', 'jadz']]),
-    BasisSet('atzhadz',    fullname='[aTZ; D:haDZ]', latex="""[aTZ; $\delta$:haDZ]""",
-        build=[None, None, ['atz', 'atz', 'hadz']]),
-    BasisSet('adtzhadz',   fullname='[aDTZ; D:haDZ]', latex="""[aDTZ; $\delta$:haDZ]""",
-        build=[None, None, ['atz', 'adtz', 'hadz']]),
-    BasisSet('atqzhadz',   fullname='[aTQZ; D:haDZ]', latex="""[aTQZ; $\delta$:haDZ]""",
-        build=[None, None, ['aqz', 'atqz', 'hadz']]),
-    BasisSet('atzadz',     fullname='[aTZ; D:aDZ]', latex="""[aTZ; $\delta$:aDZ]""",
-        build=[None, None, ['atz', 'atz', 'adz']]),
-    BasisSet('adtzadz',    fullname='[aDTZ; D:aDZ]', latex="""[aDTZ; $\delta$:aDZ]""",
-        build=[None, None, ['atz', 'adtz', 'adz']]),
-    BasisSet('atqzadz',    fullname='[aTQZ; D:aDZ]', latex="""[aTQZ; $\delta$:aDZ]""",
-        build=[None, None, ['aqz', 'atqz', 'adz']]),
-    BasisSet('aq5zadz',    fullname='[aQ5Z; D:aDZ]', latex="""[aQ5Z; $\delta$:aDZ]""",
-        build=[None, None, ['a5z', 'aq5z', 'adz']]),
-    BasisSet('atzdtz',     fullname='[aTZ; D:DTZ]', latex="""[aTZ; $\delta$:DTZ]""",
-        build=[None, None, ['atz', 'atz', 'dtz']]),
-    BasisSet('atqzdtz',    fullname='[aTQZ; D:DTZ]', latex="""[aTQZ; $\delta$:DTZ]""",
-        build=[None, None, ['aqz', 'atqz', 'dtz']]),
-    BasisSet('atzjadtz',   fullname='[aTZ; D:jaDTZ]', latex="""[aTZ; $\delta$:jaDTZ]""",
-        build=[None, None, ['atz', 'atz', 'jadtz']]),
-    BasisSet('atqzjadtz',  fullname='[aTQZ; D:jaDTZ]', latex="""[aTQZ; $\delta$:jaDTZ]""",
-        build=[None, None, ['aqz', 'atqz', 'jadtz']]),
-    BasisSet('atzhadtz',   fullname='[aTZ; D:haDTZ]', latex="""[aTZ; $\delta$:haDTZ]""",
-        build=[None, None, ['atz', 'atz', 'hadtz']]),
-    BasisSet('atqzhadtz',  fullname='[aTQZ; D:haDTZ]', latex="""[aTQZ; $\delta$:haDTZ]""",
-        build=[None, None, ['aqz', 'atqz', 'hadtz']]),
-    BasisSet('atzadtz',    fullname='[aTZ; D:aDTZ]', latex="""[aTZ; $\delta$:aDTZ]""",
-        build=[None, None, ['atz', 'atz', 'adtz']]),
-    BasisSet('atqzadtz',   fullname='[aTQZ; D:aDTZ]', latex="""[aTQZ; $\delta$:aDTZ]""",
-        build=[None, None, ['aqz', 'atqz', 'adtz']]),
-    BasisSet('aq5zadtz',   fullname='[aQ5Z; D:aDTZ]', latex="""[aQ5Z; $\delta$:aDTZ]""",
-        build=[None, None, ['a5z', 'aq5z', 'adtz']]),
-    BasisSet('atqztz',     fullname='[aTQZ; D:TZ]', latex="""[aTQZ; $\delta$:TZ]""",
-        build=[None, None, ['aqz', 'atqz', 'tz']]),
-    BasisSet('atqzjatz',   fullname='[aTQZ; D:jaTZ]', latex="""[aTQZ; $\delta$:jaTZ]""",
-        build=[None, None, ['aqz', 'atqz', 'jatz']]),
-    BasisSet('atqzmatz',   fullname='[aTQZ; D:maTZ]', latex="""[aTQZ; $\delta$:maTZ]""",
-        build=[None, None, ['aqz', 'atqz', 'matz']]),
-    BasisSet('atqzhatz',   fullname='[aTQZ; D:haTZ]', latex="""[aTQZ; $\delta$:haTZ]""",
-        build=[None, None, ['aqz', 'atqz', 'hatz']]),
-    BasisSet('atqzatz',    fullname='[aTQZ; D:aTZ]', latex="""[aTQZ; $\delta$:aTZ]""",
-        build=[None, None, ['aqz', 'atqz', 'atz']]),
-    BasisSet('aq5zatz',    fullname='[aQ5Z; D:aTZ]', latex="""[aQ5Z; $\delta$:aTZ]""",
-        build=[None, None, ['a5z', 'aq5z', 'atz']]),
-    BasisSet('aq5zhatz',   fullname='[aQ5Z; D:haTZ]', latex="""[aQ5Z; $\delta$:haTZ]""",
-        build=[None, None, ['a5z', 'aq5z', 'hatz']]),
-    BasisSet('haq5zatz',   fullname='[haQ5Z; D:aTZ]', latex="""[haQ5Z; $\delta$:aTZ]""",
-        build=[None, None, ['ha5z', 'haq5z', 'atz']]),
-    BasisSet('aq5zaqz',    fullname='[aQ5Z; D:aQZ]', latex="""[aQ5Z; $\delta$:aQZ]""",
-        build=[None, None, ['a5z', 'aq5z', 'aqz']]),
-    BasisSet('tqz631gs025',fullname='[TQZ; D:631G*(0.25)', latex="""[TQZ; $\delta$:631gs025]""",
-        build=[None, None, ['qz', 'tqz', '631gs025']]),
-    BasisSet('dzf12',      fullname='cc-pVDZ-F12'),
-    BasisSet('tzf12',      fullname='cc-pVTZ-F12'),
-    BasisSet('qzf12',      fullname='cc-pVQZ-F12'),
-    BasisSet('5zf12',      fullname='cc-pV5Z-F12'),
-    BasisSet('dtzf12',     fullname='cc-pVDTZ-F12', build=[['dtzf12'], ['tzf12', 'dtzf12']]),
-    BasisSet('tqzf12',     fullname='cc-pVTQZ-F12', build=[['tqzf12'], ['qzf12', 'tqzf12']]),
-    BasisSet('q5zf12',     fullname='cc-pVQ5Z-F12', build=[['q5zf12'], ['5zf12', 'q5zf12']]),
-    BasisSet('hill1_adtz', build=[['hillcc_adtz'], ['atz', 'hillcc_adtz']]),  # TODO should have None or non-xtpl first element?
-    BasisSet('hill1_atqz', build=[['hillcc_atqz'], ['aqz', 'hillcc_atqz']]),
-    BasisSet('hill1_aq5z', build=[['hillcc_aq5z'], ['a5z', 'hillcc_aq5z']]),
-    BasisSet('hill1_dtzf12', build=[['hillcc_dtzf12'], ['tzf12', 'hillcc_dtzf12']]),
-    BasisSet('hill1_tqzf12', build=[['hillcc_tqzf12'], ['qzf12', 'hillcc_tqzf12']]),
-    BasisSet('hill2_dtzf12', build=[None, None, ['tzf12', 'hillcc_dtzf12', 'hillt_dtzf12']]),
-    BasisSet('hill2_tqzf12', build=[None, None, ['qzf12', 'hillcc_tqzf12', 'hillt_tqzf12']]),
-    BasisSet('hill2_adtz', build=[None, None, ['atz', 'hillcc_adtz', 'hillt_adtz']]),
-    BasisSet('hill2_atqz', build=[None, None, ['aqz', 'hillcc_atqz', 'hillt_atqz']]),
-    BasisSet('hill2_aq5z', build=[None, None, ['a5z', 'hillcc_aq5z', 'hillt_aq5z']]),
-    BasisSet('dadz',       fullname='double-aug-cc-pVDZ'),
-    BasisSet('datz',       fullname='double-aug-cc-pVTZ'),
-    BasisSet('631pgs',     fullname='6-31+G(d)'),
-    BasisSet('6311pg_3df_2p_', fullname='6-311+G(3df,2p)'),
-    BasisSet('6311ppg_3df_2p_', fullname='6-311++G(3df,2p)'),
-    BasisSet('631gs025',     fullname='6-31G*(0.25)'),
-    BasisSet('def2qzvp',   fullname='def2-QZVP'),
-    BasisSet('na',         fullname='no applicable basis'),
-]
-bases = {}
-for item in _tlist:
-    bases[item.name] = item
+class Registry(MutableMapping):
+    """Dictionary of :py:class:`QCEssential` objects of class *cls* keyed
+    by name, built only on first use from compact tuples *rows* whose
+    entries are the constructor arguments named in *fields*. Beyond
+    exact-name indexing, :py:meth:`lookup` resolves names, formal names,
+    LaTeX representations and aliases regardless of case. Entries can be
+    set, deleted and merged with ``update()`` as in a plain dict.
+
+    """
+    def __init__(self, cls, fields, rows, aliases=None):
+        self.cls = cls
+        self.fields = fields
+        self.rows = rows
+        self.aliases = {} if aliases is None else dict(aliases)
+        self._store = None
+        self._index = None
+
+    @property
+    def store(self):
+        """OrderedDict of name: object, constructed on first access."""
+        if self._store is None:
+            self._store = collections.OrderedDict()
+            for row in self.rows:
+                item = self.cls(**dict(zip(self.fields, row)))
+                self._store[item.name] = item
+        return self._store
+
+    def __getitem__(self, key):
+        return self.store[key]
+
+    def __setitem__(self, key, item):
+        self.store[key] = item
+        self._index = None
+
+    def __delitem__(self, key):
+        del self.store[key]
+        self._index = None
+
+    def __iter__(self):
+        return iter(self.store)
+
+    def __len__(self):
+        return len(self.store)
+
+    def register(self, *items):
+        """Add or replace QCEssential *items*, e.g., project-specific entries."""
+        for item in items:
+            self[item.name] = item
+
+    def add_alias(self, alias, name):
+        """Make *alias* resolve through :py:meth:`lookup` to entry *name*."""
+        self.aliases[alias] = name
+        self._index = None
+
+    @property
+    def index(self):
+        """Cached reverse index from normalized name, fullname, LaTeX and
+        alias to object. Aliases take precedence, then names, then
+        fullnames, then LaTeX; within a field, earlier entries win.
+
+        """
+        if self._index is None:
+            index = {}
+            for field in ["latex", "fullname", "name"]:
+                for item in reversed(list(self.store.values())):
+                    key = getattr(item, field)
+                    if key:
+                        index[_normalize(key)] = item
+            for alias, name in self.aliases.items():
+                if name in self.store:
+                    index[_normalize(alias)] = self.store[name]
+            self._index = index
+        return self._index
+
+    def lookup(self, key):
+        """Return object for *key* as exact name or else as any name,
+        fullname, LaTeX representation or alias after case and whitespace
+        normalization. Raises KeyError if unresolved.
+
+        """
+        try:
+            return self.store[key]
+        except KeyError:
+            return self.index[_normalize(key)]
+
+
+def _normalize(key):
+    return " ".join(key.split()).lower()
+
+
+_publication_rows = (
+    ('dhdft', '', '', 'CAC',
+        ""),
+    ('dft', '10.1063/1.3545971', 'Burns:2011:084107', 'LAB',
+        """Density-Functional Approaches to Noncovalent Interactions: A Comparison of Dispersion Corrections (DFT-D), Exchange-Hole Dipole Moment (XDM) Theory, and Specialized Functions. L. A. Burns, A. Vazquez-Mayagoitia, B. G. Sumpter, and C. D. Sherrill, J. Chem. Phys. 134(8), 084107/1-25 (2011)"""),
+    ('saptone', '10.1063/1.4867135', 'Parker:2014:094106', 'LAB',
+        """Levels of Symmetry Adapted Perturbation Theory (SAPT). I. Efficiency and Performance for Interaction Energies. T. M. Parker, L. A. Burns, R. M. Parrish, A. G. Ryno, and C. D. Sherrill, J. Chem. Phys. 140(9), 094106/1-16 (2014)"""),
+    ('pt2', '10.1063/1.4903765', 'Burns:2014:234111', 'LAB',
+        """Appointing Silver and Bronze Standards for Noncovalent Interactions: A Comparison of Spin-Component-Scaled (SCS), Explicitly Correlated (F12), and Specialized Wavefunction Approaches. L. A. Burns, M. S. Marshall, and C. D. Sherrill, J. Chem. Phys. 141(23), 234111/1-21 (2014)"""),
+    ('s22b', '10.1063/1.3659142', 'Marshall:2011:194102', 'LAB',
+        """Basis Set Convergence of the Coupled-Cluster Correction, delta_MP2^CCSD(T): Best Practices for Benchmarking Noncovalent Interactions and the Attendant Revision of the S22, NBC10, HBC6, and HSG Databases. M. S. Marshall, L. A. Burns, and C. D. Sherrill, J. Chem. Phys. 135(19), 194102/1-10 (2011)"""),
+    ('dilabio', '10.1021/ct400149j', 'Burns:2014:49', 'LAB',
+        """Comparing Counterpoise-Corrected, Uncorrected, and Averaged Binding Energies for Benchmarking Noncovalent Interactions. L. A. Burns, M. S. Marshall, and C. D. Sherrill, J. Chem. Theory Comput. 10(1), 49-57 (2014)"""),
+    ('achc', '10.1021/acs.jctc.5b00588', '', 'TMP',
+        """Assessment of Empirical Models versus High-Accuracy Ab Initio Methods for Nucleobase Stacking: Evaluating the Importance of Charge Penetration"""),
+    ('pt2uncp', '', '', 'LAB', ''),
+    ('dfit', '', '', 'DGAS', ''),
+    ('merz3', '', '', 'LAB', ''),
+    ('bfdbmm', '', '', 'LAB', ''),
+    ('saptmisc', '', '', '', ''),
+    ('bfdbdft', '', '', '', ''),
+    ('silver', '', '', '', ''),
+    ('anon', '', '', '', ''),
+    ('f12dilabio', '', '', '', ''),
+)
+pubs = Registry(Publication, ["name", "doi", "dsdbid", "owner", "fullname"], _publication_rows)
+
+
+# name, fullname, latex, build
+_basis_rows = (
+    ('dz',         'cc-pVDZ'),
+    ('jadz',       'jun-cc-pVDZ'),
+    ('hadz',       'heavy-aug-cc-pVDZ'),
+    ('adz',        'aug-cc-pVDZ'),
+    ('addz',       'aug-cc-pV(D+d)Z'),
+    ('tz',         'cc-pVTZ'),
+    ('matz',       'may-cc-pVTZ'),
+    ('jatz',       'jun-cc-pVTZ'),
+    ('hatz',       'heavy-aug-cc-pVTZ'),
+    ('atz',        'aug-cc-pVTZ'),
+    ('qz',         'cc-pVQZ'),
+    ('aaqz',       'apr-cc-pVQZ'),
+    ('maqz',       'may-cc-pVQZ'),
+    ('jaqz',       'jun-cc-pVQZ'),
+    ('haqz',       'heavy-aug-cc-pVQZ'),
+    ('aqz',        'aug-cc-pVQZ'),
+    ('a5z',        'aug-cc-pV5Z'),
+    ('dtz',        'cc-pVDTZ', None, [None, ['tz', 'dtz']]),
+    ('jadtz',      'jun-cc-pVDTZ', None, [None, ['jatz', 'jadtz']]),
+    ('hadtz',      'heavy-aug-cc-pVDTZ', None, [None, ['hatz', 'hadtz']]),
+    ('adtz',       'aug-cc-pVDTZ', None, [['adtz'], ['atz', 'adtz']]),
+    ('tqz',        'cc-pVTQZ', None, [None, ['qz', 'tqz']]),
+    ('matqz',      'may-cc-pVTQZ', None, [None, ['maqz', 'matqz']]),
+    ('jatqz',      'jun-cc-pVTQZ', None, [None, ['jaqz', 'jatqz']]),
+    ('hatqz',      'heavy-aug-cc-pVTQZ', None, [None, ['haqz', 'hatqz']]),
+    ('atqz',       'aug-cc-pVTQZ', None, [['atqz'], ['aqz', 'atqz']]),
+    ('aq5z',       'aug-cc-pVQ5Z', None, [['aq5z'], ['a5z', 'aq5z']]),
+    ('a6z',        'aug-cc-pV6Z'),
+    ('a56z',       'aug-cc-pV56Z', None, [['a56z'], ['a6z', 'a56z']]),
+    ('atzdz',      '[aTZ; D:DZ]', """[aTZ; $\delta$:DZ]""",
+        [None, None, ['atz', 'atz', 'dz']]),
+    ('adtzdz',     '[aDTZ; D:DZ]', """[aDTZ; $\delta$:DZ]""",
+        [None, None, ['atz', 'adtz', 'dz']]),
+    ('atqzdz',     '[aTQZ; D:DZ]', """[aTQZ; $\delta$:DZ]""",
+        [None, None, ['aqz', 'atqz', 'dz']]),
+    ('atzjadz',    '[aTZ; D:jaDZ]', """[aTZ; $\delta$:jaDZ]""",
+        [None, None, ['atz', 'atz', 'jadz']]),
+    ('adtzjadz',   '[aDTZ; D:jaDZ]', """[aDTZ; $\delta$:jaDZ]""",
+        [None, None, ['atz', 'adtz', 'jadz']]),
+    ('atqzjadz',   '[aTQZ; D:jaDZ]', """[aTQZ; $\delta$:jaDZ]""",
+        [None, None, ['aqz', 'atqz', 'jadz']]),
+    ('atzhadz',    '[aTZ; D:haDZ]', """[aTZ; $\delta$:haDZ]""",
+        [None, None, ['atz', 'atz', 'hadz']]),
+    ('adtzhadz',   '[aDTZ; D:haDZ]', """[aDTZ; $\delta$:haDZ]""",
+        [None, None, ['atz', 'adtz', 'hadz']]),
+    ('atqzhadz',   '[aTQZ; D:haDZ]', """[aTQZ; $\delta$:haDZ]""",
+        [None, None, ['aqz', 'atqz', 'hadz']]),
+    ('atzadz',     '[aTZ; D:aDZ]', """[aTZ; $\delta$:aDZ]""",
+        [None, None, ['atz', 'atz', 'adz']]),
+    ('adtzadz',    '[aDTZ; D:aDZ]', """[aDTZ; $\delta$:aDZ]""",
+        [None, None, ['atz', 'adtz', 'adz']]),
+    ('atqzadz',    '[aTQZ; D:aDZ]', """[aTQZ; $\delta$:aDZ]""",
+        [None, None, ['aqz', 'atqz', 'adz']]),
+    ('aq5zadz',    '[aQ5Z; D:aDZ]', """[aQ5Z; $\delta$:aDZ]""",
+        [None, None, ['a5z', 'aq5z', 'adz']]),
+    ('atzdtz',     '[aTZ; D:DTZ]', """[aTZ; $\delta$:DTZ]""",
+        [None, None, ['atz', 'atz', 'dtz']]),
+    ('atqzdtz',    '[aTQZ; D:DTZ]', """[aTQZ; $\delta$:DTZ]""",
+        [None, None, ['aqz', 'atqz', 'dtz']]),
+    ('atzjadtz',   '[aTZ; D:jaDTZ]', """[aTZ; $\delta$:jaDTZ]""",
+        [None, None, ['atz', 'atz', 'jadtz']]),
+    ('atqzjadtz',  '[aTQZ; D:jaDTZ]', """[aTQZ; $\delta$:jaDTZ]""",
+        [None, None, ['aqz', 'atqz', 'jadtz']]),
+    ('atzhadtz',   '[aTZ; D:haDTZ]', """[aTZ; $\delta$:haDTZ]""",
+        [None, None, ['atz', 'atz', 'hadtz']]),
+    ('atqzhadtz',  '[aTQZ; D:haDTZ]', """[aTQZ; $\delta$:haDTZ]""",
+        [None, None, ['aqz', 'atqz', 'hadtz']]),
+    ('atzadtz',    '[aTZ; D:aDTZ]', """[aTZ; $\delta$:aDTZ]""",
+        [None, None, ['atz', 'atz', 'adtz']]),
+    ('atqzadtz',   '[aTQZ; D:aDTZ]', """[aTQZ; $\delta$:aDTZ]""",
+        [None, None, ['aqz', 'atqz', 'adtz']]),
+    ('aq5zadtz',   '[aQ5Z; D:aDTZ]', """[aQ5Z; $\delta$:aDTZ]""",
+        [None, None, ['a5z', 'aq5z', 'adtz']]),
+    ('atqztz',     '[aTQZ; D:TZ]', """[aTQZ; $\delta$:TZ]""",
+        [None, None, ['aqz', 'atqz', 'tz']]),
+    ('atqzjatz',   '[aTQZ; D:jaTZ]', """[aTQZ; $\delta$:jaTZ]""",
+        [None, None, ['aqz', 'atqz', 'jatz']]),
+    ('atqzmatz',   '[aTQZ; D:maTZ]', """[aTQZ; $\delta$:maTZ]""",
+        [None, None, ['aqz', 'atqz', 'matz']]),
+    ('atqzhatz',   '[aTQZ; D:haTZ]', """[aTQZ; $\delta$:haTZ]""",
+        [None, None, ['aqz', 'atqz', 'hatz']]),
+    ('atqzatz',    '[aTQZ; D:aTZ]', """[aTQZ; $\delta$:aTZ]""",
+        [None, None, ['aqz', 'atqz', 'atz']]),
+    ('aq5zatz',    '[aQ5Z; D:aTZ]', """[aQ5Z; $\delta$:aTZ]""",
+        [None, None, ['a5z', 'aq5z', 'atz']]),
+    ('aq5zhatz',   '[aQ5Z; D:haTZ]', """[aQ5Z; $\delta$:haTZ]""",
+        [None, None, ['a5z', 'aq5z', 'hatz']]),
+    ('haq5zatz',   '[haQ5Z; D:aTZ]', """[haQ5Z; $\delta$:aTZ]""",
+        [None, None, ['ha5z', 'haq5z', 'atz']]),
+    ('aq5zaqz',    '[aQ5Z; D:aQZ]', """[aQ5Z; $\delta$:aQZ]""",
+        [None, None, ['a5z', 'aq5z', 'aqz']]),
+    ('tqz631gs025','[TQZ; D:631G*(0.25)', """[TQZ; $\delta$:631gs025]""",
+        [None, None, ['qz', 'tqz', '631gs025']]),
+    ('dzf12',      'cc-pVDZ-F12'),
+    ('tzf12',      'cc-pVTZ-F12'),
+    ('qzf12',      'cc-pVQZ-F12'),
+    ('5zf12',      'cc-pV5Z-F12'),
+    ('dtzf12',     'cc-pVDTZ-F12', None, [['dtzf12'], ['tzf12', 'dtzf12']]),
+    ('tqzf12',     'cc-pVTQZ-F12', None, [['tqzf12'], ['qzf12', 'tqzf12']]),
+    ('q5zf12',     'cc-pVQ5Z-F12', None, [['q5zf12'], ['5zf12', 'q5zf12']]),
+    ('hill1_adtz', None, None, [['hillcc_adtz'], ['atz', 'hillcc_adtz']]),  # TODO should have None or non-xtpl first element?
+    ('hill1_atqz', None, None, [['hillcc_atqz'], ['aqz', 'hillcc_atqz']]),
+    ('hill1_aq5z', None, None, [['hillcc_aq5z'], ['a5z', 'hillcc_aq5z']]),
+    ('hill1_dtzf12', None, None, [['hillcc_dtzf12'], ['tzf12', 'hillcc_dtzf12']]),
+    ('hill1_tqzf12', None, None, [['hillcc_tqzf12'], ['qzf12', 'hillcc_tqzf12']]),
+    ('hill2_dtzf12', None, None, [None, None, ['tzf12', 'hillcc_dtzf12', 'hillt_dtzf12']]),
+    ('hill2_tqzf12', None, None, [None, None, ['qzf12', 'hillcc_tqzf12', 'hillt_tqzf12']]),
+    ('hill2_adtz', None, None, [None, None, ['atz', 'hillcc_adtz', 'hillt_adtz']]),
+    ('hill2_atqz', None, None, [None, None, ['aqz', 'hillcc_atqz', 'hillt_atqz']]),
+    ('hill2_aq5z', None, None, [None, None, ['a5z', 'hillcc_aq5z', 'hillt_aq5z']]),
+    ('dadz',       'double-aug-cc-pVDZ'),
+    ('datz',       'double-aug-cc-pVTZ'),
+    ('631pgs',     '6-31+G(d)'),
+    ('6311pg_3df_2p_', '6-311+G(3df,2p)'),
+    ('6311ppg_3df_2p_', '6-311++G(3df,2p)'),
+    ('631gs025',     '6-31G*(0.25)'),
+    ('def2qzvp',   'def2-QZVP'),
+    ('na',         'no applicable basis'),
+)
+bases = Registry(BasisSet, ["name", "fullname", "latex", "build"], _basis_rows)
 
 # Key name must be [A-Z], [0-9], and _, being either all upper or all lowercase according to Essential
 # fullname can be anything on the keyboard, no ascii codes
 # latex can contain escape codes for LaTeX
-_tlist = [
-    Method('SAPT0',           fullname='SAPT0'),
-    Method('SAPT0S',          fullname='sSAPT0', latex=r"""$\textit{s}$SAPT0"""),  #latex="""\\textit{s}SAPT0"""),
-    Method('SAPTSCS',         fullname='SCS-SAPT0'),
-    Method('SAPTDFT',         fullname='DFT-SAPT'),
-    Method('SAPT2',           fullname='SAPT2'),
-    Method('SAPT2P',          fullname='SAPT2+'),
-    Method('SAPT3',           fullname='SAPT2+(3)'),
-    Method('SAPT3F',          fullname='SAPT2+3'),
-    Method('SAPT2PC',         fullname='SAPT2+(CCD)'),
-    Method('SAPT3C',          fullname='SAPT2+(3)(CCD)'),
-    Method('SAPT3FC',         fullname='SAPT2+3(CCD)'),
-    Method('SAPT2PM',         fullname='SAPT2+dMP2', latex="""SAPT2+$\delta$MP2"""),
-    Method('SAPT3M',          fullname='SAPT2+(3)dMP2', latex="""SAPT2+(3)$\delta$MP2"""),
-    Method('SAPT3FM',         fullname='SAPT2+3dMP2', latex="""SAPT2+3$\delta$MP2"""),
-    Method('SAPT2PCM',        fullname='SAPT2+(CCD)dMP2', latex="""SAPT2+(CCD)$\delta$MP2"""),
-    Method('SAPT3CM',         fullname='SAPT2+(3)(CCD)dMP2', latex="""SAPT2+(3)(CCD)$\delta$MP2"""),
-    Method('SAPT3FCM',        fullname='SAPT2+3(CCD)dMP2', latex="""SAPT2+3(CCD)$\delta$MP2"""),
-    Method('SAPT2LCM',        fullname='MP2(CCD)', comment="""Identical to SAPT2+(CCD)dMP2"""),
-    Method('HF',              fullname='HF'),
-    Method('MP2',             fullname='MP2'),
-    Method('SCSMP2',          fullname='SCS-MP2'),
-    Method('SCSNMP2',         fullname='SCS(N)-MP2'),
-    Method('SCSMIMP2',        fullname='SCS(MI)-MP2'),
-    Method('DWMP2',           fullname='DW-MP2'),
-    Method('MP2C',            fullname='MP2C'),
-    Method('MP3',             fullname='MP3'),
-    Method('MP25',            fullname='MP2.5'),
-    Method('CCSD',            fullname='CCSD'),
-    Method('SCSCCSD',         fullname='SCS-CCSD'),
-    Method('SCSMICCSD',       fullname='SCS(MI)-CCSD'),
-    Method('CCSDT',           fullname='CCSD(T)'),
-    Method('HFCABS',          fullname='HF-CABS'),
-    Method('MP2F12',          fullname='MP2-F12'),
-    Method('SCSMP2F12',       fullname='SCS-MP2-F12'),
-    Method('SCSNMP2F12',      fullname='SCS(N)-MP2-F12'),
-    Method('SCSMIMP2F12',     fullname='SCS(MI)-MP2-F12'),
-    Method('DWMP2F12',        fullname='DW-MP2-F12'),
-    Method('MP2CF12',         fullname='MP2C-F12'),
-    Method('CCSDAF12',        fullname='CCSD-F12a'),
-    Method('CCSDBF12',        fullname='CCSD-F12b'),
-    Method('CCSDCF12',        fullname='CCSD-F12c'),
-    Method('SCSCCSDAF12',     fullname='SCS-CCSD-F12a'),
-    Method('SCSCCSDBF12',     fullname='SCS-CCSD-F12b'),
-    Method('SCSCCSDCF12',     fullname='SCS-CCSD-F12c'),
-    Method('SCMICCSDAF12',    fullname='SCS(MI)-CCSD-F12a'),
-    Method('SCMICCSDBF12',    fullname='SCS(MI)-CCSD-F12b'),
-    Method('SCMICCSDCF12',    fullname='SCS(MI)-CCSD-F12c'),
-    Method('CCSDTABAVGF12',   fullname='AVG-CCSD(T**)-F12'),
-    Method('CCSDTAF12',       fullname='CCSD(T**)-F12a'),
-    Method('CCSDTBF12',       fullname='CCSD(T**)-F12b'),
-    Method('CCSDTCF12',       fullname='CCSD(T**)-F12c'),
-    Method('DWCCSDTF12',      fullname='DW-CCSD(T**)-F12'),
+# name, fullname, latex, comment
+_method_rows = (
+    ('SAPT0',           'SAPT0'),
+    ('SAPT0S',          'sSAPT0', r"""$\textit{s}$SAPT0"""),  #latex="""\\textit{s}SAPT0"""),
+    ('SAPTSCS',         'SCS-SAPT0'),
+    ('SAPTDFT',         'DFT-SAPT'),
+    ('SAPT2',           'SAPT2'),
+    ('SAPT2P',          'SAPT2+'),
+    ('SAPT3',           'SAPT2+(3)'),
+    ('SAPT3F',          'SAPT2+3'),
+    ('SAPT2PC',         'SAPT2+(CCD)'),
+    ('SAPT3C',          'SAPT2+(3)(CCD)'),
+    ('SAPT3FC',         'SAPT2+3(CCD)'),
+    ('SAPT2PM',         'SAPT2+dMP2', """SAPT2+$\delta$MP2"""),
+    ('SAPT3M',          'SAPT2+(3)dMP2', """SAPT2+(3)$\delta$MP2"""),
+    ('SAPT3FM',         'SAPT2+3dMP2', """SAPT2+3$\delta$MP2"""),
+    ('SAPT2PCM',        'SAPT2+(CCD)dMP2', """SAPT2+(CCD)$\delta$MP2"""),
+    ('SAPT3CM',         'SAPT2+(3)(CCD)dMP2', """SAPT2+(3)(CCD)$\delta$MP2"""),
+    ('SAPT3FCM',        'SAPT2+3(CCD)dMP2', """SAPT2+3(CCD)$\delta$MP2"""),
+    ('SAPT2LCM',        'MP2(CCD)', None, """Identical to SAPT2+(CCD)dMP2"""),
+    ('HF',              'HF'),
+    ('MP2',             'MP2'),
+    ('SCSMP2',          'SCS-MP2'),
+    ('SCSNMP2',         'SCS(N)-MP2'),
+    ('SCSMIMP2',        'SCS(MI)-MP2'),
+    ('DWMP2',           'DW-MP2'),
+    ('MP2C',            'MP2C'),
+    ('MP3',             'MP3'),
+    ('MP25',            'MP2.5'),
+    ('CCSD',            'CCSD'),
+    ('SCSCCSD',         'SCS-CCSD'),
+    ('SCSMICCSD',       'SCS(MI)-CCSD'),
+    ('CCSDT',           'CCSD(T)'),
+    ('HFCABS',          'HF-CABS'),
+    ('MP2F12',          'MP2-F12'),
+    ('SCSMP2F12',       'SCS-MP2-F12'),
+    ('SCSNMP2F12',      'SCS(N)-MP2-F12'),
+    ('SCSMIMP2F12',     'SCS(MI)-MP2-F12'),
+    ('DWMP2F12',        'DW-MP2-F12'),
+    ('MP2CF12',         'MP2C-F12'),
+    ('CCSDAF12',        'CCSD-F12a'),
+    ('CCSDBF12',        'CCSD-F12b'),
+    ('CCSDCF12',        'CCSD-F12c'),
+    ('SCSCCSDAF12',     'SCS-CCSD-F12a'),
+    ('SCSCCSDBF12',     'SCS-CCSD-F12b'),
+    ('SCSCCSDCF12',     'SCS-CCSD-F12c'),
+    ('SCMICCSDAF12',    'SCS(MI)-CCSD-F12a'),
+    ('SCMICCSDBF12',    'SCS(MI)-CCSD-F12b'),
+    ('SCMICCSDCF12',    'SCS(MI)-CCSD-F12c'),
+    ('CCSDTABAVGF12',   'AVG-CCSD(T**)-F12'),
+    ('CCSDTAF12',       'CCSD(T**)-F12a'),
+    ('CCSDTBF12',       'CCSD(T**)-F12b'),
+    ('CCSDTCF12',       'CCSD(T**)-F12c'),
+    ('DWCCSDTF12',      'DW-CCSD(T**)-F12'),
 #        build=lambda: ['DW-CCSD(T**)-F12 TOTAL ENERGY'],
 #        ['HF-CABS TOTAL ENERGY', 'DW-CCSD(T**)-F12 CORRELATION ENERGY'],
 #        ['HF-CABS TOTAL ENERGY', 'MP2-F12 CORRELATION ENERGY', 'DW-CCSD(T**)-F12 CC CORRECTION ENERGY'],
 #        ['HF-CABS TOTAL ENERGY', 'MP2-F12 CORRELATION ENERGY', 'DW-CCSD-F12 CC CORRECTION ENERGY', 'DW-(T**)-F12 CORRECTION ENERGY'])
-    Method('B97',             fullname='B97'),
-    Method('B97D2',           fullname='B97-D2'),
-    Method('B97D3',           fullname='B97-D3'),
-    Method('B97D3BJ',         fullname='B97-D3(BJ)'),
-    Method('B97D3M',          fullname='B97-D3M'),
-    Method('B97D3MBJ',        fullname='B97-D3M(BJ)'),
-    Method('B3LYP',           fullname='B3LYP'),
-    Method('B3LYPD2',         fullname='B3LYP-D2'),
-    Method('B3LYPD3',         fullname='B3LYP-D3'),
-    Method('B3LYPD3BJ',       fullname='B3LYP-D3(BJ)'),
-    Method('B3LYPXDM',        fullname='B3LYP-XDM'),
-    Method('B3LYPD3M',        fullname='B3LYP-D3M'),
-    Method('B3LYPD3MBJ',      fullname='B3LYP-D3M(BJ)'),
-    Method('B2PLYP',          fullname='B2PLYP'),
-    Method('B2PLYPD2',        fullname='B2PLYP-D2'),
-    Method('B2PLYPD3',        fullname='B2PLYP-D3'),
-    Method('B2PLYPD3BJ',      fullname='B2PLYP-D3(BJ)'),
-    Method('B2PLYPD3M',       fullname='B2PLYP-D3M'),
-    Method('B2PLYPD3MBJ',     fullname='B2PLYP-D3M(BJ)'),
-    Method('M052X',           fullname='M05-2X'),
-    Method('M052XD3',         fullname='M05-2X-D3'),
-    Method('M062X',           fullname='M06-2X'),
-    Method('M062XD3',         fullname='M06-2X-D3'),
-    Method('M08HX',           fullname='M08-HX'),
-    Method('M08SO',           fullname='M08-SO'),
-    Method('M11',             fullname='M11'),
-    Method('M11L',            fullname='M11L'),
-    Method('XYG3',            fullname='XYG3'),
-    Method('DLDFD',           fullname='dlDF+D'),
-    Method('DSDPBEP86',       fullname='DSD-PBEP86'),  # this a real thing?
-    Method('DSDPBEP86D2OPT',  fullname='DSD-PBEP86-D2opt'),  # email version of DSD
-    Method('DSDPBEP86D2',     fullname='DSD-PBEP86-D2'),
-    Method('DSDPBEP86D3',     fullname='DSD-PBEP86-D3'),
-    Method('DSDPBEP86D3BJ',   fullname='DSD-PBEP86-D3(BJ)'),
-    Method('VV10',            fullname='VV10'),
-    Method('LCVV10',          fullname='LC-VV10'),
-    Method('WB97XD',          fullname='wB97X-D', latex="""$\omega$B97X-D"""),
-    Method('WB97X2',          fullname='wB97X-2', latex="""$\omega$B97X-2"""),
-    Method('WB97XV',          fullname='wB97X-V', latex="""$\omega$B97X-V"""),
-    Method('PBE',             fullname='PBE'),
-    Method('PBED2',           fullname='PBE-D2'),
-    Method('PBED3',           fullname='PBE-D3'),
-    Method('PBED3BJ',         fullname='PBE-D3(BJ)'),
-    Method('PBED3M',          fullname='PBE-D3M'),
-    Method('PBED3MBJ',        fullname='PBE-D3M(BJ)'),
-    Method('PBE0',            fullname='PBE0'),
-    Method('PBE0D2',          fullname='PBE0-D2'),
-    Method('PBE0D3',          fullname='PBE0-D3'),
-    Method('PBE0D3BJ',        fullname='PBE0-D3(BJ)'),
-    Method('PBE0D3M',         fullname='PBE0-D3M'),
-    Method('PBE0D3MBJ',       fullname='PBE0-D3M(BJ)'),
-    Method('PBE02',           fullname='PBE0-2'),
-    Method('WPBE',            fullname='wPBE', latex="""$\omega$PBE"""),
-    Method('WPBED3',          fullname='wPBE-D3', latex="""$\omega$PBE-D3"""),
-    Method('WPBED3BJ',        fullname='wPBE-D3(BJ)', latex="""$\omega$PBE-D3(BJ)"""),
-    Method('WPBED3M',         fullname='wPBE-D3M', latex="""$\omega$PBE-D3M"""),
-    Method('WPBED3MBJ',       fullname='wPBE-D3M(BJ)', latex="""$\omega$PBE-D3M(BJ)"""),
-    Method('CCSDTNSAF12',     fullname='CCSD(T)-F12a'),
-    Method('CCSDTNSBF12',     fullname='CCSD(T)-F12b'),
-    Method('CCSDTNSCF12',     fullname='CCSD(T)-F12c'),
-    Method('B970',            fullname='B970'),
-    Method('B970D2',          fullname='B970-D2'),
-    Method('BP86',            fullname='BP86'),
-    Method('BP86D2',          fullname='BP86-D2'),
-    Method('BP86D3',          fullname='BP86-D3'),
-    Method('BP86D3BJ',        fullname='BP86-D3(BJ)'),
-    Method('BP86D3M',         fullname='BP86-D3M'),
-    Method('BP86D3MBJ',       fullname='BP86-D3M(BJ)'),
-    Method('BLYP',            fullname='BLYP'),
-    Method('BLYPD2',          fullname='BLYP-D2'),
-    Method('BLYPD3',          fullname='BLYP-D3'),
-    Method('BLYPD3BJ',        fullname='BLYP-D3(BJ)'),
-    Method('BLYPD3M',         fullname='BLYP-D3M'),
-    Method('BLYPD3MBJ',       fullname='BLYP-D3M(BJ)'),
-    Method('CCSDTQ',          fullname='CCSDT(Q)'),
-    Method('CCSDFULLT',       fullname='CCSDT'),
-    Method('CCSDTSAF12',      fullname='CCSD(T*)-F12a'),
-    Method('CCSDTSBF12',      fullname='CCSD(T*)-F12b'),
-    Method('CCSDTSCF12',      fullname='CCSD(T*)-F12c'),
-    Method('DWCCSDTNSF12',    fullname='DW-CCSD(T)-F12'),
-    Method('DWCCSDTSF12',     fullname='DW-CCSD(T*)-F12'),
-    Method('DELTQ',           fullname='d(TQ)', latex="""$\delta$(TQ)"""),  # TODO kill this once non-IE impl in reap-DB
-    Method('DEL2T',           fullname='d(T)', latex="""$\delta$(T)"""),  # TODO kill this once non-IE impl in reap-DB
-    Method('AM1',             fullname='AM1'),
-    Method('GAFF',            fullname='GAFF'),
-    Method('PM6DH2',          fullname='PM6-DH2'),
-    Method('CHARMM',          fullname='CHARMM'),
-    Method('PM3',             fullname='PM3'),
-    Method('PM6',             fullname='PM6'),
-    Method('PDDG',            fullname='PDDG'),
-    Method('FF03',            fullname='FF03'),
-    Method('FF03A',           fullname='FF03A'),
-    Method('FF99SB',          fullname='FF99SB'),
-    Method('FF99SBA',         fullname='FF99SBA'),
-    Method('AM1FS1',          fullname='AM1FS1'),
-    Method('EFP',             fullname='EFP'),
-    ]
-
-methods = {}
-for item in _tlist:
-    methods[item.name] = item
-
-_tlist = [
-    Error('pexe',            fullname='pexE'),
-    Error('nexe',            fullname='nexE'),
-    Error('maxe',            fullname='maxE'),
-    Error('mine',            fullname='minE'),
-    Error('me',              fullname='ME'),
-    Error('mae',             fullname='MAE'),
-    Error('rmse',            fullname='rmsE'),
-    Error('stde',            fullname='stdE'),
-    Error('pexpe',           fullname='pexPE'),
-    Error('nexpe',           fullname='nexPE'),
-    Error('maxpe',           fullname='maxPE'),
-    Error('minpe',           fullname='minPE'),
-    Error('mpe',             fullname='MPE'),
-    Error('mape',            fullname='MAPE', latex=r"""MA$\%$E"""),  #latex="""MA\%E"""),
-    Error('rmspe',           fullname='rmsPE'),
-    Error('stdpe',           fullname='stdPE'),
-    Error('pexpbe',          fullname='pexPBE'),
-    Error('nexpbe',          fullname='nexPBE'),
-    Error('maxpbe',          fullname='maxPBE'),
-    Error('minpbe',          fullname='minPBE'),
-    Error('mpbe',            fullname='MPBE'),
-    Error('mapbe',           fullname='MAPBE', latex=r"""MA$\%$BE"""),  #latex="""MA\%BE"""),
-    Error('rmspbe',          fullname='rmsPBE'),
-    Error('stdpbe',          fullname='stdPBE'),
-]
-errors = {}
-for item in _tlist:
-    errors[item.name] = item
+    ('B97',             'B97'),
+    ('B97D2',           'B97-D2'),
+    ('B97D3',           'B97-D3'),
+    ('B97D3BJ',         'B97-D3(BJ)'),
+    ('B97D3M',          'B97-D3M'),
+    ('B97D3MBJ',        'B97-D3M(BJ)'),
+    ('B3LYP',           'B3LYP'),
+    ('B3LYPD2',         'B3LYP-D2'),
+    ('B3LYPD3',         'B3LYP-D3'),
+    ('B3LYPD3BJ',       'B3LYP-D3(BJ)'),
+    ('B3LYPXDM',        'B3LYP-XDM'),
+    ('B3LYPD3M',        'B3LYP-D3M'),
+    ('B3LYPD3MBJ',      'B3LYP-D3M(BJ)'),
+    ('B2PLYP',          'B2PLYP'),
+    ('B2PLYPD2',        'B2PLYP-D2'),
+    ('B2PLYPD3',        'B2PLYP-D3'),
+    ('B2PLYPD3BJ',      'B2PLYP-D3(BJ)'),
+    ('B2PLYPD3M',       'B2PLYP-D3M'),
+    ('B2PLYPD3MBJ',     'B2PLYP-D3M(BJ)'),
+    ('M052X',           'M05-2X'),
+    ('M052XD3',         'M05-2X-D3'),
+    ('M062X',           'M06-2X'),
+    ('M062XD3',         'M06-2X-D3'),
+    ('M08HX',           'M08-HX'),
+    ('M08SO',           'M08-SO'),
+    ('M11',             'M11'),
+    ('M11L',            'M11L'),
+    ('XYG3',            'XYG3'),
+    ('DLDFD',           'dlDF+D'),
+    ('DSDPBEP86',       'DSD-PBEP86'),  # this a real thing?
+    ('DSDPBEP86D2OPT',  'DSD-PBEP86-D2opt'),  # email version of DSD
+    ('DSDPBEP86D2',     'DSD-PBEP86-D2'),
+    ('DSDPBEP86D3',     'DSD-PBEP86-D3'),
+    ('DSDPBEP86D3BJ',   'DSD-PBEP86-D3(BJ)'),
+    ('VV10',            'VV10'),
+    ('LCVV10',          'LC-VV10'),
+    ('WB97XD',          'wB97X-D', """$\omega$B97X-D"""),
+    ('WB97X2',          'wB97X-2', """$\omega$B97X-2"""),
+    ('WB97XV',          'wB97X-V', """$\omega$B97X-V"""),
+    ('PBE',             'PBE'),
+    ('PBED2',           'PBE-D2'),
+    ('PBED3',           'PBE-D3'),
+    ('PBED3BJ',         'PBE-D3(BJ)'),
+    ('PBED3M',          'PBE-D3M'),
+    ('PBED3MBJ',        'PBE-D3M(BJ)'),
+    ('PBE0',            'PBE0'),
+    ('PBE0D2',          'PBE0-D2'),
+    ('PBE0D3',          'PBE0-D3'),
+    ('PBE0D3BJ',        'PBE0-D3(BJ)'),
+    ('PBE0D3M',         'PBE0-D3M'),
+    ('PBE0D3MBJ',       'PBE0-D3M(BJ)'),
+    ('PBE02',           'PBE0-2'),
+    ('WPBE',            'wPBE', """$\omega$PBE"""),
+    ('WPBED3',          'wPBE-D3', """$\omega$PBE-D3"""),
+    ('WPBED3BJ',        'wPBE-D3(BJ)', """$\omega$PBE-D3(BJ)"""),
+    ('WPBED3M',         'wPBE-D3M', """$\omega$PBE-D3M"""),
+    ('WPBED3MBJ',       'wPBE-D3M(BJ)', """$\omega$PBE-D3M(BJ)"""),
+    ('CCSDTNSAF12',     'CCSD(T)-F12a'),
+    ('CCSDTNSBF12',     'CCSD(T)-F12b'),
+    ('CCSDTNSCF12',     'CCSD(T)-F12c'),
+    ('B970',            'B970'),
+    ('B970D2',          'B970-D2'),
+    ('BP86',            'BP86'),
+    ('BP86D2',          'BP86-D2'),
+    ('BP86D3',          'BP86-D3'),
+    ('BP86D3BJ',        'BP86-D3(BJ)'),
+    ('BP86D3M',         'BP86-D3M'),
+    ('BP86D3MBJ',       'BP86-D3M(BJ)'),
+    ('BLYP',            'BLYP'),
+    ('BLYPD2',          'BLYP-D2'),
+    ('BLYPD3',          'BLYP-D3'),
+    ('BLYPD3BJ',        'BLYP-D3(BJ)'),
+    ('BLYPD3M',         'BLYP-D3M'),
+    ('BLYPD3MBJ',       'BLYP-D3M(BJ)'),
+    ('CCSDTQ',          'CCSDT(Q)'),
+    ('CCSDFULLT',       'CCSDT'),
+    ('CCSDTSAF12',      'CCSD(T*)-F12a'),
+    ('CCSDTSBF12',      'CCSD(T*)-F12b'),
+    ('CCSDTSCF12',      'CCSD(T*)-F12c'),
+    ('DWCCSDTNSF12',    'DW-CCSD(T)-F12'),
+    ('DWCCSDTSF12',     'DW-CCSD(T*)-F12'),
+    ('DELTQ',           'd(TQ)', """$\delta$(TQ)"""),  # TODO kill this once non-IE impl in reap-DB
+    ('DEL2T',           'd(T)', """$\delta$(T)"""),  # TODO kill this once non-IE impl in reap-DB
+    ('AM1',             'AM1'),
+    ('GAFF',            'GAFF'),
+    ('PM6DH2',          'PM6-DH2'),
+    ('CHARMM',          'CHARMM'),
+    ('PM3',             'PM3'),
+    ('PM6',             'PM6'),
+    ('PDDG',            'PDDG'),
+    ('FF03',            'FF03'),
+    ('FF03A',           'FF03A'),
+    ('FF99SB',          'FF99SB'),
+    ('FF99SBA',         'FF99SBA'),
+    ('AM1FS1',          'AM1FS1'),
+    ('EFP',             'EFP'),
+)
+methods = Registry(Method, ["name", "fullname", "latex", "comment"], _method_rows)
+
+# name, fullname, latex
+_error_rows = (
+    ('pexe',            'pexE'),
+    ('nexe',            'nexE'),
+    ('maxe',            'maxE'),
+    ('mine',            'minE'),
+    ('me',              'ME'),
+    ('mae',             'MAE'),
+    ('rmse',            'rmsE'),
+    ('stde',            'stdE'),
+    ('pexpe',           'pexPE'),
+    ('nexpe',           'nexPE'),
+    ('maxpe',           'maxPE'),
+    ('minpe',           'minPE'),
+    ('mpe',             'MPE'),
+    ('mape',            'MAPE', r"""MA$\%$E"""),  #latex="""MA\%E"""),
+    ('rmspe',           'rmsPE'),
+    ('stdpe',           'stdPE'),
+    ('pexpbe',          'pexPBE'),
+    ('nexpbe',          'nexPBE'),
+    ('maxpbe',          'maxPBE'),
+    ('minpbe',          'minPBE'),
+    ('mpbe',            'MPBE'),
+    ('mapbe',           'MAPBE', r"""MA$\%$BE"""),  #latex="""MA\%BE"""),
+    ('rmspbe',          'rmsPBE'),
+    ('stdpbe',          'stdPBE'),
+)
+errors = Registry(Error, ["name", "fullname", "latex"], _error_rows)
 
 #_tlist = [
 #    Option('CP',             fullname='CP'),
 #    Option('unCP',           fullname='unCP'),
 #]
 #options = {item.name: item for item in _tlist}
+
+
+if __name__ == "__main__":
+    # benchmark per-object memory and registry construction against
+    #   plain __dict__ classes built as the constructors used to
+    import timeit
+    import tracemalloc
+
+    class PlainCitation(object):
+        def __init__(self, doi, fullname=None, dsdbid=None, comment=None):
+            self.doi = doi.lower()
+            self.fullname = fullname
+            self.dsdbid = dsdbid
+            self.comment = comment
+
+    class PlainQCEssential(object):
+        def __init__(self, name, fullname=None, latex=None, citations=None, doi=None, comment=None):
+            self.name = name.lower()
+            self.fullname = fullname
+            self.latex = fullname if (fullname is not None and latex is None) else latex
+            self.citations = collections.OrderedDict() if citations is None else citations
+            self.doi = doi
+            self.comment = comment
+
+    class PlainPublication(PlainQCEssential):
+        def __init__(self, name, fullname=None, latex=None, dsdbid=None, doi=None, comment=None, owner=None):
+            primary = PlainCitation(doi=doi, fullname=fullname, dsdbid=dsdbid)
+            cits = collections.OrderedDict()
+            cits['primary'] = primary
+            PlainQCEssential.__init__(self, name, primary.fullname, latex, cits, primary.doi, comment)
+            self.owner = owner.upper()
+
+    class PlainBasisSet(PlainQCEssential):
+        def __init__(self, name, fullname=None, latex=None, citations=None, doi=None, comment=None, zeta=None, build=None):
+            PlainQCEssential.__init__(self, name, fullname, latex, citations, doi, comment)
+            self.zeta = zeta
+            self.build = [[self.name]] if build is None else build
+
+    class PlainMethod(PlainQCEssential):
+        def __init__(self, name, fullname=None, latex=None, citations=None, doi=None, comment=None):
+            PlainQCEssential.__init__(self, name, fullname, latex, citations, doi, comment)
+            self.name = name.upper()
+
+    plain = {Publication: PlainPublication, BasisSet: PlainBasisSet, Method: PlainMethod, Error: PlainQCEssential}
+
+    def build(classes):
+        regs = [Registry(classes.get(reg.cls, reg.cls), reg.fields, reg.rows) for reg in (methods, bases, errors, pubs)]
+        for reg in regs:
+            reg.store
+        return regs
+
+    ntimes = 200
+    for label, classes in (("plain", plain), ("slotted", {})):
+        elapsed = timeit.timeit(lambda: build(classes), number=ntimes)
+        tracemalloc.start()
+        regs = build(classes)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        nobj = sum(len(reg) for reg in regs)
+        print("""%-8s construct: %.3f ms per registry set, memory: %d objects, %.0f bytes per object"""
+              % (label, elapsed / ntimes * 1.e3, nobj, current / nobj))
@@ -0,0 +1,314 @@
+"""Module with export routines for the plotly figures built in
+:py:mod:`cdsg_plot.thread` and :py:mod:`cdsg_plot.ternary`. Numeric arrays
+are stored as base64 typed arrays rather than JSON text, so pages with
+many thousands of points stay small and quick to load.
+
+"""
+import json
+import base64
+import hashlib
+
+from cdsg_plot.qcdb_plot import check_sink, expand_saveas, save_output
+
+# numeric arrays shorter than this stay plain JSON lists
+_min_encode = 8
+
+_html_template = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"/></head>
+<body>
+<div id="{divid}" style="height:100%; width:100%;"></div>
+{plotlyjs}
+<script type="text/javascript">
+(function() {{
+    var payload = {payload};
+    var shared = payload.shared.map(function(spec) {{
+        var bytes = Uint8Array.from(atob(spec.bdata), function(c) {{ return c.charCodeAt(0); }});
+        var flat = spec.dtype === "f4" ? new Float32Array(bytes.buffer) : new Float64Array(bytes.buffer);
+        if (!spec.shape) {{
+            return flat;
+        }}
+        var ncol = parseInt(String(spec.shape).split(",")[1]);
+        var rows = [];
+        for (var start = 0; start < flat.length; start += ncol) {{
+            rows.push(flat.subarray(start, start + ncol));
+        }}
+        return rows;
+    }});
+    function resolve(obj) {{
+        if (Array.isArray(obj)) {{
+            return obj.map(resolve);
+        }} else if (obj !== null && typeof obj === "object") {{
+            if ("_shared" in obj) {{
+                return shared[obj._shared];
+            }}
+            for (var key in obj) {{
+                obj[key] = resolve(obj[key]);
+            }}
+        }}
+        return obj;
+    }}
+    var fig = resolve(payload.figure);
+    Plotly.newPlot("{divid}", fig.data, fig.layout, {{responsive: true}});
+}})();
+</script>
+</body>
+</html>
+"""
+
+
+def encode_array(values, float32=True):
+    """Return typed-array spec ``{'dtype': ..., 'bdata': ...}`` for numeric
+    sequence *values*, with None taken as NaN (a gap in plotly lines), or
+    None if *values* isn't numeric. A rectangular 2D *values* (e.g., heatmap
+    z) is stored flat with its ``'shape'`` as ``'rows, cols'``, the form
+    plotly itself writes. Single precision is used when *float32* and the
+    values survive the round trip exactly or to within a hundredth of the
+    smallest gap between distinct values, so no two of them merge.
+
+    """
+    import numpy as np
+
+    if isinstance(values, (str, bytes, dict)):
+        return None
+    try:
+        arr = np.array(values, dtype=object)
+    except (TypeError, ValueError):
+        return None
+    if arr.ndim not in (1, 2) or arr.size < _min_encode:
+        return None
+    shape = arr.shape
+    arr = arr.ravel()
+    if not all(v is None or (isinstance(v, (int, float, np.number)) and not isinstance(v, bool)) for v in arr):
+        return None
+
+    arr = np.array([np.nan if v is None else v for v in arr], dtype="f8")
+    dtype = "f8"
+    if float32:
+        finite = np.unique(arr[np.isfinite(arr)])
+        error = np.abs(finite.astype("f4") - finite).max(initial=0.0)
+        gap = np.diff(finite).min(initial=np.inf)
+        if error == 0.0 or 100.0 * error <= gap:
+            dtype = "f4"
+    spec = {"dtype": dtype, "bdata": base64.b64encode(arr.astype(dtype).tobytes()).decode("ascii")}
+    if len(shape) == 2:
+        spec["shape"] = "%d, %d" % shape
+    return spec
+
+
+def compact_figure(fig, float32=True, dedupe=True):
+    """Return dictionary with keys ``figure`` (plotly JSON of *fig* with
+    numeric trace arrays as typed-array specs) and ``shared`` (specs of any
+    arrays repeated across traces, like the tier positions of every thread,
+    which ``figure`` then refers to as ``{'_shared': index}``).
+
+    """
+    import collections
+
+    figure = json.loads(fig.to_json())
+
+    # encode numeric lists in place, noting where each encoding lands
+    placed = collections.OrderedDict()
+
+    def walk(obj):
+        for key, val in obj.items():
+            if isinstance(val, dict):
+                walk(val)
+            elif isinstance(val, list):
+                spec = encode_array(val, float32=float32)
+                if spec is not None:
+                    obj[key] = spec
+                    placed.setdefault(spec["dtype"] + spec["bdata"], []).append((obj, key))
+
+    for trace in figure.get("data", []):
+        walk(trace)
+
+    shared = []
+    if dedupe:
+        for spots in placed.values():
+            if len(spots) > 1:
+                shared.append(spots[0][0][spots[0][1]])
+                for obj, key in spots:
+                    obj[key] = {"_shared": len(shared) - 1}
+
+    return {"figure": figure, "shared": shared}
+
+
+def write_compact(fig, saveas=None, relpath=False, exportformat=['html'], title='figure',
+    compress=False, float32=True, dedupe=True, include_plotlyjs=True, sink=None):
+    """Saves plotly *fig* with numeric arrays binary-encoded per
+    :py:func:`compact_figure` in formats *exportformat* ('html' page or
+    'json' payload) at location per *saveas* and *relpath*, defaulting
+    to a name from *title*. When *compress*, the 'json' payload is gzipped
+    and gains a '.gz' extension; 'html' pages are never compressed so that
+    browsers open them offline. *include_plotlyjs* True embeds plotly.js so the page
+    works offline, 'cdn' links to it instead. Returns dictionary of saved
+    files keyed by format, or with *sink* of their bytes, kept in memory
+    per :py:func:`cdsg_plot.qcdb_plot.save_output`.
+
+    """
+    import gzip
+
+    payload = json.dumps(compact_figure(fig, float32=float32, dedupe=dedupe), separators=(',', ':'))
+    pltuid = title + '_' + hashlib.sha1(payload.encode()).hexdigest()
+    pltfile = expand_saveas(saveas, pltuid, def_prefix="plotly_", relpath=relpath)
+
+    check_sink(sink, len(exportformat))
+    files_saved = {}
+    for ext in exportformat:
+        ext = ext.lower()
+        if ext == 'json':
+            text = payload
+        elif ext == 'html':
+            if include_plotlyjs == 'cdn':
+                from plotly.offline import get_plotlyjs_version
+                plotlyjs = '<script src="https://cdn.plot.ly/plotly-%s.min.js" charset="utf-8"></script>' % (get_plotlyjs_version())
+            elif include_plotlyjs:
+                from plotly.offline import get_plotlyjs
+                plotlyjs = '<script type="text/javascript">%s</script>' % (get_plotlyjs())
+            else:
+                plotlyjs = ''
+            # keep a "</script>" inside any label from closing the script block
+            text = _html_template.format(divid=pltuid.replace(' ', '_'), plotlyjs=plotlyjs, payload=payload.replace('</', '<\\/'))
+        else:
+            raise ValueError("""Unknown export format '%s'; use 'html' or 'json'.""" % (ext))
+
+        savefile = pltfile + '.' + ext
+        if compress and ext == 'json':
+            savefile += '.gz'
+            data = gzip.compress(text.encode('utf-8'))
+        else:
+            data = text.encode('utf-8')
+
+        def write(target):
+            if isinstance(target, str):
+                with open(target, 'wb') as handle:
+                    handle.write(data)
+            else:
+                target.write(data)
+
+        files_saved[ext] = save_output(sink, savefile, ext, write)
+    return files_saved
+
+
+class ImageExporter(object):
+    """Static-image (png, pdf, svg, ...) export of many plotly figures
+    through one kaleido renderer. Inside a ``with`` block the renderer
+    process is started once and kept alive until exit; figures queued by
+    :py:meth:`save` are written together every *batchsize* files and on
+    :py:meth:`flush` or exit. Requires plotly >= 6.1 and kaleido >= 1.0.
+
+    >>> with ImageExporter() as exporter:
+    ...     for fig, uid in figures:
+    ...         files_saved = exporter.save(fig, uid, saveas='plots/', graphicsformat=['pdf', 'png'])
+
+    """
+
+    def __init__(self, batchsize=50, scale=None):
+        self.batchsize = batchsize
+        self.scale = scale
+        self.persistent = False
+        self._queue = []
+
+    def __enter__(self):
+        import kaleido
+
+        kaleido.start_sync_server()
+        self.persistent = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        import kaleido
+
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            self._queue = []
+            self.persistent = False
+            kaleido.stop_sync_server()
+
+    def save(self, fig, pltuid, saveas=None, relpath=False, graphicsformat=['pdf'], def_prefix="plotly_", sink=None):
+        """Queues plotly *fig* for writing in formats *graphicsformat* at
+        location per *saveas* and *relpath*, named from *def_prefix* and
+        *pltuid* by default, as for the matplotlib routines. Returns
+        dictionary of files to be saved keyed by format; they're on disk
+        once the batch is flushed. With *sink*, each format is instead
+        rendered right away through :py:meth:`render` and its bytes handled
+        per :py:func:`cdsg_plot.qcdb_plot.save_output`.
+
+        """
+        files_saved = {}
+        if sink is not None:
+            check_sink(sink, len(graphicsformat))
+            for ext in graphicsformat:
+                files_saved[ext.lower()] = save_output(sink, None, ext.lower(),
+                                                       lambda target: target.write(self.render(fig, ext.lower())))
+            return files_saved
+
+        pltfile = expand_saveas(saveas, pltuid, def_prefix=def_prefix, relpath=relpath)
+        for ext in graphicsformat:
+            savefile = pltfile + '.' + ext.lower()
+            self._queue.append((fig, savefile, ext.lower()))
+            files_saved[ext.lower()] = savefile
+
+        if len(self._queue) >= self.batchsize:
+            self.flush()
+        return files_saved
+
+    def render(self, fig, ext):
+        """Returns bytes of plotly *fig* rendered in format *ext*."""
+        import plotly.io as pio
+
+        return pio.to_image(fig, format=ext, scale=self.scale)
+
+    def flush(self):
+        """Writes all queued figures in one pass through the renderer."""
+        import plotly.io as pio
+
+        if not self._queue:
+            return
+        figs, files, formats = zip(*self._queue)
+        self._queue = []
+        pio.write_images(list(figs), list(files), format=list(formats), scale=self.scale)
+
+
+def read_compact(filename):
+    """Returns plotly figure from 'json' file (gzipped if ending '.gz')
+    written by :py:func:`write_compact`, with typed arrays decoded to numpy.
+
+    """
+    import gzip
+    import numpy as np
+    import plotly.graph_objects as go
+
+    opener = gzip.open if filename.endswith('.gz') else open
+    with opener(filename, 'rt', encoding='utf-8') as handle:
+        payload = json.load(handle)
+
+    def resolve(obj):
+        if isinstance(obj, list):
+            return [resolve(v) for v in obj]
+        elif isinstance(obj, dict):
+            if "_shared" in obj:
+                obj = payload["shared"][obj["_shared"]]
+            if "bdata" in obj:
+                arr = np.frombuffer(base64.b64decode(obj["bdata"]), dtype=obj["dtype"])
+                if "shape" in obj:
+                    shape = obj["shape"]
+                    arr = arr.reshape([int(dim) for dim in shape.split(",")] if isinstance(shape, str) else shape)
+                return arr
+            return {key: resolve(val) for key, val in obj.items()}
+        return obj
+
+    return go.Figure(resolve(payload["figure"]))
+
+
+if __name__ == "__main__":
+    import random
+    from cdsg_plot.thread import plotly_threads
+
+    random.seed(0)
+    dats = [{'db': 'BFDB', 'sys': str(i), 'data': [random.gauss(0., 1.) for weft in range(5)]} for i in range(2000)]
+    fig = plotly_threads(dats, labels=["d", "t", "dt", "q", "tq"], title="compact", view=False, webgl=True)
+    print(write_compact(fig, exportformat=['html', 'json'], title='compact', compress=True))
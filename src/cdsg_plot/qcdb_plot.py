@@ -32,6 +32,7 @@ arguments.
 
 """
 import os
+import json
 
 # import matplotlib
 # matplotlib.use('Agg')
@@ -70,13 +71,389 @@ def expand_saveas(
         return abspathfile
 
 
+def save_output(sink, savefile, ext, write):
+    """Writes one output of format *ext* by calling *write* with its
+    target, which may be a file name or a binary file object. If *sink* is
+    None, the target is *savefile* and that name is returned. Otherwise
+    the target is an in-memory buffer, nothing touches disk, and its bytes
+    are returned after being handed to *sink*: called as ``sink(ext,
+    data)`` if callable, written to it if file-like (so one output per
+    sink; see :py:func:`check_sink`), else (e.g., True) only returned.
+
+    """
+    import io
+
+    if sink is None:
+        write(savefile)
+        return savefile
+
+    buf = io.BytesIO()
+    write(buf)
+    data = buf.getvalue()
+    if callable(sink):
+        sink(ext, data)
+    elif hasattr(sink, "write"):
+        sink.write(data)
+    return data
+
+
+def check_sink(sink, noutputs):
+    """Raises ValueError if *sink* is file-like but would be handed
+    *noutputs* > 1 outputs, which it could only hold run together. Called
+    by entry points before writing any; several outputs need a callable
+    sink.
+
+    """
+    if noutputs > 1 and sink is not None and not callable(sink) and hasattr(sink, "write"):
+        raise ValueError(
+            """File-like sink takes one output, not %d. Pass one format or a callable sink(ext, data)."""
+            % (noutputs)
+        )
+
+
+def _write_text(target, text):
+    """Writes *text* to file name or binary file object *target* as UTF-8."""
+    if isinstance(target, str):
+        with open(target, "w", encoding="utf-8") as fp:
+            fp.write(text)
+    else:
+        target.write(text.encode("utf-8"))
+
+
+# data layers with more points, or more artists, than these are rasterized in vector output by default
+raster_threshold = 100000
+raster_artists = 5000
+
+_vector_formats = ("pdf", "svg", "eps", "ps")
+_raster_formats = ("png", "jpg", "jpeg", "tif", "tiff", "webp")
+
+# decorated figures kept open between calls, by plot kind and the arguments
+#   that fix their decorations; see _backdrop
+_backdrops = {}
+
+
+def _artist_points(artist):
+    """Returns number of points or patches drawn by matplotlib *artist*."""
+    if hasattr(artist, "get_xdata"):
+        return len(artist.get_xdata())
+    if hasattr(artist, "get_offsets") and len(artist.get_offsets()) > 1:
+        return len(artist.get_offsets())
+    if hasattr(artist, "get_paths"):
+        return len(artist.get_paths())
+    return 1
+
+
+def save_layered(pltfile, graphicsformat, layers, rasterize=None, rasterdpi=300, merge=False, sink=None, **kwargs):
+    """Saves the current figure as *pltfile* in formats *graphicsformat*
+    with further ``plt.savefig`` arguments *kwargs* and returns dictionary
+    of files saved. Artists *layers* (the data, not axes, labels or guide
+    lines) are drawn as a bitmap of *rasterdpi* within vector formats if
+    *rasterize* is True, or if None and they hold more than
+    *raster_threshold* points or *raster_artists* artists. If *rasterize*
+    is 'report', layers are rasterized, a vector rendering is also made in
+    memory, and key ``raster`` of the dictionary (otherwise absent, so its
+    values stay file names) holds ``points``, ``dpi`` and, per vector
+    format, file ``bytes`` and write ``seconds`` against the vector
+    rendering's ``vector_bytes`` and ``vector_seconds``. If *merge*, *layers* are known
+    to lie beneath every other artist of their axes, so instead of one
+    bitmap apiece they're lowered under the axes rasterization zorder and
+    share one bitmap per axes. With *sink*, outputs are bytes kept in
+    memory per :py:func:`save_output`.
+
+    """
+    import io
+    import time
+    import matplotlib.pyplot as plt
+
+    npoints = sum(_artist_points(art) for art in layers)
+    if rasterize is None:
+        rasterize = npoints > raster_threshold or len(layers) > raster_artists
+    raster = {"points": npoints, "dpi": rasterdpi} if rasterize else None
+
+    check_sink(sink, len(graphicsformat))
+    files_saved = {}
+    for ext in graphicsformat:
+        savefile = pltfile + "." + ext.lower()
+        vector = bool(rasterize) and ext.lower() in _vector_formats
+        _rasterize_layers(layers, vector, merge)
+        start = time.perf_counter()
+        saved = save_output(
+            sink,
+            savefile,
+            ext.lower(),
+            lambda target: plt.savefig(target, format=ext, **(dict(kwargs, dpi=rasterdpi) if vector else kwargs)),
+        )
+        if vector:
+            raster[ext.lower()] = {
+                "bytes": os.path.getsize(savefile) if sink is None else len(saved),
+                "seconds": time.perf_counter() - start,
+            }
+            if rasterize == "report":
+                _rasterize_layers(layers, False, merge)
+                buf = io.BytesIO()
+                start = time.perf_counter()
+                plt.savefig(buf, format=ext, **kwargs)
+                raster[ext.lower()]["vector_seconds"] = time.perf_counter() - start
+                raster[ext.lower()]["vector_bytes"] = len(buf.getvalue())
+        files_saved[ext.lower()] = saved
+    _rasterize_layers(layers, False, merge)
+
+    if rasterize == "report":
+        files_saved["raster"] = raster
+    return files_saved
+
+
+def _backdrop(key, build, dpi):
+    """Returns cache entry dictionary with ``fig``, ``ax`` and ``background``
+    (pixels, once rendered) for the figure *build* returns decorated, as
+    ``(fig, ax)``, for *key*. Built on first call (or after being closed)
+    with transparent patches at *dpi*, then kept open and made current.
+
+    """
+    import matplotlib.pyplot as plt
+
+    entry = _backdrops.get(key)
+    if entry is None or not plt.fignum_exists(entry["fig"].number):
+        fig, ax = build()
+        fig.set_dpi(dpi)
+        fig.patch.set_facecolor("none")
+        ax.patch.set_facecolor("none")
+        entry = _backdrops[key] = {"fig": fig, "ax": ax, "background": None}
+    plt.figure(entry["fig"].number)
+    return entry
+
+
+def save_blitted(entry, pltfile, graphicsformat, layers, data, sink=None, **kwargs):
+    """Saves the figure of :py:func:`_backdrop` cache *entry*, which holds
+    artists *data* (including *layers*) atop its decorations, and returns
+    dictionary of files saved. Vector formats go through
+    :py:func:`save_layered` with *layers* and *kwargs*; raster formats
+    trim the figure to its ``bbox_inches="tight"`` box as savefig does,
+    restore the decoration pixels, rendered on first use (and again if
+    the box moves), and draw only *data* onto them. The
+    *data* artists are removed afterwards, readying the figure for reuse.
+    With *sink*, outputs are bytes kept in memory per :py:func:`save_output`.
+
+    """
+    import numpy as np
+    import matplotlib.pyplot as plt
+
+    fig = entry["fig"]
+    canvas = fig.canvas
+    blit = [ext for ext in graphicsformat if ext.lower() in _raster_formats and hasattr(canvas, "copy_from_bbox")]
+    others = [ext for ext in graphicsformat if ext not in blit]
+
+    check_sink(sink, len(graphicsformat))
+    files_saved = {}
+    if blit:
+        try:
+            from matplotlib._tight_bbox import adjust_bbox
+        except ImportError:  # matplotlib < 3.6
+            from matplotlib.tight_bbox import adjust_bbox
+
+        # trim the figure to its tight box just as savefig(bbox_inches="tight")
+        #   does, so the canvas has the same size and sub-pixel offset as the
+        #   savefig output; decorations are re-rendered only if the box moves
+        renderer = canvas.get_renderer()
+        bbox = fig.get_tightbbox(renderer).padded(kwargs.get("pad_inches", 0.1))
+        restore = adjust_bbox(fig, bbox, renderer)
+        if entry["background"] is None or entry.get("bbox") != bbox.bounds:
+            for art in data:
+                art.set_visible(False)
+            canvas.draw()
+            entry["background"] = canvas.copy_from_bbox(fig.bbox)
+            entry["bbox"] = bbox.bounds
+            for art in data:
+                art.set_visible(True)
+        canvas.restore_region(entry["background"])
+        for art in data:
+            art.axes.draw_artist(art)
+        pixels = np.asarray(canvas.buffer_rgba()).copy()
+        restore()
+        for ext in blit:
+            savefile = pltfile + "." + ext.lower()
+            files_saved[ext.lower()] = save_output(
+                sink, savefile, ext.lower(), lambda target: plt.imsave(target, pixels, format=ext.lower(), dpi=fig.dpi)
+            )
+    if others:
+        files_saved.update(save_layered(pltfile, others, layers, sink=sink, **kwargs))
+
+    for art in data:
+        art.remove()
+    return files_saved
+
+
+class FigureBundle(object):
+    """Multi-page PDF *filename* collecting many small figures, such as
+    the flat and liliowa ones embedded in a table, in place of one file
+    apiece. Pass as *bundle* to :py:func:`flat` or :py:func:`liliowa`.
+    On :py:meth:`close` (or leaving a ``with`` block), a manifest of
+    figure name to page number is written alongside as JSON for
+    :py:func:`cdsg_plot.textables.read_bundle`.
+
+    """
+
+    def __init__(self, filename):
+        import collections
+
+        self.filename = filename if filename.endswith(".pdf") else filename + ".pdf"
+        self.manifest = collections.OrderedDict()
+        self._pages = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add(self, name, **kwargs):
+        """Appends the current figure as a page named *name*, saved with
+        further ``savefig`` arguments *kwargs*. Returns page number,
+        counting from 1. A repeated *name* points at its latest page.
+
+        """
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_pdf import PdfPages
+
+        if self._pages is None:
+            if not os.path.isdir(os.path.dirname(self.filename) or os.curdir):
+                os.makedirs(os.path.dirname(self.filename))
+            self._pages = PdfPages(self.filename)
+        self._pages.savefig(plt.gcf(), **kwargs)
+        self.manifest[name] = self._pages.get_pagecount()
+        return self.manifest[name]
+
+    def close(self):
+        """Finishes the PDF and writes the JSON manifest."""
+        if self._pages is None:
+            return
+        self._pages.close()
+        self._pages = None
+        with open(os.path.splitext(self.filename)[0] + ".json", "w") as fp:
+            json.dump({"pdf": os.path.basename(self.filename), "pages": self.manifest}, fp, indent=1)
+
+
+def _save_bundled(bundle, pltfile, layers, rasterize=False, rasterdpi=300, **kwargs):
+    """Appends the current figure to :py:class:`FigureBundle` *bundle* as a
+    page named for *pltfile*, rasterizing *layers* per *rasterize* as in
+    :py:func:`save_layered`. Returns dictionary of bundle ``pdf`` and ``page``.
+
+    """
+    npoints = sum(_artist_points(art) for art in layers)
+    if rasterize is None:
+        rasterize = npoints > raster_threshold or len(layers) > raster_artists
+    _rasterize_layers(layers, bool(rasterize), False)
+    if rasterize:
+        kwargs["dpi"] = rasterdpi
+    page = bundle.add(os.path.basename(pltfile), **kwargs)
+    _rasterize_layers(layers, False, False)
+    return {"pdf": bundle.filename, "page": page}
+
+
+def _rasterize_layers(layers, rasterize, merge):
+    """Toggles rasterization of artists *layers* for :py:func:`save_layered`."""
+    if not merge:
+        for art in layers:
+            art.set_rasterized(rasterize)
+        return
+
+    for ax in set(art.axes for art in layers):
+        ax.set_rasterization_zorder(1.0 if rasterize else None)
+    for art in layers:
+        if rasterize and not hasattr(art, "_layer_zorder"):
+            art._layer_zorder = art.get_zorder()
+            art.set_zorder(0.5)
+        elif not rasterize and hasattr(art, "_layer_zorder"):
+            art.set_zorder(art._layer_zorder)
+            del art._layer_zorder
+
+
+# breakpoints (position, value) of each channel of matplotlib's jet colormap
+_jet_segments = {
+    "red": ((0.0, 0.0), (0.35, 0.0), (0.66, 1.0), (0.89, 1.0), (1.0, 0.5)),
+    "green": ((0.0, 0.0), (0.125, 0.0), (0.375, 1.0), (0.64, 1.0), (0.91, 0.0), (1.0, 0.0)),
+    "blue": ((0.0, 0.5), (0.11, 1.0), (0.34, 1.0), (0.65, 0.0), (1.0, 0.0)),
+}
+
+
+def _jet(frac):
+    """Returns RGBA tuple for *frac* in [0, 1] as ``matplotlib.cm.jet``
+    does (256-entry table), without importing matplotlib.
+
+    """
+    idx = min(max(int(frac * 256), 0), 255)
+    posn = idx / 255.0
+    rgba = []
+    for channel in ("red", "green", "blue"):
+        segs = _jet_segments[channel]
+        for (x0, y0), (x1, y1) in zip(segs[:-1], segs[1:]):
+            if posn <= x1:
+                rgba.append(y0 + (y1 - y0) * (posn - x0) / (x1 - x0))
+                break
+    rgba.append(1.0)
+    return tuple(rgba)
+
+
+# RGBA of the matplotlib colors named by segment_color
+_base_colors = {
+    "grey": (128 / 255.0, 128 / 255.0, 128 / 255.0, 1.0),
+    "black": (0.0, 0.0, 0.0, 1.0),
+    "red": (1.0, 0.0, 0.0, 1.0),
+    "green": (0.0, 128 / 255.0, 0.0, 1.0),
+    "blue": (0.0, 0.0, 1.0, 1.0),
+}
+
+# jet table plus grey fallback row, built on first use by segment_colors
+_sapt_lut = []
+
+
+def segment_colors(argcolor, saptcolors):
+    """Returns (N, 4) array of RGBA colors, one per reaction, between overall
+    color directive *argcolor* and the reactions' color availabilities
+    *saptcolors* (None where absent), in the manner of
+    :py:func:`segment_color` but for a whole array in one pass. Unavailable
+    and, for 'sapt', out-of-range colors come back grey.
+
+    """
+    import numpy as np
+
+    saptcolors = list(saptcolors)
+    if argcolor is None:
+        # no color argument, so take from rxn; matplotlib only for other names
+        clrs = ["grey" if clr is None else clr for clr in saptcolors]
+        if all(isinstance(clr, str) and clr in _base_colors for clr in clrs):
+            return np.array([_base_colors[clr] for clr in clrs]).reshape(-1, 4)
+        import matplotlib
+
+        return matplotlib.colors.to_rgba_array(clrs).reshape(-1, 4)
+
+    vals = np.array([np.nan if clr is None else clr for clr in saptcolors], dtype=float)
+    if argcolor == "sapt":
+        # 256-entry jet table; invalid colors index the grey row after it
+        if not _sapt_lut:
+            _sapt_lut.append(np.array([_jet((idx + 0.5) / 256) for idx in range(256)] + [_base_colors["grey"]]))
+        valid = (vals >= 0.0) & (vals <= 1.0)
+        idx = np.where(valid, np.clip(np.nan_to_num(vals * 256).astype(int), 0, 255), 256)
+        return _sapt_lut[0][idx]
+    elif argcolor == "rgb":
+        # HB/MX/DD sapt color from rxn if available
+        lut = np.array([_base_colors[clr] for clr in ("blue", "green", "red", "grey")])
+        idx = np.where(np.isnan(vals), 3, np.digitize(vals, [0.333, 0.667]))
+        return lut[idx]
+    else:
+        # color argument is name of mpl color
+        if argcolor in _base_colors:
+            return np.tile(_base_colors[argcolor], (len(vals), 1))
+        import matplotlib
+
+        return np.tile(matplotlib.colors.to_rgba(argcolor), (len(vals), 1))
+
+
 def segment_color(argcolor, saptcolor):
     """Find appropriate color expression between overall color directive
     *argcolor* and particular color availibility *saptcolor*.
 
     """
-    import matplotlib
-
     # May 2024 change: set outer (not rxn) color arg to "sapt" or "rgb" to get sapt interpretation.
     #   Default None for outer color arg will no longer route to sapt interpretation.
     if argcolor is None:
@@ -93,7 +470,7 @@ def segment_color(argcolor, saptcolor):
 
         # sapt color from rxn if available
         if saptcolor is not None:
-            clr = matplotlib.cm.jet(saptcolor)
+            clr = _jet(saptcolor)
         else:
             clr = "grey"
     elif argcolor == "rgb":
@@ -114,78 +491,114 @@ def segment_color(argcolor, saptcolor):
     return clr
 
 
-def bars(data, title="", saveas=None, relpath=False, graphicsformat=["pdf"], view=True):
+def bars(data, title="", saveas=None, relpath=False, graphicsformat=["pdf"], view=True, perpage=29, sink=None):
     """Generates a 'gray-bars' diagram between model chemistries with error
     statistics in list *data*, which is supplied as part of the dictionary
     for each participating bar/modelchem, along with *mc* keys in argument
     *data*. The plot is labeled with *title* and each bar with *mc* key and
     plotted at a fixed scale to facilitate comparison across projects.
+    Bar sets (and None gaps) beyond the *perpage* that fit the fixed
+    canvas continue on further pages, each titled with its page number:
+    pages of 'pdf' go into one multi-page file, those of other formats
+    into files suffixed ``_p1``, ``_p2``, .... Returns dictionary keyed by
+    format of the file saved, or for formats other than 'pdf' spanning
+    several pages, of the list of page files. With *sink*, outputs are
+    bytes kept in memory per :py:func:`save_output`.
 
     """
+    import io
     import hashlib
+    import numpy as np
     import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
 
-    # initialize plot, fix dimensions for consistent Illustrator import
-    fig, ax = plt.subplots(figsize=(12, 7))
-    plt.ylim([0, 4.86])
-    plt.xlim([0, 6])
-    plt.xticks([])
+    widths = np.array([0.15, 0.02, 0.02, 0.02])  # TT, HB, MX, DD
+    offsets = np.array([0.0, 0.025, 0.065, 0.105])
+    colors = ["grey", "red", "green", "blue"]
+    pages = [data[start : start + perpage] for start in range(0, max(len(data), 1), perpage)]
 
-    # label plot and tiers
-    ax.text(
-        0.4,
-        4.6,
-        title,
-        verticalalignment="bottom",
-        horizontalalignment="left",
-        family="Times New Roman",
-        weight="bold",
-        fontsize=12,
+    # name files, common to all pages
+    pltuid = (
+        title
+        + "_"
+        + hashlib.sha1(
+            (title + repr([bar["mc"] for bar in data if bar is not None])).encode()
+        ).hexdigest()
     )
+    pltfile = expand_saveas(saveas, pltuid, def_prefix="bar_", relpath=relpath)
+    check_sink(sink, sum(1 if ext.lower() == "pdf" else len(pages) for ext in graphicsformat))
+    files_saved = {}
+    pdfpages = None
+    if len(pages) > 1:
+        for ext in graphicsformat:
+            if ext.lower() == "pdf":
+                pdftarget = pltfile + ".pdf" if sink is None else io.BytesIO()
+                pdfpages = PdfPages(pdftarget)
+            else:
+                files_saved[ext.lower()] = []
 
-    widths = [0.15, 0.02, 0.02, 0.02]  # TT, HB, MX, DD
-    xval = 0.1  # starting posn along x-axis
-
-    # plot bar sets
-    for bar in data:
-        if bar is not None:
-            lefts = [xval, xval + 0.025, xval + 0.065, xval + 0.105]
+    for ipage, page in enumerate(pages):
+        # initialize plot, fix dimensions for consistent Illustrator import
+        fig, ax = plt.subplots(figsize=(12, 7))
+        plt.ylim([0, 4.86])
+        plt.xlim([0, 6])
+        plt.xticks([])
 
-            rect = ax.bar(lefts, bar["data"], widths, linewidth=0)
-            rect[0].set_color("grey")
-            rect[1].set_color("red")
-            rect[2].set_color("green")
-            rect[3].set_color("blue")
+        # label plot and tiers
+        ax.text(
+            0.4,
+            4.6,
+            title if len(pages) == 1 else "%s (%d/%d)" % (title, ipage + 1, len(pages)),
+            verticalalignment="bottom",
+            horizontalalignment="left",
+            family="Times New Roman",
+            weight="bold",
+            fontsize=12,
+        )
 
+        # plot bar sets, all at once; starting posn along x-axis 0.1
+        slots = [islot for islot, bar in enumerate(page) if bar is not None]
+        xvals = 0.1 + 0.20 * np.array(slots, dtype=float)
+        if slots:
+            heights = np.array([page[islot]["data"] for islot in slots], dtype=float)
+            ax.bar(
+                (xvals[:, None] + offsets[None, :]).ravel(),
+                heights.ravel(),
+                np.tile(widths, len(slots)),
+                color=colors * len(slots),
+                linewidth=0,
+            )
+        for islot, xval in zip(slots, xvals):
             ax.text(
                 xval + 0.08,
                 4.3,
-                bar["mc"],
+                page[islot]["mc"],
                 verticalalignment="center",
                 horizontalalignment="right",
                 rotation="vertical",
                 family="Times New Roman",
                 fontsize=8,
             )
-        xval += 0.20
 
-    # save and show
-    pltuid = (
-        title
-        + "_"
-        + hashlib.sha1(
-            (title + repr([bar["mc"] for bar in data if bar is not None])).encode()
-        ).hexdigest()
-    )
-    pltfile = expand_saveas(saveas, pltuid, def_prefix="bar_", relpath=relpath)
-    files_saved = {}
-    for ext in graphicsformat:
-        savefile = pltfile + "." + ext.lower()
-        plt.savefig(savefile, transparent=True, format=ext, bbox_inches="tight")
-        files_saved[ext.lower()] = savefile
-    if view:
-        plt.show()
-    plt.close()
+        for ext in graphicsformat:
+            if len(pages) > 1 and ext.lower() == "pdf":
+                pdfpages.savefig(fig, transparent=True, bbox_inches="tight")
+                continue
+            savefile = pltfile + ("." if len(pages) == 1 else "_p%d." % (ipage + 1)) + ext.lower()
+            saved = save_output(
+                sink, savefile, ext.lower(), lambda target: plt.savefig(target, transparent=True, format=ext, bbox_inches="tight")
+            )
+            if len(pages) == 1:
+                files_saved[ext.lower()] = saved
+            else:
+                files_saved[ext.lower()].append(saved)
+        if view:
+            plt.show()
+        plt.close()
+
+    if pdfpages is not None:
+        pdfpages.close()
+        files_saved["pdf"] = pdftarget if sink is None else save_output(sink, None, "pdf", lambda target: target.write(pdftarget.getvalue()))
     return files_saved
 
 
@@ -205,6 +618,11 @@ def flat(
     alpha=1,
     percentiles=None, # [0.1, 0.9],
     zero_line=None, # {'color': 'black', 'linewidth': 1.0},
+    rasterize=None,
+    rasterdpi=300,
+    bundle=None,
+    cache=False,
+    sink=None,
 ):
     """Generates a slat diagram between model chemistries with errors in
     single-item list *data*, which is supplied as part of the dictionary
@@ -213,7 +631,15 @@ def flat(
     *color* is None, slats are black, if 'sapt', colors are taken from
     sapt_colors module. Summary statistic *mae* is plotted on the
     overbound side and relative statistic *mape* on the underbound side.
-    Saves a file with name *title* and plots to screen if *view*.
+    Saves a file with name *title* and plots to screen if *view*. Slats
+    are rasterized in vector formats per *rasterize* and *rasterdpi* as
+    in :py:func:`save_layered`. If :py:class:`FigureBundle` *bundle*, the
+    plot is instead appended to it as a page named for the file, and the
+    dictionary returned holds its ``pdf`` and ``page``. If *cache*, the
+    figure with its guide lines is kept for later calls with the same
+    *xlimit*, *xlines* and *zero_line*, and not shown, per
+    :py:func:`save_blitted`. With *sink*, outputs are bytes kept in memory
+    per :py:func:`save_output`.
 
     """
     import matplotlib.pyplot as plt
@@ -222,61 +648,196 @@ def flat(
     positions = range(-1, -1 * Nweft - 1, -1)
 
     # initialize plot
-    fig, ax = plt.subplots(figsize=(12, 0.33))
-    plt.xlim([-xlimit, xlimit])
-    plt.ylim([-1 * Nweft - 1, 0])
-    plt.yticks([])
-    plt.xticks([])
-    #    fig.patch.set_visible(False)
-    #    ax.patch.set_visible(False)
-    ax.axis("off")
-    if zero_line is not None:
-        plt.axvline(0.0, color=zero_line["color"], linewidth=zero_line["linewidth"])
-
-    for xl in xlines:
-        plt.axvline(xl, color="grey", linewidth=4)
-        if xl != 0.0:
-            plt.axvline(-1 * xl, color="grey", linewidth=4)
+    def decorate():
+        fig, ax = plt.subplots(figsize=(12, 0.33))
+        plt.xlim([-xlimit, xlimit])
+        plt.ylim([-1 * Nweft - 1, 0])
+        plt.yticks([])
+        plt.xticks([])
+        #    fig.patch.set_visible(False)
+        #    ax.patch.set_visible(False)
+        ax.axis("off")
+        if zero_line is not None:
+            plt.axvline(0.0, color=zero_line["color"], linewidth=zero_line["linewidth"])
+
+        for xl in xlines:
+            plt.axvline(xl, color="grey", linewidth=4)
+            if xl != 0.0:
+                plt.axvline(-1 * xl, color="grey", linewidth=4)
+        return fig, ax
+
+    if cache:
+        key = ("flat", xlimit, tuple(xlines), None if zero_line is None else tuple(sorted(zero_line.items())))
+        backdrop = _backdrop(key, decorate, plt.rcParams["figure.dpi"])
+        ax = backdrop["ax"]
+    else:
+        fig, ax = decorate()
 
     # plot reaction errors and threads
-    for rxn in data:
+    layers = []
+    clrs = segment_colors(color, [rxn.get("color") for rxn in data])
+    for rxn, clr in zip(data, clrs):
         xvals = rxn["data"]
-        clr = segment_color(color, rxn["color"] if "color" in rxn else None)
 
-        ax.plot(xvals, positions, "|", color=clr, markersize=13.0, mew=0.5, alpha=alpha)
+        layers.extend(ax.plot(xvals, positions, "|", color=clr, markersize=13.0, mew=0.5, alpha=alpha))
 
     # plot trimmings
+    trimmings = []
     if mae is not None:
-        plt.axvline(-1 * mae, color="black", linewidth=mae_linewidth)
+        trimmings.append(ax.axvline(-1 * mae, color="black", linewidth=mae_linewidth))
     if mape is not None:  # equivalent to MAE for a 10 kcal/mol interaction energy
-        ax.plot(0.025 * mape, positions, "o", color="black", markersize=15.0)
+        trimmings.extend(ax.plot(0.025 * mape, positions, "o", color="black", markersize=15.0))
     if percentiles is not None:
         for p in percentiles:
-            plt.axvline(p, color="red", linewidth=6.0)
+            trimmings.append(ax.axvline(p, color="red", linewidth=6.0))
 
     # save and show
     pltuid = title  # simple (not really unique) filename for LaTeX integration
-    if not os.path.exists('plots'):
-        os.makedirs('plots')
     pltfile = expand_saveas(saveas, pltuid, def_prefix="plots/flat_", relpath=relpath)
-    files_saved = {}
-    for ext in graphicsformat:
-        savefile = pltfile + "." + ext.lower()
-        plt.savefig(
-            savefile,
+    if sink is None and bundle is None and not os.path.isdir(os.path.dirname(pltfile) or os.curdir):
+        os.makedirs(os.path.dirname(pltfile))
+    if bundle is not None:
+        files_saved = _save_bundled(
+            bundle,
+            pltfile,
+            layers,
+            rasterize=rasterize,
+            rasterdpi=rasterdpi,
+            transparent=True,
+            bbox_inches="tight",
+            pad_inches=0.0,
+        )
+        if cache:
+            for art in layers + trimmings:
+                art.remove()
+    elif cache:
+        files_saved = save_blitted(
+            backdrop,
+            pltfile,
+            graphicsformat,
+            layers,
+            layers + trimmings,
+            sink=sink,
+            rasterize=rasterize,
+            rasterdpi=rasterdpi,
+            transparent=True,
+            bbox_inches="tight",
+            pad_inches=0.0,
+        )
+    else:
+        files_saved = save_layered(
+            pltfile,
+            graphicsformat,
+            layers,
+            sink=sink,
+            rasterize=rasterize,
+            rasterdpi=rasterdpi,
             transparent=True,
-            format=ext,
             bbox_inches="tight",
             # frameon=False,
             pad_inches=0.0,
         )
-        files_saved[ext.lower()] = savefile
+    if cache:
+        return files_saved
     if view:
         plt.show()
     plt.close()  # give this a try
     return files_saved
 
 
+def _tikz_color(clr):
+    """Returns xcolor expression for color name or RGB(A) tuple *clr*."""
+    if isinstance(clr, str):
+        if clr not in _base_colors:
+            return clr
+        clr = _base_colors[clr]
+    return "{rgb,1:red,%.3g;green,%.3g;blue,%.3g}" % tuple(clr[:3])
+
+
+def flat_tikz(
+    data,
+    color=None,
+    xlimit=4.0,
+    xlines=[0.0, 0.3, 1.0],
+    mae=None,
+    mae_linewidth=12,
+    mape=None,
+    alpha=1,
+    percentiles=None,
+    zero_line=None,
+    width=6.67,
+    height=0.35,
+):
+    """Returns TikZ picture of the slat strip drawn by :py:func:`flat` for
+    the same arguments, sized *width* by *height* in cm, computed directly
+    from *data* without matplotlib so it can be inlined into a LaTeX table
+    (needs ``\\usepackage{tikz}``). Line widths and marker sizes follow
+    those of :py:func:`flat` scaled to the included size.
+
+    """
+    import collections
+
+    # flat() axes are 9.3in x 18.3pt; pts scale to this picture by fx, fy
+    fx = width / 23.622
+    fy = height / 0.6456
+    xunit = width / (2.0 * xlimit)
+
+    def num(val):
+        return "%.4g" % (val)
+
+    def vline(xval, lw, clr, opacity=1):
+        if not -xlimit <= xval <= xlimit:
+            return None
+        style = "line width=%spt,color=%s" % (num(lw * fx), _tikz_color(clr))
+        if opacity != 1:
+            style += ",opacity=%s" % (num(opacity))
+        return r"""\draw[%s] (%s,0)--(%s,1);""" % (style, num(xval), num(xval))
+
+    text = []
+    text.append(r"""\begin{tikzpicture}[x=%scm,y=%scm]""" % (num(xunit), num(height)))
+    text.append(r"""\useasboundingbox (%s,0) rectangle (%s,1);""" % (num(-xlimit), num(xlimit)))
+    if zero_line is not None:
+        text.append(vline(0.0, zero_line["linewidth"], zero_line["color"]))
+    for xl in xlines:
+        text.append(vline(xl, 4, "grey"))
+        if xl != 0.0:
+            text.append(vline(-1 * xl, 4, "grey"))
+
+    # slats, one path per color
+    slats = collections.OrderedDict()
+    if color in ("sapt", "rgb"):
+        clrs = segment_colors(color, [rxn.get("color") for rxn in data])
+    else:
+        # grey or named colors, left to xcolor
+        clrs = [segment_color(color, rxn.get("color")) for rxn in data]
+    for rxn, clr in zip(data, clrs):
+        clr = _tikz_color(clr)
+        for xval in rxn["data"]:
+            if xval is not None and -xlimit <= xval <= xlimit:
+                slats.setdefault(clr, []).append("(%s,.145)--(%s,.855)" % (num(xval), num(xval)))
+    style = "line width=%spt" % (num(0.5 * fx))
+    if alpha != 1:
+        style += ",opacity=%s" % (num(alpha))
+    for clr, segs in slats.items():
+        text.append(r"""\draw[%s,color=%s] %s;""" % (style, clr, " ".join(segs)))
+
+    # trimmings
+    if mae is not None:
+        text.append(vline(-1 * mae, mae_linewidth, "black"))
+    if mape is not None:  # equivalent to MAE for a 10 kcal/mol interaction energy
+        if -xlimit <= 0.025 * mape <= xlimit:
+            text.append(
+                r"""\fill (%s,.5) ellipse [x radius=%spt,y radius=%spt];"""
+                % (num(0.025 * mape), num(7.5 * fx), num(7.5 * fy))
+            )
+    if percentiles is not None:
+        for p in percentiles:
+            text.append(vline(p, 6.0, "red"))
+    text.append(r"""\end{tikzpicture}""")
+
+    return "\n".join(line for line in text if line is not None)
+
+
 # def mpl_distslat_multiplot_files(pltfile, dbid, dbname, xmin, xmax, mcdats, labels, titles):
 #    """Saves a plot with basename *pltfile* with a slat representation
 #    of the modelchems errors in *mcdat*. Plot is in PNG, PDF, & EPS
@@ -348,11 +909,22 @@ def valerr(
     saveas=None,
     relpath=False,
     graphicsformat=["pdf"],
+    sink=None,
 ):
-    """ """
+    """Generates a pair of plots for dictionary *data* of traces, each a
+    list of reactions along a coordinate (like a dissociation curve) with
+    keys *axis*, *mcdata*, *bmdata* and *error*: values of model chemistry
+    (colored per *color* as in :py:func:`segment_colors`) and benchmark
+    above, errors below. Each series is drawn as one artist for all traces.
+    With *sink*, outputs are bytes kept in memory per :py:func:`save_output`.
+
+    """
     import hashlib
     from itertools import cycle
+    import numpy as np
     import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
 
     fig, ax = plt.subplots(figsize=(4, 6))
     ax1 = fig.add_subplot(211)
@@ -365,81 +937,115 @@ def valerr(
     ax2.set_ylabel("Energy Error")
     ax2.set_xlabel(xtitle)
 
-    xmin = 500.0
-    xmax = -500.0
-    vmin = 1.0
-    vmax = -1.0
-    emin = 1.0
-    emax = -1.0
+    # gather every trace into flat arrays, NaN where absent
+    traces = list(data.keys())
     linecycler = cycle(["-", "--", "-.", ":"])
-    # plot reaction errors and threads
-    for trace, tracedata in data.items():
-        vaxis = []
-        vmcdata = []
-        verror = []
-        for rxn in tracedata:
-            clr = segment_color(color, rxn["color"] if "color" in rxn else None)
-            xmin = min(xmin, rxn["axis"])
-            xmax = max(xmax, rxn["axis"])
-
-            ax1.plot(
-                rxn["axis"],
-                rxn["mcdata"],
-                "^",
-                color=clr,
-                markersize=6.0,
-                mew=0,
-                zorder=10,
-            )
-            vmcdata.append(rxn["mcdata"])
-            vaxis.append(rxn["axis"])
-            vmin = min(0, vmin, rxn["mcdata"])
-            vmax = max(0, vmax, rxn["mcdata"])
-
-            if rxn["bmdata"] is not None:
-                ax1.plot(
-                    rxn["axis"],
-                    rxn["bmdata"],
-                    "o",
-                    color="black",
-                    markersize=6.0,
-                    zorder=1,
-                )
-                vmin = min(0, vmin, rxn["bmdata"])
-                vmax = max(0, vmax, rxn["bmdata"])
-
-            if rxn["error"][0] is not None:
-                ax2.plot(rxn["axis"], rxn["error"][0], "s", color=clr, mew=0, zorder=8)
-                emin = min(0, emin, rxn["error"][0])
-                emax = max(0, emax, rxn["error"][0])
-            verror.append(rxn["error"][0])
+    linestyles = [next(linecycler) for trace in traces]
+    tracedata = [data[trace] for trace in traces]
+    counts = [len(rxns) for rxns in tracedata]
+    rxns = [rxn for rxns in tracedata for rxn in rxns]
+
+    def column(get):
+        return np.array([np.nan if get(rxn) is None else get(rxn) for rxn in rxns], dtype=float)
+
+    vaxis = column(lambda rxn: rxn["axis"])
+    vmcdata = column(lambda rxn: rxn["mcdata"])
+    vbmdata = column(lambda rxn: rxn["bmdata"])
+    verror = column(lambda rxn: rxn["error"][0])
+    clrs = np.concatenate(
+        [segment_colors(color, [rxn.get("color") for rxn in rxns]) for rxns in tracedata] or [np.empty((0, 4))]
+    )
 
-        ls = next(linecycler)
-        ax1.plot(vaxis, vmcdata, ls, color="grey", label=trace, zorder=3)
-        ax2.plot(vaxis, verror, ls, color="grey", label=trace, zorder=4)
+    # plot values, benchmarks and errors, one artist per series
+    hasbm = ~np.isnan(vbmdata)
+    haserr = ~np.isnan(verror)
+    # snapped like the per-point markers they replace, stacked over (zorder 10, 8)
+    #   or under (zorder 1) the trace lines at zorder 3 and 4
+    ax1.scatter(vaxis, vmcdata, s=36.0, c=clrs, marker="^", linewidths=0, zorder=10, snap=True)
+    ax1.plot(vaxis[hasbm], vbmdata[hasbm], "o", color="black", markersize=6.0, zorder=1)
+    ax2.scatter(vaxis[haserr], verror[haserr], s=36.0, c=clrs[haserr], marker="s", linewidths=0, zorder=8, snap=True)
+
+    # trace lines, one collection per axes
+    bounds = np.cumsum([0] + counts)
+    for axis, vals, zorder in ((ax1, vmcdata, 3), (ax2, verror, 4)):
+        segments = [np.column_stack([vaxis[lo:hi], vals[lo:hi]]) for lo, hi in zip(bounds[:-1], bounds[1:])]
+        axis.add_collection(LineCollection(segments, colors="grey", linestyles=linestyles, zorder=zorder))
+    handles = [Line2D([], [], linestyle=ls, color="grey", label=trace) for trace, ls in zip(traces, linestyles)]
+
+    # limits as the running min/max from 500, 1 and 0 they always were
+    xmin = np.nanmin(vaxis, initial=500.0)
+    xmax = np.nanmax(vaxis, initial=-500.0)
+    vmin = min(0.0, np.nanmin(vmcdata, initial=1.0), np.nanmin(vbmdata, initial=1.0)) if rxns else 1.0
+    vmax = max(0.0, np.nanmax(vmcdata, initial=-1.0), np.nanmax(vbmdata, initial=-1.0)) if rxns else -1.0
+    emin = min(0.0, np.nanmin(verror, initial=1.0)) if haserr.any() else 1.0
+    emax = max(0.0, np.nanmax(verror, initial=-1.0)) if haserr.any() else -1.0
 
     xbuf = max(0.05, abs(0.02 * xmax))
     vbuf = max(0.1, abs(0.02 * vmax))
     ebuf = max(0.01, abs(0.02 * emax))
     plt.xlim([xmin - xbuf, xmax + xbuf])
     ax1.set_ylim([vmin - vbuf, vmax + vbuf])
-    plt.legend(fontsize="x-small") #, frameon=False)
+    ax2.legend(handles=handles, fontsize="x-small") #, frameon=False)
     ax2.set_ylim([emin - ebuf, emax + ebuf])
 
     # save and show
     pltuid = title + "_" + hashlib.sha1(title.encode()).hexdigest()
     pltfile = expand_saveas(saveas, pltuid, def_prefix="valerr_", relpath=relpath)
+    check_sink(sink, len(graphicsformat))
     files_saved = {}
     for ext in graphicsformat:
         savefile = pltfile + "." + ext.lower()
-        plt.savefig(savefile, transparent=True, format=ext, bbox_inches="tight")
-        files_saved[ext.lower()] = savefile
+        files_saved[ext.lower()] = save_output(
+            sink, savefile, ext.lower(), lambda target: plt.savefig(target, transparent=True, format=ext, bbox_inches="tight")
+        )
     if view:
         plt.show()
     plt.close()  # give this a try
     return files_saved
 
 
+def _binned_kde(values, xmin, xmax, npts=512):
+    """Returns grid and (M, *npts*) array of Gaussian kernel density
+    estimates over [*xmin*, *xmax*] for each row of (M, N) array *values*
+    (NaN for missing), with Silverman bandwidths. Points are binned onto
+    the grid and all rows smoothed at once by FFT convolution.
+
+    """
+    import numpy as np
+
+    grid = np.linspace(xmin, xmax, npts)
+    dx = grid[1] - grid[0]
+    counts = _shared_counts(values, xmin - 0.5 * dx, xmax + 0.5 * dx, npts)
+    nobs = np.sum(~np.isnan(values), axis=1)
+    spread = np.nanstd(values, axis=1, ddof=1)
+    bandwidth = 1.06 * spread * np.power(np.maximum(nobs, 1), -0.2)
+
+    # zero-pad against wraparound; Gaussian kernel applied in frequency space
+    freq = np.fft.rfftfreq(2 * npts, d=dx)
+    kernel = np.exp(-2.0 * (np.pi * freq[None, :] * bandwidth[:, None]) ** 2)
+    density = np.fft.irfft(np.fft.rfft(counts, n=2 * npts, axis=1) * kernel, n=2 * npts, axis=1)[:, :npts]
+    density = np.clip(density, 0.0, None) / (np.maximum(nobs, 1)[:, None] * dx)
+    return grid, density
+
+
+def _shared_counts(values, xmin, xmax, bins):
+    """Returns (M, *bins*) histogram counts over [*xmin*, *xmax*] for every
+    row of (M, N) array *values* in one pass, skipping NaN and values out
+    of range.
+
+    """
+    import numpy as np
+
+    width = (xmax - xmin) / bins
+    with np.errstate(invalid="ignore"):
+        idx = np.floor((values - xmin) / width)
+        idx[values == xmax] = bins - 1
+        keep = (idx >= 0) & (idx < bins)
+    rows = np.broadcast_to(np.arange(values.shape[0])[:, None], values.shape)
+    flat = rows[keep] * bins + idx[keep].astype(int)
+    return np.bincount(flat, minlength=values.shape[0] * bins).reshape(values.shape[0], bins)
+
+
 def disthist(
     data,
     title="",
@@ -452,63 +1058,132 @@ def disthist(
     saveas=None,
     relpath=False,
     graphicsformat=["pdf"],
+    labels=None,
+    layout="multiples",
+    columns=5,
+    bins=30,
+    kde=False,
+    sink=None,
 ):
     """Saves a plot with name *saveas* with a histogram representation
     of the reaction errors in *data*. Also plots a gaussian distribution
     with mean *me* and standard deviation *stde*. Plot has x-range
     *xmin* to *xmax*, x-axis label *xtitle* and overall title *title*.
+    For several methods at once, *data* is a 2D array (a row per method,
+    NaN where missing), a DataFrame (a column per method), or a dictionary
+    of method name to errors; *me* and *stde* may then be arrays. All
+    histograms share *bins* bins over one x-range and are drawn *columns*
+    across as small multiples titled by *labels* if *layout* is
+    'multiples' or on one axes if 'overlay'. If *kde*, a kernel density
+    estimate is drawn alongside each gaussian. With *sink*, outputs are
+    bytes kept in memory per :py:func:`save_output`.
 
     """
     import hashlib
     import numpy as np
     import matplotlib.pyplot as plt
 
-    def gaussianpdf(u, v, x):
-        """*u* is mean, *v* is variance, *x* is value, returns probability"""
-        return 1.0 / np.sqrt(2.0 * np.pi * v) * np.exp(-pow(x - u, 2) / 2.0 / v)
-
-    me = me if me is not None else np.mean(data)
-    stde = stde if stde is not None else np.std(data, ddof=1)
-    evenerr = max(abs(me - 4.0 * stde), abs(me + 4.0 * stde))
+    # arrange as (methods, systems) with NaN padding
+    if hasattr(data, "columns"):
+        labels = labels if labels is not None else [str(col) for col in data.columns]
+        values = data.to_numpy(dtype=float).T
+    elif isinstance(data, dict):
+        labels = labels if labels is not None else [str(key) for key in data.keys()]
+        longest = max(len(errs) for errs in data.values())
+        values = np.full((len(data), longest), np.nan)
+        for irow, errs in enumerate(data.values()):
+            values[irow, : len(errs)] = np.array([np.nan if e is None else e for e in errs], dtype=float)
+    else:
+        values = np.array(data, dtype=float)
+    single = values.ndim == 1
+    values = np.atleast_2d(values)
+    nmtd = values.shape[0]
+    labels = labels if labels is not None else [""] * nmtd
+
+    me = np.broadcast_to(me if me is not None else np.nanmean(values, axis=1), (nmtd,))
+    stde = np.broadcast_to(stde if stde is not None else np.nanstd(values, axis=1, ddof=1), (nmtd,))
+    evenerr = np.max(np.maximum(np.abs(me - 4.0 * stde), np.abs(me + 4.0 * stde)))
     xmin = xmin if xmin is not None else -1 * evenerr
     xmax = xmax if xmax is not None else evenerr
 
-    dx = (xmax - xmin) / 40.0
-    nx = int(round((xmax - xmin) / dx)) + 1
-    pdfx = []
-    pdfy = []
-    for i in range(nx):
-        ix = xmin + i * dx
-        pdfx.append(ix)
-        pdfy.append(gaussianpdf(me, pow(stde, 2), ix))
-
-    fig, ax1 = plt.subplots(figsize=(16, 6))
-    plt.axvline(0.0, color="#cccc00")
-    ax1.set_xlim(xmin, xmax)
-    ax1.hist(data, bins=30, range=(xmin, xmax), color="#2d4065", alpha=0.7)
-    ax1.set_xlabel(xtitle)
-    ax1.set_ylabel("Count")
-
-    ax2 = ax1.twinx()
-    ax2.fill(pdfx, pdfy, color="k", alpha=0.2)
-    ax2.set_ylabel("Probability Density")
+    edges = np.linspace(xmin, xmax, bins + 1)
+    counts = _shared_counts(values, xmin, xmax, bins)
+    pdfx = np.linspace(xmin, xmax, 41)
+    variance = np.power(stde, 2)[:, None]
+    pdfy = 1.0 / np.sqrt(2.0 * np.pi * variance) * np.exp(-np.power(pdfx[None, :] - me[:, None], 2) / 2.0 / variance)
+    if kde:
+        kdex, kdey = _binned_kde(values, xmin, xmax)
+
+    if single:
+        fig, ax1 = plt.subplots(figsize=(16, 6))
+        axes = [ax1]
+    elif layout == "overlay":
+        fig, ax1 = plt.subplots(figsize=(16, 6))
+        axes = [ax1] * nmtd
+    else:
+        nrows = int(np.ceil(nmtd / columns))
+        fig, grid = plt.subplots(nrows, min(columns, nmtd), figsize=(3.2 * min(columns, nmtd), 2.4 * nrows), sharex=True, squeeze=False)
+        axes = list(grid.flat)
+        for ax in axes[nmtd:]:
+            ax.set_visible(False)
+
+    twins = {}
+    for imtd in range(nmtd):
+        ax1 = axes[imtd]
+        overlaid = not single and layout == "overlay"
+        if ax1 not in twins:
+            ax1.axvline(0.0, color="#cccc00")
+            ax1.set_xlim(xmin, xmax)
+            twins[ax1] = ax1.twinx()
+            if single or overlaid:
+                ax1.set_xlabel(xtitle)
+                ax1.set_ylabel("Count")
+                twins[ax1].set_ylabel("Probability Density")
+            elif labels[imtd]:
+                ax1.set_title(labels[imtd], fontsize="small")
+        ax2 = twins[ax1]
+        if overlaid:
+            clr = "C%d" % (imtd % 10)
+            ax1.hist(edges[:-1], bins=edges, weights=counts[imtd], histtype="step", color=clr, label=labels[imtd])
+            ax2.plot(pdfx, pdfy[imtd], color=clr, alpha=0.6)
+        else:
+            ax1.hist(edges[:-1], bins=edges, weights=counts[imtd], color="#2d4065", alpha=0.7)
+            ax2.fill(pdfx, pdfy[imtd], color="k", alpha=0.2)
+        if kde:
+            ax2.plot(kdex, kdey[imtd], color=clr if overlaid else "#2d4065", linestyle="--", linewidth=1.0)
 
-    plt.title(title)
+    if single:
+        plt.title(title)
+    else:
+        if layout == "overlay" and any(labels):
+            axes[0].legend(loc="upper left", fontsize="small")
+        else:
+            fig.supxlabel(xtitle)
+        fig.suptitle(title)
+        fig.tight_layout()
 
     # save and show
     pltuid = (
         title
         + "_"
         + hashlib.sha1(
-            (title + str(me) + str(stde) + str(xmin) + str(xmax)).encode()
+            (
+                title
+                + (str(me[0]) + str(stde[0]) if single else str(list(me)) + str(list(stde)))
+                + str(xmin)
+                + str(xmax)
+                + ("" if single else layout + str(labels))
+            ).encode()
         ).hexdigest()
     )
     pltfile = expand_saveas(saveas, pltuid, def_prefix="disthist_", relpath=relpath)
+    check_sink(sink, len(graphicsformat))
     files_saved = {}
     for ext in graphicsformat:
         savefile = pltfile + "." + ext.lower()
-        plt.savefig(savefile, transparent=True, format=ext, bbox_inches="tight")
-        files_saved[ext.lower()] = savefile
+        files_saved[ext.lower()] = save_output(
+            sink, savefile, ext.lower(), lambda target: plt.savefig(target, transparent=True, format=ext, bbox_inches="tight")
+        )
     if view:
         plt.show()
     plt.close()
@@ -600,6 +1275,256 @@ def disthist(
 #    plt.show()
 
 
+# mouseover for threads() image: tier by y, then nearest hotspot by x bisection
+_thread_hittester = """<SCRIPT>
+(function() {
+  var img = document.getElementById("%s");
+  var T = %s;
+  img.addEventListener("mousemove", function(ev) {
+    var box = img.getBoundingClientRect(), scale = T.img[0] / box.width;
+    var x = (ev.clientX - box.left) * scale, y = (ev.clientY - box.top) * scale;
+    for (var t = 0; t < T.tier.length; t++) {
+      if (Math.abs(y - T.tier[t]) > T.half) continue;
+      var xs = T.x[t], lo = 0, hi = xs.length;
+      while (lo < hi) {
+        var mid = (lo + hi) >> 1;
+        if (xs[mid] < x) lo = mid + 1; else hi = mid;
+      }
+      var best = -1, dist = T.tol;
+      for (var i = lo - 1; i <= lo; i++) {
+        if (i >= 0 && i < xs.length && Math.abs(xs[i] - x) <= dist) { best = i; dist = Math.abs(xs[i] - x); }
+      }
+      if (best >= 0) {
+        var rxn = T.rxn[T.hit[t][best]], val = T.val[t][best];
+        mouseshow(rxn[0], rxn[1], (val < 0 ? "" : "+") + val.toFixed(2), rxn[2]);
+      }
+      return;
+    }
+  });
+})();
+</SCRIPT>
+"""
+
+
+def _thread_errors(data, Nweft):
+    """Returns array of reactions by tiers of the first *Nweft* values in
+    each ``rxn["data"]`` of *data*, NaN where None or where a reaction has
+    fewer values than tiers.
+
+    """
+    import numpy as np
+
+    errs = np.full((len(data), Nweft), np.nan)
+    for irxn, rxn in enumerate(data):
+        vals = rxn["data"][:Nweft]
+        errs[irxn, :len(vals)] = [np.nan if val is None else val for val in vals]
+    return errs
+
+
+def thread_hotspots(fig, ax, data, positions, lenS, tol=3):
+    """Returns hover index for the tight-bbox image saved from *fig* by
+    :py:func:`threads`, whose *ax* has reactions *data* on tiers at
+    *positions* with slat half-length *lenS*. All (value, tier) points
+    within the x-limits are taken to pixels in one ``ax.transData.transform``
+    and reduced to one per pixel column per tier, the largest absolute
+    value winning.
+    Keys of the dictionary are ``img`` pixel [width, height], ``tier``
+    pixel heights, ``half`` slat half-height and ``tol`` hit tolerance in
+    pixels, then per tier pixel ``x`` sorted, reaction index ``hit`` and
+    value ``val``, and ``rxn`` [db, sys, show] per reaction.
+
+    """
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    Nweft = len(positions)
+    errs = _thread_errors(data, Nweft)
+
+    # pixel frame of saved image: savefig dpi and padded tight bbox, y down
+    dpi = plt.rcParams["savefig.dpi"]
+    dpi = fig.dpi if dpi == "figure" else dpi
+    pad = plt.rcParams["savefig.pad_inches"]
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(pad)
+
+    def to_pixels(xy):
+        xy = ax.transData.transform(xy) / fig.dpi
+        return np.column_stack([(xy[:, 0] - bbox.x0) * dpi, (bbox.y1 - xy[:, 1]) * dpi])
+
+    xlo, xhi = ax.get_xlim()
+    with np.errstate(invalid="ignore"):
+        rxnidx, tier = np.nonzero((errs >= xlo) & (errs <= xhi))
+    vals = errs[rxnidx, tier]
+    xpix = to_pixels(np.column_stack([vals, np.asarray(positions, dtype=float)[tier]]))[:, 0]
+    tierpix = to_pixels(np.column_stack([np.zeros(Nweft), np.asarray(positions, dtype=float)]))[:, 1]
+    half = np.ptp(to_pixels(np.array([[0.0, 0.0], [0.0, lenS]]))[:, 1])
+
+    # pixel-grid hash: first of each (tier, pixel column) after ordering by |value|
+    order = np.argsort(-np.abs(vals), kind="stable")
+    key = tier[order] * (int(bbox.width * dpi) + 2) + np.rint(xpix[order]).astype(int)
+    keep = order[np.unique(key, return_index=True)[1]]
+    keep = keep[np.lexsort((xpix[keep], tier[keep]))]
+
+    hotspots = {
+        "img": [int(round(bbox.width * dpi)), int(round(bbox.height * dpi))],
+        "tier": [round(float(y), 1) for y in tierpix],
+        "half": round(float(half), 1),
+        "tol": tol,
+        "x": [],
+        "hit": [],
+        "val": [],
+        "rxn": [[rxn.get("db", ""), rxn["sys"], rxn.get("show", "")] for rxn in data],
+    }
+    for weft in range(Nweft):
+        sel = keep[tier[keep] == weft]
+        hotspots["x"].append(np.round(xpix[sel], 1).tolist())
+        hotspots["hit"].append(rxnidx[sel].tolist())
+        hotspots["val"].append(np.round(vals[sel], 4).tolist())
+    return hotspots
+
+
+def place_labels(labels, charwidth, lanes=4, seed=0):
+    """Returns subset of *labels*, a list of (x-position, text), that fit
+    without overlap into *lanes* rows, each paired with its lane index.
+    Every text spans its length times *charwidth* around its position.
+    Labels are taken greedily in order of decreasing ``abs(x-position)``
+    (outliers first) and put in the first free lane of a rotation started
+    at a lane drawn from a generator seeded by *seed*, so placement looks
+    jittered but is reproducible. Labels finding every lane occupied are
+    dropped. Intervals are ranked by start once; each lane marks its
+    occupied ranks in a Fenwick tree, so the two neighbors checked for
+    overlap are found, and a placement recorded, in O(log n).
+
+    """
+    import random
+
+    rng = random.Random(seed)
+    spans = []
+    for posn, text in labels:
+        half = 0.5 * charwidth * (len(str(text)) + 1)
+        spans.append((posn - half, posn + half))
+    nlbl = len(labels)
+    byrank = sorted(range(nlbl), key=lambda idx: spans[idx][0])
+    rank = [0] * nlbl
+    for rnk, idx in enumerate(byrank, start=1):
+        rank[idx] = rnk
+    trees = [[0] * (nlbl + 1) for lane in range(lanes)]
+    filled = [0] * lanes
+    top = 1 << max(nlbl.bit_length() - 1, 0)
+
+    def mark(tree, rnk):
+        while rnk <= nlbl:
+            tree[rnk] += 1
+            rnk += rnk & -rnk
+
+    def count(tree, rnk):
+        total = 0
+        while rnk > 0:
+            total += tree[rnk]
+            rnk -= rnk & -rnk
+        return total
+
+    def kth(tree, k):
+        # label index of the k-th occupied rank
+        pos = 0
+        step = top
+        while step:
+            if pos + step <= nlbl and tree[pos + step] < k:
+                pos += step
+                k -= tree[pos]
+            step >>= 1
+        return byrank[pos]
+
+    placed = []
+    order = sorted(range(nlbl), key=lambda idx: -abs(labels[idx][0]))
+    for idx in order:
+        lo, hi = spans[idx]
+        first = rng.randrange(lanes)
+        for step in range(lanes):
+            lane = (first + step) % lanes
+            tree = trees[lane]
+            before = count(tree, rank[idx] - 1)
+            if before and spans[kth(tree, before)][1] > lo:
+                continue
+            if before < filled[lane] and spans[kth(tree, before + 1)][0] < hi:
+                continue
+            mark(tree, rank[idx])
+            filled[lane] += 1
+            placed.append((idx, lane))
+            break
+
+    return [(labels[idx], lane) for idx, lane in sorted(placed)]
+
+
+def _thread_density(ax, errs, rgba, positions, lenS, gapT, xlimitleft, xlimit, bins, rows=48):
+    """Draws onto *ax* the density rasters for :py:func:`threads` from array
+    *errs* (reactions by tiers, NaN where missing) histogrammed into *bins*
+    between *xlimitleft* and *xlimit*. Each transition band is *rows* tall.
+    Pixels take the count-weighted mean of the reactions' colors *rgba*
+    (N, 4), as from :py:func:`segment_colors`, and opacity from the count.
+
+    """
+    import numpy as np
+
+    Nweft = errs.shape[1]
+
+    # bin index per error, -1 where missing or off the plot
+    with np.errstate(invalid="ignore"):
+        idxs = np.floor((errs - xlimitleft) / (xlimit - xlimitleft) * bins)
+    idxs[errs == xlimit] = bins - 1
+    idxs[np.isnan(idxs) | (idxs < 0) | (idxs >= bins)] = -1
+    idxs = idxs.astype(int)
+
+    # weights per reaction: a count, then its red, green and blue
+    weights = np.column_stack([np.ones(len(errs)), np.asarray(rgba, dtype=float).reshape(-1, 4)[:, :3]])
+
+    # slats: 1D histogram per tier
+    slats = np.zeros((4, Nweft, bins))
+    for weft in range(Nweft):
+        col = idxs[:, weft]
+        for chan in range(4):
+            slats[chan, weft] = np.bincount(col[col >= 0], weights=weights[col >= 0, chan], minlength=bins)
+
+    # threads: 2D histogram per transition, swept across the band row by row
+    sweep = (np.arange(rows) + 0.5) / rows
+    upper, lower = np.meshgrid(np.arange(bins), np.arange(bins), indexing="ij")
+    bands = np.zeros((4, max(Nweft - 1, 0), rows, bins))
+    for weft in range(Nweft - 1):
+        both = (idxs[:, weft] >= 0) & (idxs[:, weft + 1] >= 0)
+        pairidx = idxs[both, weft] * bins + idxs[both, weft + 1]
+        pairs = [np.bincount(pairidx, weights=weights[both, chan], minlength=bins * bins) for chan in range(4)]
+        occupied = pairs[0] > 0
+        for row, frac in enumerate(sweep):
+            posn = np.rint((1.0 - frac) * upper.ravel()[occupied] + frac * lower.ravel()[occupied]).astype(int)
+            for chan in range(4):
+                bands[chan, weft, row] = np.bincount(posn, weights=pairs[chan][occupied], minlength=bins)
+
+    def raster(sums, peak, top, bottom):
+        counts = sums[0]
+        image = np.zeros(counts.shape + (4,))
+        if peak > 0:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                for chan in range(3):
+                    image[..., chan] = np.where(counts > 0, sums[chan + 1] / counts, 0.0)
+            image[..., 3] = np.sqrt(counts / peak)
+        ax.imshow(
+            np.clip(image, 0.0, 1.0),
+            extent=[xlimitleft, xlimit, bottom, top],
+            aspect="auto",
+            interpolation="nearest",
+            origin="upper",
+        )
+
+    for weft in range(Nweft):
+        raster(slats[:, weft, np.newaxis, :], slats[0].max(), positions[weft] + lenS, positions[weft] - lenS)
+    for weft in range(Nweft - 1):
+        raster(
+            bands[:, weft],
+            bands[0].max(),
+            positions[weft] - lenS - gapT,
+            positions[weft + 1] + lenS + gapT,
+        )
+
+
 def threads(
     data,
     labels,
@@ -617,9 +1542,16 @@ def threads(
     mousediv=None,
     labeled=True,
     view=True,
+    density=False,
+    bins=200,
+    outliers=0,
+    seed=0,
     saveas=None,
     relpath=False,
     graphicsformat=["pdf"],
+    rasterize=None,
+    rasterdpi=300,
+    sink=None,
 ):
     """Generates a tiered slat diagram between model chemistries with
     errors (or simply values) in list *data*, which is supplied as part of the
@@ -632,9 +1564,22 @@ def threads(
     HTML code for mouseover if mousetext or mouselink or mouseimag specified
     based on recipe of Andrew Dalke from
     http://www.dalkescientific.com/writings/diary/archive/2005/04/24/interactive_html.html
+    If *density*, individual reactions are replaced by intensity rasters
+    of *bins* across the x-range: a histogram of errors for each tier and
+    a histogram of (upper, lower) error pairs for each transition, drawn
+    as straight-line interpolation between tiers, with opacity following
+    count and color the count-weighted mean of the reactions' colors as
+    for the threads. Only the *outliers* reactions of largest absolute error are then
+    drawn (and labeled) as threads, so render time and file size do not
+    grow with the size of *data*.
+    Reaction labels are placed by :py:func:`place_labels` with *seed*, so
+    output is reproducible; labels that find no room are dropped, smallest
+    error first. Reactions with fewer values than tiers are taken as missing
+    on the last tiers. Slats and threads are rasterized in vector formats per
+    *rasterize* and *rasterdpi* as in :py:func:`save_layered`. With
+    *sink*, outputs are bytes kept in memory per :py:func:`save_output`.
 
     """
-    import random
     import hashlib
     import matplotlib.pyplot as plt
     import numpy as np  # only needed for missing data with mouseiness
@@ -652,7 +1597,6 @@ def threads(
         posnT.extend(
             [positions[weft] - lenS - gapT, positions[weft + 1] + lenS + gapT, None]
         )
-    posnM = []
     if xlimitleft is None:
         xlimitleft = -1 * xlimit
     xrange = xlimit - xlimitleft
@@ -701,12 +1645,24 @@ def threads(
                 fontsize=18,
             )
 
-    # plot reaction errors and threads
-    for rxn in data:
+    # plot reaction error densities
+    if density:
+        errs = _thread_errors(data, Nweft)
+        rgba = segment_colors(color, [rxn.get("color") for rxn in data])
+        _thread_density(ax, errs, rgba, positions, lenS, gapT, xlimitleft, xlimit, bins)
 
-        # preparation
-        xvals = rxn["data"]
-        clr = segment_color(color, rxn["color"] if "color" in rxn else None)
+        worst = np.abs(np.where(np.isnan(errs), 0.0, errs)).max(axis=1)
+        data = [data[idx] for idx in sorted(np.argsort(-worst, kind="stable")[:outliers])]
+
+    # plot reaction errors and threads
+    layers = []
+    toplbls = []
+    botlbls = []
+    clrs = segment_colors(color, [rxn.get("color") for rxn in data])
+    for rxn, clr in zip(data, clrs):
+
+        # preparation, reactions short of Nweft values missing on the last tiers
+        xvals = list(rxn["data"][:Nweft]) + [None] * (Nweft - len(rxn["data"]))
         slat = []
         for weft in range(Nweft):
             slat.extend([xvals[weft], xvals[weft], None])
@@ -716,7 +1672,7 @@ def threads(
 
         # plotting
         if Nweft == 1:
-            ax.plot(
+            layers += ax.plot(
                 slat,
                 posnS,
                 "|",
@@ -726,48 +1682,36 @@ def threads(
                 solid_capstyle="round",
             )
         else:
-            ax.plot(slat, posnS, color=clr, linewidth=1.0, solid_capstyle="round")
-        ax.plot(
+            layers += ax.plot(slat, posnS, color=clr, linewidth=1.0, solid_capstyle="round")
+        layers += ax.plot(
             thread, posnT, color=clr, linewidth=0.5, solid_capstyle="round", alpha=0.3
         )
 
-        # converting into screen coordinates for image map
-        # block not working for py3 or up-to-date mpl. better ways for html image map nowadays
-        # npxvals = [np.nan if val is None else val for val in xvals]
-        # xyscreen = ax.transData.transform(zip(npxvals, positions))
-        # xscreen, yscreen = zip(*xyscreen)
-        # posnM.extend(zip([rxn['db']] * Nweft, [rxn['sys']] * Nweft,
-        #    npxvals, [rxn['show']] * Nweft, xscreen, yscreen))
-
-        # labeling
-        if not (mousetext or mouselink or mouseimag):
-            if labeled and len(data) < 200:
-                try:
-                    toplblposn = next(item for item in xvals if item is not None)
-                    botlblposn = next(
-                        item for item in reversed(xvals) if item is not None
-                    )
-                except StopIteration:
-                    pass
-                else:
-                    ax.text(
-                        toplblposn,
-                        -0.75 + 0.6 * random.random(),
-                        rxn["sys"],
-                        verticalalignment="bottom",
-                        horizontalalignment="center",
-                        family="Times New Roman",
-                        fontsize=8,
-                    )
-                    ax.text(
-                        botlblposn,
-                        -1 * Nweft - 0.75 + 0.6 * random.random(),
-                        rxn["sys"],
-                        verticalalignment="bottom",
-                        horizontalalignment="center",
-                        family="Times New Roman",
-                        fontsize=8,
-                    )
+        # labeling candidates at first and last available tier
+        try:
+            toplblposn = next(item for item in xvals if item is not None)
+            botlblposn = next(item for item in reversed(xvals) if item is not None)
+        except StopIteration:
+            pass
+        else:
+            toplbls.append((toplblposn, rxn["sys"]))
+            botlbls.append((botlblposn, rxn["sys"]))
+
+    # labeling, placed without overlap in lanes above and below the tiers
+    if labeled and not (mousetext or mouselink or mouseimag):
+        # width per character of 8pt label, in data units
+        charwidth = 4.4 * xrange / (72 * fig.get_figwidth() * 0.98)
+        for lbls, base in ((toplbls, -0.75), (botlbls, -1 * Nweft - 0.75)):
+            for (lblposn, lbl), lane in place_labels(lbls, charwidth, lanes=4, seed=seed):
+                ax.text(
+                    lblposn,
+                    base + 0.15 * lane,
+                    lbl,
+                    verticalalignment="bottom",
+                    horizontalalignment="center",
+                    family="Times New Roman",
+                    fontsize=8,
+                )
 
     # plot trimmings
     if mae is not None:
@@ -786,11 +1730,17 @@ def threads(
         + hashlib.sha1((title + repr(labels) + repr(xlimit)).encode()).hexdigest()
     )
     pltfile = expand_saveas(saveas, pltuid, def_prefix="thread_", relpath=relpath)
-    files_saved = {}
-    for ext in graphicsformat:
-        savefile = pltfile + "." + ext.lower()
-        plt.savefig(savefile, transparent=True, format=ext, bbox_inches="tight")
-        files_saved[ext.lower()] = savefile
+    files_saved = save_layered(
+        pltfile,
+        graphicsformat,
+        layers,
+        rasterize=rasterize,
+        rasterdpi=rasterdpi,
+        merge=True,
+        sink=sink,
+        transparent=True,
+        bbox_inches="tight",
+    )
     if view:
         plt.show()
 
@@ -798,10 +1748,6 @@ def threads(
         plt.close()
         return files_saved, None
     else:
-        dpi = 80
-        img_width = fig.get_figwidth() * dpi
-        img_height = fig.get_figheight() * dpi
-
         htmlcode = """<SCRIPT>\n"""
         htmlcode += """function mouseshow(db, rxn, val, show) {\n"""
         if mousetext or mouselink:
@@ -827,48 +1773,15 @@ def threads(
             htmlcode += """</div>"""
         if mousediv:
             htmlcode += """%s\n""" % (mousediv[1])
-        # htmlcode += """<IMG SRC="%s" ismap usemap="#points" WIDTH="%d" HEIGHT="%d">\n""" % \
-        #    (pltfile + '.png', img_width, img_height)
-        htmlcode += """<IMG SRC="%s" ismap usemap="#points" WIDTH="%d">\n""" % (
+
+        hotspots = thread_hotspots(fig, ax, data, positions, lenS)
+        imgid = "threads_" + pltuid[-12:]
+        htmlcode += """<IMG ID="%s" SRC="%s" WIDTH="%d">\n""" % (
+            imgid,
             pltfile + ".png",
-            img_width,
+            hotspots["img"][0],
         )
-        htmlcode += """<MAP name="points">\n"""
-
-        # generating html image map code
-        #   points sorted to avoid overlapping map areas that can overwhelm html for SSI
-        #   y=0 on top for html and on bottom for mpl, so flip the numbers
-        posnM.sort(key=lambda tup: tup[2])
-        posnM.sort(key=lambda tup: tup[3])
-        last = (0, 0)
-        for dbse, rxn, val, show, x, y in posnM:
-            if val is None or val is np.nan:
-                continue
-
-            now = (int(x), int(y))
-            if now == last:
-                htmlcode += """<!-- map overlap! %s-%s %+.2f skipped -->\n""" % (
-                    dbse,
-                    rxn,
-                    val,
-                )
-            else:
-                htmlcode += (
-                    """<AREA shape="rect" coords="%d,%d,%d,%d" onmouseover="javascript:mouseshow('%s', '%s', '%+.2f', '%s');">\n"""
-                    % (
-                        x - 2,
-                        img_height - y - 20,
-                        x + 2,
-                        img_height - y + 20,
-                        dbse,
-                        rxn,
-                        val,
-                        show,
-                    )
-                )
-                last = now
-
-        htmlcode += """</MAP>\n"""
+        htmlcode += _thread_hittester % (imgid, json.dumps(hotspots, separators=(",", ":")))
 
         plt.close()
         return files_saved, htmlcode
@@ -883,10 +1796,24 @@ def ternary(
     relpath=False,
     graphicsformat=["pdf"],
     return_values=False,
+    rasterize=None,
+    rasterdpi=300,
+    density=None,
+    errors=None,
+    gridsize=40,
+    cache=False,
+    sink=None,
 ):
     """Takes array of arrays *sapt* in form [elst, indc, disp] and builds formatted
     two-triangle ternary diagrams. Either fully-readable or dotsonly depending
-    on *labeled*. Saves in formats *graphicsformat*.
+    on *labeled*. Saves in formats *graphicsformat*. Dots are rasterized in
+    vector formats per *rasterize* and *rasterdpi* as in :py:func:`save_layered`.
+    If *density* is 'count', systems are instead binned into hexagons,
+    *gridsize* across, over both triangles and colored by (log) count; if
+    'error', colored by mean of the per-system *errors*. If *cache* (and
+    not *density*), the decorated figure is kept for later calls with the
+    same *labeled*, and not shown, per :py:func:`save_blitted`. With *sink*,
+    outputs are bytes kept in memory per :py:func:`save_output`.
 
     """
     import hashlib
@@ -896,138 +1823,174 @@ def ternary(
     from matplotlib.path import Path
     import matplotlib.patches as patches
 
+    if density not in (None, "count", "error"):
+        raise ValueError("""Unknown density '%s'; use None, 'count' or 'error'.""" % (density))
+    if density == "error":
+        if errors is None:
+            raise ValueError("""density='error' needs argument 'errors', one error per system in 'sapt'.""")
+        if len(errors) != len(sapt):
+            raise ValueError("""Argument 'errors' has %d entries for %d systems in 'sapt'.""" % (len(errors), len(sapt)))
+
     # initialize plot
-    fig, ax = plt.subplots(figsize=(6, 3.6))
-    plt.xlim([-0.75, 1.25])
-    plt.ylim([-0.18, 1.02])
-    plt.xticks([])
-    plt.yticks([])
-    ax.set_aspect("equal")
+    def decorate():
+        fig, ax = plt.subplots(figsize=(6, 3.6))
+        plt.xlim([-0.75, 1.25])
+        plt.ylim([-0.18, 1.02])
+        plt.xticks([])
+        plt.yticks([])
+        ax.set_aspect("equal")
+
+        if labeled:
+            # form and color ternary triangles
+            codes = [Path.MOVETO, Path.LINETO, Path.LINETO, Path.CLOSEPOLY]
+            pathPos = Path([(0.0, 0.0), (1.0, 0.0), (0.5, 0.866), (0.0, 0.0)], codes)
+            pathNeg = Path([(0.0, 0.0), (-0.5, 0.866), (0.5, 0.866), (0.0, 0.0)], codes)
+            ax.add_patch(patches.PathPatch(pathPos, facecolor="white", lw=2))
+            ax.add_patch(patches.PathPatch(pathNeg, facecolor="#fff5ee", lw=2))
+
+            # form and color HB/MX/DD dividing lines
+            ax.plot([0.667, 0.5], [0.0, 0.866], color="#eeb4b4", lw=0.5)
+            ax.plot([-0.333, 0.5], [0.577, 0.866], color="#eeb4b4", lw=0.5)
+            ax.plot([0.333, 0.5], [0.0, 0.866], color="#7ec0ee", lw=0.5)
+            ax.plot([-0.167, 0.5], [0.289, 0.866], color="#7ec0ee", lw=0.5)
+
+            # label corners
+            ax.text(
+                1.0,
+                -0.15,
+                "Elst (\u2212)",
+                verticalalignment="bottom",
+                horizontalalignment="center",
+                family="Times New Roman",
+                weight="bold",
+                fontsize=18,
+            )
+            ax.text(
+                0.5,
+                0.9,
+                "Ind (\u2212)",
+                verticalalignment="bottom",
+                horizontalalignment="center",
+                family="Times New Roman",
+                weight="bold",
+                fontsize=18,
+            )
+            ax.text(
+                0.0,
+                -0.15,
+                "Disp (\u2212)",
+                verticalalignment="bottom",
+                horizontalalignment="center",
+                family="Times New Roman",
+                weight="bold",
+                fontsize=18,
+            )
+            ax.text(
+                -0.5,
+                0.9,
+                "Elst (+)",
+                verticalalignment="bottom",
+                horizontalalignment="center",
+                family="Times New Roman",
+                weight="bold",
+                fontsize=18,
+            )
 
-    if labeled:
-        # form and color ternary triangles
-        codes = [Path.MOVETO, Path.LINETO, Path.LINETO, Path.CLOSEPOLY]
-        pathPos = Path([(0.0, 0.0), (1.0, 0.0), (0.5, 0.866), (0.0, 0.0)], codes)
-        pathNeg = Path([(0.0, 0.0), (-0.5, 0.866), (0.5, 0.866), (0.0, 0.0)], codes)
-        ax.add_patch(patches.PathPatch(pathPos, facecolor="white", lw=2))
-        ax.add_patch(patches.PathPatch(pathNeg, facecolor="#fff5ee", lw=2))
-
-        # form and color HB/MX/DD dividing lines
-        ax.plot([0.667, 0.5], [0.0, 0.866], color="#eeb4b4", lw=0.5)
-        ax.plot([-0.333, 0.5], [0.577, 0.866], color="#eeb4b4", lw=0.5)
-        ax.plot([0.333, 0.5], [0.0, 0.866], color="#7ec0ee", lw=0.5)
-        ax.plot([-0.167, 0.5], [0.289, 0.866], color="#7ec0ee", lw=0.5)
-
-        # label corners
-        ax.text(
-            1.0,
-            -0.15,
-            "Elst (\u2212)",
-            verticalalignment="bottom",
-            horizontalalignment="center",
-            family="Times New Roman",
-            weight="bold",
-            fontsize=18,
-        )
-        ax.text(
-            0.5,
-            0.9,
-            "Ind (\u2212)",
-            verticalalignment="bottom",
-            horizontalalignment="center",
-            family="Times New Roman",
-            weight="bold",
-            fontsize=18,
-        )
-        ax.text(
-            0.0,
-            -0.15,
-            "Disp (\u2212)",
-            verticalalignment="bottom",
-            horizontalalignment="center",
-            family="Times New Roman",
-            weight="bold",
-            fontsize=18,
+        # remove figure outline
+        ax.spines["top"].set_visible(False)
+        ax.spines["right"].set_visible(False)
+        ax.spines["bottom"].set_visible(False)
+        ax.spines["left"].set_visible(False)
+        return fig, ax
+
+    if cache and density is None:
+        backdrop = _backdrop(("ternary", labeled), decorate, 450)
+        fig, ax = backdrop["fig"], backdrop["ax"]
+    else:
+        cache = False
+        fig, ax = decorate()
+
+    # calc ternary posn and color
+    elst, indc, disp = np.asarray(sapt, dtype=float).reshape(-1, 3).T
+    Ftop = np.abs(indc) / (np.abs(elst) + np.abs(indc) + np.abs(disp))
+    Fright = np.abs(elst) / (np.abs(elst) + np.abs(indc) + np.abs(disp))
+    xvals = 0.5 * Ftop + Fright
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cvals = 0.5 + (xvals - 0.5) / (1.0 - Ftop)
+    yvals = 0.866 * Ftop
+    xvals = np.where(elst > 0.0, 0.5 * (Ftop - Fright), xvals)
+    yvals = np.where(elst > 0.0, 0.866 * (Ftop + Fright), yvals)
+
+    if density is None:
+        sc = ax.scatter(
+            xvals,
+            yvals,
+            c=cvals,
+            s=15,
+            marker="o",
+            cmap=mpl.cm.jet,
+            edgecolor="none",
+            vmin=0,
+            vmax=1,
+            zorder=10,
         )
-        ax.text(
-            -0.5,
-            0.9,
-            "Elst (+)",
-            verticalalignment="bottom",
-            horizontalalignment="center",
-            family="Times New Roman",
-            weight="bold",
-            fontsize=18,
+    else:
+        if density == "error":
+            binning = {"C": np.asarray(errors, dtype=float), "reduce_C_function": np.nanmean, "cmap": mpl.cm.PRGn}
+            cbtitle = "Mean Error"
+        else:
+            binning = {"bins": "log", "cmap": mpl.cm.viridis}
+            cbtitle = "Count"
+        sc = ax.hexbin(
+            xvals,
+            yvals,
+            gridsize=gridsize,
+            extent=(-0.5, 1.0, 0.0, 0.866),
+            mincnt=1,
+            linewidths=0.0,
+            zorder=1.5,
+            **binning,
         )
-
-    xvals = []
-    yvals = []
-    cvals = []
-    for sys in sapt:
-        [elst, indc, disp] = sys
-
-        # calc ternary posn and color
-        Ftop = abs(indc) / (abs(elst) + abs(indc) + abs(disp))
-        Fright = abs(elst) / (abs(elst) + abs(indc) + abs(disp))
-        xdot = 0.5 * Ftop + Fright
-        ydot = 0.866 * Ftop
-        cdot = 0.5 + (xdot - 0.5) / (1.0 - Ftop)
-        if elst > 0.0:
-            xdot = 0.5 * (Ftop - Fright)
-            ydot = 0.866 * (Ftop + Fright)
-        # print elst, indc, disp, '', xdot, ydot, cdot
-
-        xvals.append(xdot)
-        yvals.append(ydot)
-        cvals.append(cdot)
-
-    sc = ax.scatter(
-        xvals,
-        yvals,
-        c=cvals,
-        s=15,
-        marker="o",
-        cmap=mpl.cm.jet,
-        edgecolor="none",
-        vmin=0,
-        vmax=1,
-        zorder=10,
-    )
-
-    # remove figure outline
-    ax.spines["top"].set_visible(False)
-    ax.spines["right"].set_visible(False)
-    ax.spines["bottom"].set_visible(False)
-    ax.spines["left"].set_visible(False)
+        if density == "error":
+            # center the diverging map on zero error
+            means = np.ma.filled(sc.get_array(), np.nan)
+            vlimit = np.nanmax(np.abs(means)) if np.isfinite(means).any() else 1.0
+            sc.set_clim(-vlimit, vlimit)
+        # above triangle fill, below dividers; trim bins overhanging the two triangles
+        outline = Path([(0.0, 0.0), (1.0, 0.0), (0.5, 0.866), (-0.5, 0.866), (0.0, 0.0)], closed=True)
+        sc.set_clip_path(outline, ax.transData)
+        fig.colorbar(sc, ax=ax, shrink=0.6, pad=0.0, label=cbtitle)
 
     # save and show
     pltuid = (
         title
         + "_"
         + ("lbld" if labeled else "bare")
+        + ("" if density is None else "_" + density)
         + "_"
         + hashlib.sha1((title + repr(sapt)).encode()).hexdigest()
     )
     pltfile = expand_saveas(saveas, pltuid, def_prefix="tern_", relpath=relpath)
-    files_saved = {}
-    for ext in graphicsformat:
-        savefile = pltfile + "." + ext.lower()
-        plt.savefig(
-            savefile,
-            transparent=True,
-            format=ext,
-            bbox_inches="tight",
-            # frameon=False,
-            dpi=450,
-            edgecolor="none",
-            pad_inches=0.0,
-        )
-        files_saved[ext.lower()] = savefile
-    if view:
-        plt.show()
-    plt.close()
+    saving = dict(
+        sink=sink,
+        rasterize=rasterize,
+        rasterdpi=rasterdpi,
+        transparent=True,
+        bbox_inches="tight",
+        # frameon=False,
+        dpi=450,
+        edgecolor="none",
+        pad_inches=0.0,
+    )
+    if cache:
+        files_saved = save_blitted(backdrop, pltfile, graphicsformat, [sc], [sc], **saving)
+    else:
+        files_saved = save_layered(pltfile, graphicsformat, [sc], **saving)
+        if view:
+            plt.show()
+        plt.close()
     if return_values:
-        return files_saved, xvals, yvals, cvals
+        return files_saved, xvals.tolist(), yvals.tolist(), cvals.tolist()
     return files_saved
 
 
@@ -1160,12 +2123,22 @@ def iowa(
     saveas=None,
     relpath=False,
     graphicsformat=["pdf"],
+    rasterize=None,
+    sink=None,
 ):
     """Saves a plot with (extensionless) name *pltfile* with an Iowa
     representation of the modelchems errors in *mcdat* for BBI/SSI-style
-    *labels*.
+    *labels*. If *rasterize*, or if None and the tiles hold more than
+    *raster_threshold* cells, tiles are drawn as images at their native
+    resolution. With *rasterize* 'report', the tiles are also rendered as
+    vector cells in memory for comparison and key ``raster`` of the
+    returned dictionary is as from :py:func:`save_layered`, with ``dpi``
+    the effective resolution of the finest tile image on the page. With
+    *sink*, outputs are bytes kept in memory per :py:func:`save_output`.
 
     """
+    import io
+    import time
     import numpy as np
     import hashlib
     import matplotlib
@@ -1219,17 +2192,27 @@ def iowa(
     # nill spacing between 20x20 heatmaps
     plt.subplots_adjust(hspace=0.001, wspace=0.001)
 
-    index = 1
-    for aa1 in aa:
-        for aa2 in aa:
-            cb = composition_tile(err, aa1, aa2)
+    # tiles are pixel grids already, so rasterized ones are drawn as images at
+    #   native resolution rather than through one mixed-mode bitmap per axes
+    tiles = [composition_tile(err, aa1, aa2) for aa1 in aa for aa2 in aa]
+    ncells = sum(cb.size for cb in tiles)
+    if rasterize is None:
+        rasterize = ncells > raster_threshold
 
-            ax = matplotlib.axes.Subplot(fig, len(aa), len(aa), index)
-            fig.add_subplot(ax)
-            heatmap = ax.pcolor(cb, vmin=-xlimit, vmax=xlimit, cmap=plt.cm.PRGn)
-            ax.set_xticks([])
-            ax.set_yticks([])
-            index += 1
+    index = 1
+    axes = []
+    for cb in tiles:
+        ax = matplotlib.axes.Subplot(fig, len(aa), len(aa), index)
+        fig.add_subplot(ax)
+        axes.append(ax)
+        if rasterize:
+            ax.imshow(cb, vmin=-xlimit, vmax=xlimit, cmap=plt.cm.PRGn,
+                      origin="lower", aspect="auto", interpolation="nearest")
+        else:
+            ax.pcolor(cb, vmin=-xlimit, vmax=xlimit, cmap=plt.cm.PRGn)
+        ax.set_xticks([])
+        ax.set_yticks([])
+        index += 1
 
     # plt.title(title)
     axt.axvline(x=4.8, linewidth=5, color="k")
@@ -1243,12 +2226,51 @@ def iowa(
     # save and show
     pltuid = title + "_" + hashlib.sha1((title + str(xlimit)).encode()).hexdigest()
     pltfile = expand_saveas(saveas, pltuid, def_prefix="iowa_", relpath=relpath)
+    raster = None
+    if rasterize:
+        # image pixels per inch of tile, finest tile governing
+        figw, figh = fig.get_size_inches()
+        dpi = max(
+            max(cb.shape[1] / (ax.get_position().width * figw), cb.shape[0] / (ax.get_position().height * figh))
+            for cb, ax in zip(tiles, axes)
+        )
+        raster = {"points": ncells, "dpi": int(round(dpi))}
+
     files_saved = {}
     for ext in graphicsformat:
-        savefile = pltfile + "." + ext.lower()
-        plt.savefig(savefile, transparent=True, format=ext, bbox_inches="tight")
-        # plt.savefig(savefile, transparent=False, format=ext, bbox_inches='tight')  # for quick nolabel, whiteback
-        files_saved[ext.lower()] = savefile
+        start = time.perf_counter()
+        files_saved.update(save_layered(
+            pltfile,
+            [ext],
+            [],
+            rasterize=False,
+            sink=sink,
+            transparent=True,
+            bbox_inches="tight",
+            # transparent=False,  # for quick nolabel, whiteback
+        ))
+        if raster is not None and ext.lower() in _vector_formats:
+            saved = files_saved[ext.lower()]
+            raster[ext.lower()] = {
+                "bytes": os.path.getsize(saved) if sink is None else len(saved),
+                "seconds": time.perf_counter() - start,
+            }
+
+    if rasterize == "report":
+        # same tiles as vector cells, rendered in memory to compare against
+        for cb, ax in zip(tiles, axes):
+            ax.images[0].remove()
+            ax.pcolor(cb, vmin=-xlimit, vmax=xlimit, cmap=plt.cm.PRGn)
+            ax.set_xlim(0, cb.shape[1])
+            ax.set_ylim(0, cb.shape[0])
+        for ext in graphicsformat:
+            if ext.lower() in _vector_formats:
+                buf = io.BytesIO()
+                start = time.perf_counter()
+                plt.savefig(buf, format=ext, transparent=True, bbox_inches="tight")
+                raster[ext.lower()]["vector_seconds"] = time.perf_counter() - start
+                raster[ext.lower()]["vector_bytes"] = len(buf.getvalue())
+        files_saved["raster"] = raster
     if view:
         plt.show()
     plt.close()
@@ -1263,8 +2285,16 @@ def liliowa(
     saveas=None,
     relpath=False,
     graphicsformat=["pdf"],
+    bundle=None,
+    sink=None,
 ):
-    """Saves a plot with a heatmap representation of *mcdat*."""
+    """Saves a plot with a heatmap representation of *mcdat*. If
+    :py:class:`FigureBundle` *bundle*, the plot is instead appended to it
+    as a page named for the file, and the dictionary returned holds its
+    ``pdf`` and ``page``. With *sink*, outputs are bytes kept in memory per
+    :py:func:`save_output`.
+
+    """
     import numpy as np
     import hashlib
     import matplotlib
@@ -1286,7 +2316,7 @@ def liliowa(
     axt.spines["bottom"].set_visible(False)
     axt.spines["left"].set_visible(False)
 
-    tiles = mcdat
+    tiles = list(mcdat)
     dim = int(np.ceil(np.sqrt(len(tiles))))
     pad = dim * dim - len(tiles)
     tiles += [0] * pad
@@ -1297,24 +2327,120 @@ def liliowa(
     # save and show
     pltuid = title + "_" + hashlib.sha1((title + str(xlimit)).encode()).hexdigest()
     pltfile = expand_saveas(saveas, pltuid, def_prefix="liliowa_", relpath=relpath)
-    files_saved = {}
-    for ext in graphicsformat:
-        savefile = pltfile + "." + ext.lower()
-        plt.savefig(
-            savefile,
-            transparent=True,
-            format=ext,
-            bbox_inches="tight",
-            # frameon=False,
-            pad_inches=0.0,
+    if bundle is not None:
+        files_saved = _save_bundled(
+            bundle, pltfile, [], transparent=True, bbox_inches="tight", pad_inches=0.0
         )
-        files_saved[ext.lower()] = savefile
+    else:
+        check_sink(sink, len(graphicsformat))
+        files_saved = {}
+        for ext in graphicsformat:
+            savefile = pltfile + "." + ext.lower()
+            files_saved[ext.lower()] = save_output(
+                sink,
+                savefile,
+                ext.lower(),
+                lambda target: plt.savefig(
+                    target,
+                    transparent=True,
+                    format=ext,
+                    bbox_inches="tight",
+                    # frameon=False,
+                    pad_inches=0.0,
+                ),
+            )
     if view:
         plt.show()
     plt.close()
     return files_saved
 
 
+def liliowa_atlas(
+    mcdats,
+    title="",
+    xlimit=2.0,
+    tilesize=72,
+    columns=None,
+    saveas=None,
+    relpath=False,
+    graphicsformat=["png", "pdf"],
+    sink=None,
+):
+    """Saves the heatmaps that :py:func:`liliowa` would draw for each
+    value of dictionary *mcdats* as *tilesize*-pixel square tiles packed
+    *columns* across (default nearly square) into one atlas image, along
+    with a 'json' manifest of ``tiles`` (key of *mcdats*: ``x``, ``y``,
+    ``width``, ``height`` in pixels from the top left) so consumers can
+    clip out tiles rather than open a file apiece. In vector formats a
+    tile is one inch square. Returns dictionary of saved files keyed by
+    format, or with *sink* of their bytes, kept in memory per
+    :py:func:`save_output`.
+
+    """
+    import json
+    import hashlib
+    import numpy as np
+    import matplotlib
+    import matplotlib.pyplot as plt
+
+    names = list(mcdats.keys())
+    ntile = len(names)
+    columns = columns or max(1, int(np.ceil(np.sqrt(ntile))))
+    rows = max(1, int(np.ceil(ntile / columns)))
+
+    # stack tiles zero-padded to their own square, as liliowa, within the largest
+    dims = np.array([int(np.ceil(np.sqrt(len(mcdats[nm])))) for nm in names] + [1] * (rows * columns - ntile))
+    big = dims.max()
+    stack = np.full((rows * columns, big, big), np.nan)
+    for itile, nm in enumerate(names):
+        vals = np.array([np.nan if v is None else v for v in mcdats[nm]], dtype=float)
+        block = np.zeros(dims[itile] * dims[itile])
+        block[: len(vals)] = vals
+        stack[itile, : dims[itile], : dims[itile]] = block.reshape(dims[itile], dims[itile])
+
+    # sample every tile onto its pixel grid, color, and lay out the grid at once
+    cells = (np.arange(tilesize)[None, :] * dims[:, None]) // tilesize
+    pixels = stack[np.arange(rows * columns)[:, None, None], cells[:, :, None], cells[:, None, :]]
+    rgba = plt.cm.PRGn(matplotlib.colors.Normalize(vmin=-xlimit, vmax=xlimit)(pixels))
+    rgba[np.isnan(pixels)] = 0.0
+    rgba[ntile:] = 0.0
+    atlas = rgba.reshape(rows, columns, tilesize, tilesize, 4).transpose(0, 2, 1, 3, 4)
+    atlas = atlas.reshape(rows * tilesize, columns * tilesize, 4)
+
+    manifest = {"tilesize": tilesize, "columns": columns, "rows": rows, "tiles": {}}
+    for itile, nm in enumerate(names):
+        manifest["tiles"][nm] = {
+            "x": (itile % columns) * tilesize,
+            "y": (itile // columns) * tilesize,
+            "width": tilesize,
+            "height": tilesize,
+        }
+
+    # save
+    pltuid = title + "_" + hashlib.sha1((title + str(xlimit) + "".join(names)).encode()).hexdigest()
+    pltfile = expand_saveas(saveas, pltuid, def_prefix="liliowa_atlas_", relpath=relpath)
+    def draw(target, ext):
+        if ext == "png":
+            plt.imsave(target, atlas, format="png")
+        else:
+            fig = plt.figure(figsize=(columns, rows), dpi=tilesize)
+            ax = fig.add_axes([0, 0, 1, 1])
+            ax.set_axis_off()
+            ax.imshow(atlas, interpolation="nearest", aspect="auto")
+            fig.savefig(target, transparent=True, format=ext, dpi=tilesize)
+            plt.close(fig)
+
+    check_sink(sink, len(graphicsformat) + 1)
+    files_saved = {}
+    for ext in graphicsformat:
+        savefile = pltfile + "." + ext.lower()
+        files_saved[ext.lower()] = save_output(sink, savefile, ext.lower(), lambda target: draw(target, ext.lower()))
+    manifest["image"] = {ext.lower(): os.path.basename(pltfile) + "." + ext.lower() for ext in graphicsformat}
+    text = json.dumps(manifest, indent=1)
+    files_saved["json"] = save_output(sink, pltfile + ".json", "json", lambda target: _write_text(target, text))
+    return files_saved
+
+
 if __name__ == "__main__":
 
     merge_dats = [
@@ -1808,8 +2934,10 @@ if __name__ == "__main__":
         0.69,
     ]
     liliowa(figs, saveas="SSI-default-MP2-CP-aqz", xlimit=1.0, view=False)
+    liliowa_atlas({"MP2": figs, "MP2-half": figs[::2]}, title="SSI", xlimit=1.0)
 
     disthist(lin_dats, view=False)
+    disthist({"MP2": lin_dats, "SCS-MP2": [0.1, -0.2, 0.3, 0.4, -0.6]}, title="Methods", view=False, kde=True)
 
     valerrdata = [
         {
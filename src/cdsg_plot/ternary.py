@@ -1,11 +1,17 @@
 from cdsg_plot.qcdb_plot import ternary as mpl_ternary
 
 
-def plotly_ternary(sapt, title='', labeled=True, view=True,
-            saveas=None, relpath=False, graphicsformat=['pdf']):
+def plotly_ternary(sapt, title='', labeled=True, view=True, exporter=None,
+            saveas=None, relpath=False, graphicsformat=['pdf'], sink=None, files_saved=None):
     """Takes array of arrays *sapt* in form [elst, indc, disp] of [elst, indc, disp, lbl] and builds formatted
     two-triangle ternary diagrams. Either fully-readable or dotsonly depending
-    on *labeled*. Saves in formats *graphicsformat*.
+    on *labeled*. If *saveas* or a :py:class:`cdsg_plot.plotly_export.ImageExporter`
+    *exporter* is given, saves in formats *graphicsformat* (queued on
+    *exporter* for batch export). With *sink*, it is instead rendered to
+    bytes in memory by the same exporter, per
+    :py:func:`cdsg_plot.qcdb_plot.save_output`. Returns
+    the figure; a dictionary passed as *files_saved* is filled with the
+    files saved (or bytes rendered) keyed by format.
     """
     import hashlib
     import plotly.graph_objects as go
@@ -129,6 +135,17 @@ def plotly_ternary(sapt, title='', labeled=True, view=True,
 
     # save and show
     pltuid = title + '_' + ('lbld' if labeled else 'bare') + '_' + hashlib.sha1((title + repr(sapt)).encode()).hexdigest()
+    saved = {}
+    if exporter is not None or saveas is not None or sink is not None:
+        from cdsg_plot.plotly_export import ImageExporter
+
+        batch = ImageExporter() if exporter is None else exporter
+        saved = batch.save(fig, pltuid, saveas=saveas, relpath=relpath,
+                           graphicsformat=graphicsformat, def_prefix="plotly_tern_", sink=sink)
+        if exporter is None:
+            batch.flush()
+    if files_saved is not None:
+        files_saved.update(saved)
 
     if view:
         fig.show()
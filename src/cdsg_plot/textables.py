@@ -32,6 +32,10 @@ import re
 import sys
 import itertools
 import collections
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
 
 from cdsg_plot.modelchems import Method, BasisSet, Error, methods, bases, errors
 
@@ -55,10 +59,44 @@ else:
 
 
 mc_archive = {"mtd": methods, "bas": bases, "err": errors}
-fancy_mc_archive = {}
-for tier in [methods, bases, errors]:
-    for k, v in items(tier):
-        fancy_mc_archive[k] = v.latex
+
+
+class _LatexArchive(Mapping):
+    """Read-only name: LaTeX view over registries *tiers*, later tiers
+    winning for names they share, resolved at each access so that nothing
+    is built until used and later registrations show through.
+
+    """
+    def __init__(self, *tiers):
+        self.tiers = tiers
+
+    def __getitem__(self, key):
+        for tier in reversed(self.tiers):
+            if key in tier:
+                return tier[key].latex
+        raise KeyError(key)
+
+    def __iter__(self):
+        seen = set()
+        for tier in self.tiers:
+            for key in tier:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self):
+        return sum(1 for key in self)
+
+
+fancy_mc_archive = _LatexArchive(methods, bases, errors)
+
+# cell footnotes travel from matelem into the table row wrapped in these
+#   delimiters and get numbered in order of appearance as each row is formed
+_fnmark = "\x02%s\x03"
+_fnpattern = re.compile("\x02([^\x03]*)\x03")
+
+# index levels of long-format error DataFrames
+pivot_index = ["mtd", "opt", "bas", "sset", "dbse"]
 
 
 # define helper functions for formatting table cells
@@ -67,57 +105,122 @@ def val(kw):
 
 
 def graphics(kw):
-    mc = "-".join([kw[bit] for bit in ["mtd", "opt", "bas"]])
-    return r"""\includegraphics[width=6.67cm,height=3.5mm]{%s%s.pdf}""" % (
-        kw["plotpath"],
-        mc,
-    )
+    return figure_include(graphics, kw, "width=6.67cm,height=3.5mm")
 
 
 def flat(kw):
     if kw["matelem"].strip():
-        dbssmc = "-".join([kw[bit] for bit in ["dbse", "sset", "mtd", "opt", "bas"]])
-        return r"""\includegraphics[width=6.67cm,height=3.5mm]{%sflat_%s.pdf}""" % (
-            kw["plotpath"],
-            dbssmc,
-        )
+        plotdata = kw.get("plotdata")
+        if plotdata is not None and figure_name(flat, kw) in plotdata:
+            from cdsg_plot.qcdb_plot import flat_tikz
+
+            return flat_tikz(width=6.67, height=0.35, **plotdata[figure_name(flat, kw)])
+        return figure_include(flat, kw, "width=6.67cm,height=3.5mm")
     else:
         return ""
 
 
 def liliowa(kw):
     if kw["matelem"].strip():
-        dbssmc = "-".join([kw[bit] for bit in ["dbse", "sset", "mtd", "opt", "bas"]])
-        return r"""\includegraphics[height=3.5mm]{%sliliowa_%s.pdf}""" % (
-            kw["plotpath"],
-            dbssmc,
-        )
+        return figure_include(liliowa, kw, "height=3.5mm")
     else:
         return ""
 
 
+def figure_name(cell, kw):
+    """Returns extensionless name of figure included by figure-bearing
+    *cell* helper (graphics, flat, or liliowa) for cell dictionary *kw*.
+
+    """
+    prefix, bits = figure_cells[cell]
+    return prefix + "-".join([kw[bit] for bit in bits])
+
+
+def figure_file(cell, kw):
+    """Returns path to PDF file included by figure-bearing *cell* helper
+    (graphics, flat, or liliowa) for cell dictionary *kw*.
+
+    """
+    return r"""%s%s.pdf""" % (kw["plotpath"], figure_name(cell, kw))
+
+
+def figure_include(cell, kw, options):
+    """Returns LaTeX command including with *options* the figure for
+    figure-bearing *cell* helper and cell dictionary *kw*: its page of
+    the table's figure bundle if it has one, else its own file.
+
+    """
+    bundle = kw.get("plotbundle")
+    if bundle is not None:
+        page = bundle["pages"].get(figure_name(cell, kw))
+        if page is not None:
+            return r"""\includegraphics[%s,page=%d]{%s}""" % (options, page, bundle["pdf"])
+    return r"""\includegraphics[%s]{%s}""" % (options, figure_file(cell, kw))
+
+
+def read_bundle(plotbundle):
+    """Returns manifest dictionary with keys ``pdf`` (the bundle file) and
+    ``pages`` (figure name: page number) for figure bundle *plotbundle*,
+    the path to a multi-page PDF written by
+    :py:class:`cdsg_plot.qcdb_plot.FigureBundle` (manifest read from the
+    JSON file alongside) or an already-read manifest.
+
+    """
+    import os
+    import json
+
+    if not isinstance(plotbundle, str):
+        return plotbundle
+    with open(os.path.splitext(plotbundle)[0] + ".json") as fp:
+        manifest = json.load(fp)
+    manifest["pdf"] = plotbundle
+    return manifest
+
+
+# file prefix and naming keys for cell helpers that include figures
+figure_cells = {
+    graphics: ("", ["mtd", "opt", "bas"]),
+    flat: ("flat_", ["dbse", "sset", "mtd", "opt", "bas"]),
+    liliowa: ("liliowa_", ["dbse", "sset", "mtd", "opt", "bas"]),
+}
+
+
 def lmtdbas(kw):
-    return """%-25s""" % (methods[kw["mtd"]].latex + "/" + bases[kw["bas"]].latex)
+    return """%-25s""" % (
+        methods.lookup(kw["mtd"]).latex + "/" + bases.lookup(kw["bas"]).latex
+    )
 
 
 def label(kw):
     kwt = kw["target"]
     return """ %-25s""" % (
-        mc_archive[kwt][kw[kwt]].latex if kwt in mc_archive else kw[kwt]
+        mc_archive[kwt].lookup(kw[kwt]).latex if kwt in mc_archive else kw[kwt]
     )
 
 
 def label2(kw):
-    """This and fancy_mc_archive are experimental alternative for
-    summoning up col/row headers. Safe so long as mtd/bas/opt have
-    orthogonal keys.
+    """Experimental alternative, like fancy_mc_archive, for summoning up
+    col/row headers from any of the mc_archive registries. Safe so long as mtd/bas/opt have
+    orthogonal keys. Exact names take precedence over case-insensitive
+    matches of names, formal names, LaTeX and aliases.
 
     """
-    try:
-        return fancy_mc_archive[kw]
-    except KeyError as e:
-        print("""Consider adding {} to modelchems.py""".format(e))
-        return kw
+    for tier in [errors, bases, methods]:
+        if kw in tier:
+            return tier[kw].latex
+    for tier in [errors, bases, methods]:
+        try:
+            return tier.lookup(kw).latex
+        except KeyError:
+            pass
+    if kw not in _label2_misses:
+        _label2_misses.add(kw)
+        print("""Consider adding '{}' to modelchems.py""".format(kw))
+    return kw
+
+
+# keys label2 has already reported missing
+_label2_misses = set()
 
 
 def count(kw):
@@ -146,21 +249,229 @@ def table_generic(
     title="",
     indextitle="",
     plotpath="",
+    plotbundle=None,
+    plotdata=None,
     theme="",
+    errformat="%8.2f",
 ):
     """
     Arrays *mtd* and *bas* contain the keys to the qcdb.Method and
     qcdb.BasisSet objects that span all those that the table may
     encompass. If method and basis are to be scanned over, the arrays
-    should be in the desired order.
+    should be in the desired order. Error statistics *serrors* are either
+    nested dictionaries of preformatted strings or a long-format
+    DataFrame to be arranged by :py:func:`pivot_serrors` with *errformat*.
+    Figure cells include files under *plotpath* or, for figures present in
+    its manifest, pages of bundle *plotbundle* (see :py:func:`read_bundle`).
+    Flat cells whose figure name (see :py:func:`figure_name`) is a key of
+    *plotdata* are instead drawn inline by
+    :py:func:`cdsg_plot.qcdb_plot.flat_tikz` from the value, a dictionary
+    of its arguments like ``data``, ``color``, ``xlimit``, and ``mae``.
+
+    """
+    text = []
+    indices = []
+    for lines, inds in iter_table_generic(
+        dbse,
+        serrors,
+        mtd,
+        bas,
+        columnplan,
+        rowplan=rowplan,
+        opt=opt,
+        err=err,
+        sset=sset,
+        landscape=landscape,
+        standalone=standalone,
+        subjoin=subjoin,
+        suppressblanks=suppressblanks,
+        footnotes=footnotes,
+        title=title,
+        indextitle=indextitle,
+        plotpath=plotpath,
+        plotbundle=plotbundle,
+        plotdata=plotdata,
+        theme=theme,
+        errformat=errformat,
+    ):
+        text.extend(lines)
+        indices.extend(inds)
+
+    return text, indices
+
+
+def pivot_serrors(df, errformat="%8.2f"):
+    """Arranges long-format DataFrame *df* with columns mtd, opt, bas, sset,
+    dbse, err, value and optionally tgtcnt and misscnt into a lookup keyed
+    by (mtd, opt, bas, sset, dbse) tuples, as :py:func:`table_generic`
+    consumes it. Each err column is formatted at once with *errformat*, a
+    printf-style string or a dictionary of them by err key. Missing values
+    format as blanks of matching width.
 
     """
+    import numpy as np
+
+    wide = df.set_index(pivot_index + ["err"])["value"].unstack("err")
+    for er in wide.columns:
+        fmt = errformat.get(er, "%8.2f") if isinstance(errformat, dict) else errformat
+        values = wide[er].to_numpy(dtype=float)
+        wide[er] = np.where(
+            np.isnan(values), " " * len(fmt % 0.0), np.char.mod(fmt, values)
+        )
+
+    counts = [col for col in ["tgtcnt", "misscnt"] if col in df.columns]
+    if counts:
+        wide = wide.join(df.groupby(pivot_index)[counts].max().fillna(0).astype(int))
+
+    return wide.to_dict("index")
+
+
+def table_figures(dbse, serrors, mtd, bas, columnplan, **kwargs):
+    """Returns ordered dictionary of the figure files that the table from
+    :py:func:`table_generic` with the same arguments would include through
+    graphics, flat, or liliowa cells, each with its cell dictionary of
+    dbse, sset, mtd, opt, bas, matelem, etc. keys. Flat cells drawn
+    inline from *plotdata* include no file and so are left out.
+
+    """
+    needed = collections.OrderedDict()
+    plotdata = kwargs.get("plotdata") or {}
+
+    def recording(cell):
+        def recorded(kw):
+            piece = cell(kw)
+            if piece and not (cell is flat and figure_name(flat, kw) in plotdata):
+                needed[figure_file(cell, kw)] = kw
+            return piece
+
+        return recorded
+
+    plan = [
+        list(col[:3])
+        + [recording(col[3]) if col[3] in figure_cells else col[3]]
+        + list(col[4:])
+        for col in columnplan
+    ]
+    kwargs["standalone"] = False
+    for chunk in iter_table_generic(dbse, serrors, mtd, bas, plan, **kwargs):
+        pass
+
+    return needed
+
+
+def build_figures(figures, render, inputs, stampfile="figures.json", nproc=None):
+    """Brings the figure files in *figures* (filename: cell dictionary, as
+    from :py:func:`table_figures`) up to date ahead of emitting the table.
+    A file is rendered only if missing, if the hash of its input data
+    ``inputs(kw)`` changed, or if its mtime differs from that recorded in
+    JSON *stampfile* at its last build. Stale files are rendered by
+    ``render(filename, kw)`` in *nproc* parallel processes (all cores if
+    None, in-process if 1), so *render* must be a module-level function
+    for nproc != 1. Returns list of the files rendered.
+
+    """
+    import os
+    import json
+    import hashlib
+    import concurrent.futures
+
+    def digest(data):
+        return hashlib.sha1(
+            json.dumps(
+                data,
+                sort_keys=True,
+                default=lambda obj: obj.tolist() if hasattr(obj, "tolist") else repr(obj),
+            ).encode()
+        ).hexdigest()
+
+    stamps = {}
+    if os.path.isfile(stampfile):
+        with open(stampfile) as fp:
+            stamps = json.load(fp)
+
+    stale = collections.OrderedDict()
+    for fl, kw in items(figures):
+        sha = digest(inputs(kw))
+        stamp = stamps.get(fl)
+        if (
+            stamp is None
+            or not os.path.isfile(fl)
+            or stamp["sha1"] != sha
+            or stamp["mtime"] != os.path.getmtime(fl)
+        ):
+            stale[fl] = (kw, sha)
+
+    if nproc == 1:
+        for fl, (kw, sha) in items(stale):
+            render(fl, kw)
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=nproc) as pool:
+            jobs = [pool.submit(render, fl, kw) for fl, (kw, sha) in items(stale)]
+            for job in jobs:
+                job.result()
+
+    for fl, (kw, sha) in items(stale):
+        stamps[fl] = {"sha1": sha, "mtime": os.path.getmtime(fl)}
+    with open(stampfile, "w") as fp:
+        json.dump(stamps, fp, indent=1, sort_keys=True)
+
+    return list(stale.keys())
+
+
+def write_table_generic(sink, *args, **kwargs):
+    """Streaming form of :py:func:`table_generic` that writes LaTeX lines
+    to file-like *sink* row by row as they are formed. Remaining arguments
+    are those of :py:func:`table_generic`. Returns the list of index
+    entries. For the rows themselves as they're formed, iterate
+    :py:func:`iter_table_generic`.
+
+    """
+    indices = []
+    for lines, inds in iter_table_generic(*args, **kwargs):
+        for line in lines:
+            sink.write(line + "\n")
+        indices.extend(inds)
+    return indices
+
+
+def iter_table_generic(
+    dbse,
+    serrors,
+    mtd,
+    bas,
+    columnplan,
+    rowplan=["bas", "mtd"],
+    opt=["CP"],
+    err=["mae"],
+    sset=["default"],
+    landscape=False,
+    standalone=True,
+    subjoin=True,
+    suppressblanks=False,
+    footnotes=[],
+    title="",
+    indextitle="",
+    plotpath="",
+    plotbundle=None,
+    plotdata=None,
+    theme="",
+    errformat="%8.2f",
+):
+    """Generator form of :py:func:`table_generic` that yields tuples of
+    (LaTeX lines, index entries) as each table row is formed, so only the
+    current row and the current table's footnotes are held in memory.
+
+    """
+    tidy = hasattr(serrors, "columns")
+    if tidy:
+        serrors = pivot_serrors(serrors, errformat=errformat)
 
     def table_header(kw, abbr, head1, head0, head2):
         """Form table header"""
         ref = r"""tbl:qcdb-%s-%s""" % (theme, "-".join([kw[bit] for bit in tag]))
         fancy_kw = {
-            k: (mc_archive[k][v].latex if k in mc_archive else v) for k, v in items(kw)
+            k: (mc_archive[k].lookup(v).latex if k in mc_archive else v)
+            for k, v in items(kw)
         }
         text.append("")
         text.append(r"""\begingroup""")
@@ -182,56 +493,43 @@ def table_generic(
         text.append(head2)
         text.append(hline)
 
+        # fresh on-the-fly footnotes for each table
+        otffootnotes.clear()
+        otfcounter[0] = len(footnotes) + 1
+
+    def footnote_number(fntext):
+        """Return footnote number for *fntext*, assigning the next free one if new."""
+        if fntext in otffootnotes:
+            return otffootnotes[fntext]
+        localcounter = otfcounter[0]
+        if localcounter == 52:  # fn symbols run out at "zz"
+            otffootnotes["Missing some reactions"] = localcounter
+        else:
+            otfcounter[0] += 1
+            otffootnotes[fntext] = localcounter
+        return localcounter
+
+    def table_row(line):
+        """Append body *line* to table, resolving footnote marks and suppressing blanks"""
+
+        # number footnotes in one pass over the row
+        if "\x02" in line:
+            line = _fnpattern.sub(
+                lambda res: r"""\footnotemark[%d]""" % (footnote_number(res.group(1))),
+                line,
+            )
+
+        # suppress "blank" lines
+        if suppressblanks and line.strip().endswith("\\"):
+            innards = "".join(line.rstrip(""" \\""").split("&")[1:])
+            if innards.isspace():
+                line = "%" + line
+
+        text.append(line)
+
     def table_footer():
         """Form table footer"""
 
-        # search-and-replace footnotes
-        fnmatch = re.compile(
-            r"""(?P<cellpre>.*)"""
-            + r"""(\\footnotemark)\{(?P<fntext>.*)\}"""
-            + r"""(?P<cellpost>.*)"""
-        )
-        otfcounter = len(footnotes) + 1
-        lines2replace = {}
-        otffootnotes = collections.OrderedDict()
-        for idx, line in enumerate(text):
-            newcells = []
-            changed = False
-            for cell in line.split("&"):
-                res = fnmatch.match(cell)
-                if res:
-                    if res.group("fntext") in otffootnotes:
-                        localcounter = otffootnotes[res.group("fntext")]
-                    else:
-                        localcounter = otfcounter
-                        if localcounter == 52:  # fn symbols run out at "zz"
-                            otffootnotes["Missing some reactions"] = localcounter
-                        else:
-                            otfcounter += 1
-                            otffootnotes[res.group("fntext")] = localcounter
-                    newcells.append(
-                        res.group("cellpre")
-                        + r"""\footnotemark["""
-                        + str(localcounter)
-                        + "]"
-                        + res.group("cellpost")
-                    )
-                    changed = True
-                else:
-                    newcells.append(cell)
-            if changed:
-                lines2replace[idx] = "&".join(newcells)
-        for idx, line in items(lines2replace):
-            text[idx] = line
-
-        # search-and-suppress "blank" lines
-        if suppressblanks:
-            for idx, line in enumerate(text):
-                if line.strip().endswith("\\"):
-                    innards = "".join(line.rstrip(""" \\""").split("&")[1:])
-                    if innards.isspace():
-                        text[idx] = "%" + text[idx]
-
         # finish out table
         text.append(r"""\end{tabular}""")
         text.append(r"""\end{ruledtabular}""")
@@ -244,19 +542,34 @@ def table_generic(
         text.append(r"""\clearpage""")
         text.append("")
 
+    def flush():
+        """Hand off accumulated lines and index entries, remembering the last line"""
+        chunk = (text[:], indices[:])
+        if text:
+            lastline[0] = text[-1]
+        del text[:]
+        del indices[:]
+        return chunk
+
+    def last():
+        """Return most recently formed line, whether or not handed off"""
+        return text[-1] if text else lastline[0]
+
     def matelem(dict_row, dict_col):
         """Return merge of index dictionaries *dict_row* and *dict_col* (precedence) with error string from serrors appended at key 'matelem'."""
         kw = dict(dict_row, **dict_col)
-        errpiece = serrors["-".join([kw[bit] for bit in ["mtd", "opt", "bas"]])][
-            kw["sset"]
-        ][kw["dbse"]]
+        if tidy:
+            errpiece = serrors[tuple(kw[bit] for bit in pivot_index)]
+        else:
+            errpiece = serrors["-".join([kw[bit] for bit in ["mtd", "opt", "bas"]])][
+                kw["sset"]
+            ][kw["dbse"]]
         kw["matelem"] = errpiece[kw["err"]]
         if "tgtcnt" in errpiece:
             kw["count"] = errpiece["tgtcnt"]
         if "misscnt" in errpiece and errpiece["misscnt"] != 0 and "tgtcnt" in errpiece:
-            kw["footnote"] = r"""\footnotemark{Missing %d of %d reactions.}""" % (
-                errpiece["misscnt"],
-                errpiece["tgtcnt"],
+            kw["footnote"] = _fnmark % (
+                """Missing %d of %d reactions.""" % (errpiece["misscnt"], errpiece["tgtcnt"])
             )
         else:
             kw["footnote"] = ""
@@ -327,10 +640,15 @@ def table_generic(
     # form table body
     text = []
     indices = []
+    lastline = [None]
+    otffootnotes = collections.OrderedDict()
+    otfcounter = [len(footnotes) + 1]
     nH = len(rowplan)
     hline = r"""\hline"""
     kw = {
         "plotpath": plotpath,
+        "plotbundle": None if plotbundle is None else read_bundle(plotbundle),
+        "plotdata": plotdata,
         "sset": sset[0],
         "dbse": dbse[0],
         "err": err[0],
@@ -341,14 +659,16 @@ def table_generic(
 
     if standalone:
         text += begin_latex_document()
+        yield flush()
 
     if nH == 1:
         subjoin = True
 
     if subjoin:
         table_header(kw, abbr, head1, head0, head2)
-        if text[-1] != hline:
+        if last() != hline:
             text.append(hline)
+        yield flush()
 
     for hier0 in locals()[rowplan[0]]:
         kw[rowplan[0]] = hier0
@@ -357,52 +677,57 @@ def table_generic(
 
             if not subjoin:
                 table_header(kw, abbr, head1, head0, head2)
-            if text[-1] != hline:
+            if last() != hline:
                 text.append(hline)
             # text.append(r"""\textbf{%s} \\ """ % (mc_archive[rowplan[0]][hier0].latex))
-            text.append(r"""\textbf{%s} \\ """ % (label2(hier0)))
+            table_row(r"""\textbf{%s} \\ """ % (label2(hier0)))
+            yield flush()
 
             for hier1 in locals()[rowplan[1]]:
                 kw[rowplan[1]] = hier1
                 kw["target"] = rowplan[1]
                 if nH > 2:
                     # text.append(r"""\enspace\textbf{%s} \\ """ % (mc_archive[rowplan[1]][hier1].latex))
-                    text.append(r"""\enspace\textbf{%s} \\ """ % (label2(hier1)))
+                    table_row(r"""\enspace\textbf{%s} \\ """ % (label2(hier1)))
+                    yield flush()
 
                     for hier2 in locals()[rowplan[2]]:
                         kw[rowplan[2]] = hier2
                         kw["target"] = rowplan[2]
 
-                        text.append(
+                        table_row(
                             r"""\enspace\enspace"""
                             + " & ".join(
                                 [col[3](matelem(kw, col[4])) for col in columnplan]
                             )
                             + r""" \\ """
                         )
+                        yield flush()
                 else:
-                    text.append(
+                    table_row(
                         r"""\enspace"""
                         + " & ".join(
                             [col[3](matelem(kw, col[4])) for col in columnplan]
                         )
                         + r""" \\ """
                     )
+                    yield flush()
             if not subjoin:
                 table_footer()
+                yield flush()
         else:
-            text.append(
+            table_row(
                 " & ".join([col[3](matelem(kw, col[4])) for col in columnplan])
                 + r""" \\ """
             )
+            yield flush()
 
     if subjoin:
         table_footer()
 
     if standalone:
         text += end_latex_document()
-
-    return text, indices
+    yield flush()
 
 
 def begin_latex_document():
@@ -420,6 +745,7 @@ def begin_latex_document():
     text.append(r"""\usepackage{rotating}""")
     text.append(r"""\usepackage{longtable}""")
     text.append(r"""\usepackage[table]{xcolor}""")
+    text.append(r"""\usepackage{tikz}""")
     text.append(r"""\begin{document}""")
     text.append("")
     return text
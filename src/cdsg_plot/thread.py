@@ -4,8 +4,8 @@ from cdsg_plot.qcdb_plot import threads as mpl_threads
 def plotly_threads(data, labels, color=None, title='', xlimit=4.0, xlimitleft=None, xticks=None,
     mae=None, mape=None,
     mousetext=None, mouselink=None, mouseimag=None, mousetitle=None, mousediv=None,
-    labeled=True, view=True,
-    saveas=None, relpath=False, graphicsformat=['pdf']):
+    labeled=True, view=True, webgl=False, exporter=None,
+    saveas=None, relpath=False, graphicsformat=['pdf'], sink=None, files_saved=None):
     """Generates a tiered slat diagram between model chemistries with
     errors (or simply values) in list *data*, which is supplied as part of the
     dictionary for each participating reaction, along with *dbse* and *rxn* keys
@@ -17,6 +17,17 @@ def plotly_threads(data, labels, color=None, title='', xlimit=4.0, xlimitleft=No
     HTML code for mouseover if mousetext or mouselink or mouseimag specified
     based on recipe of Andrew Dalke from
     http://www.dalkescientific.com/writings/diary/archive/2005/04/24/interactive_html.html
+    If *webgl*, segments are instead gathered by color into a few WebGL
+    traces (slats and threads separately) broken by None separators, with
+    each reaction's *db*-*sys* kept in customdata for hover, so that
+    thousands of reactions stay responsive.
+    If *saveas* or a :py:class:`cdsg_plot.plotly_export.ImageExporter`
+    *exporter* is given, the figure is also written in formats
+    *graphicsformat* (queued on *exporter* for batch export). With *sink*,
+    it is instead rendered to bytes in memory by the same exporter, per
+    :py:func:`cdsg_plot.qcdb_plot.save_output`. Returns the figure; a
+    dictionary passed as *files_saved* is filled with the files saved (or
+    bytes rendered) keyed by format.
     """
     import hashlib
 
@@ -87,41 +98,44 @@ def plotly_threads(data, labels, color=None, title='', xlimit=4.0, xlimitleft=No
 #                 family='Times New Roman', weight='bold', fontsize=18)
 
     # plot reaction errors and threads
-    for rxn in data:
+    if webgl:
+        fig.add_traces(_webgl_threads(data, Nweft, posnS, posnT))
+    else:
+        for rxn in data:
 
-        # preparation
-        xvals = rxn['data']
-        clr = rxn['color'] if 'color' in rxn else 'green' 
-        slat = []
-        for weft in range(Nweft):
-            slat.extend([xvals[weft], xvals[weft], None])
-        thread = []
-        for weft in range(Nweft - 1):
-            thread.extend([xvals[weft], xvals[weft + 1], None])
-
-        # plotting
-        fig.add_trace(go.Scatter(x=slat,
-                                 y=posnS,
-                                 mode='lines',
-                                 name=rxn['sys'],
-                                 line=dict(
-                                     color=clr,
-                                     dash='solid',
-                                     width=1.0,
-                                 ),
-                                ))
+            # preparation
+            xvals = rxn['data']
+            clr = rxn['color'] if 'color' in rxn else 'green' 
+            slat = []
+            for weft in range(Nweft):
+                slat.extend([xvals[weft], xvals[weft], None])
+            thread = []
+            for weft in range(Nweft - 1):
+                thread.extend([xvals[weft], xvals[weft + 1], None])
 
-        fig.add_trace(go.Scatter(x=thread, y=posnT,
-                                 mode='lines',
-                                 name=rxn['sys'],
-                                 opacity=0.6, #0.3,
-                                 showlegend=False,
-                                 line=dict(
-                                     color=clr,
-                                     dash='solid',
-                                     width=0.5,
-                                 ),                        
-                                ))
+            # plotting
+            fig.add_trace(go.Scatter(x=slat,
+                                     y=posnS,
+                                     mode='lines',
+                                     name=rxn['sys'],
+                                     line=dict(
+                                         color=clr,
+                                         dash='solid',
+                                         width=1.0,
+                                     ),
+                                    ))
+
+            fig.add_trace(go.Scatter(x=thread, y=posnT,
+                                     mode='lines',
+                                     name=rxn['sys'],
+                                     opacity=0.6, #0.3,
+                                     showlegend=False,
+                                     line=dict(
+                                         color=clr,
+                                         dash='solid',
+                                         width=0.5,
+                                     ),                        
+                                    ))
 
     # plot trimmings
     if mae is not None:
@@ -143,12 +157,91 @@ def plotly_threads(data, labels, color=None, title='', xlimit=4.0, xlimitleft=No
 
     # save and show
     pltuid = title + '_' + ('lbld' if labeled else 'bare') + '_' + hashlib.sha1((title + repr(labels) + repr(xlimit)).encode()).hexdigest()
+    saved = {}
+    if exporter is not None or saveas is not None or sink is not None:
+        from cdsg_plot.plotly_export import ImageExporter
+
+        batch = ImageExporter() if exporter is None else exporter
+        saved = batch.save(fig, pltuid, saveas=saveas, relpath=relpath,
+                           graphicsformat=graphicsformat, def_prefix="plotly_thread_", sink=sink)
+        if exporter is None:
+            batch.flush()
+    if files_saved is not None:
+        files_saved.update(saved)
 
     if view:
         fig.show()
     return fig
 
 
+def _webgl_threads(data, Nweft, posnS, posnT):
+    """Return Scattergl traces for reactions in *data*, one slat trace and
+    one thread trace per distinct color, in order of first appearance.
+    Numeric (sapt) colors are binned into 64 jet shades so that the trace
+    count stays small; missing (None) or out-of-range ones are grey, as
+    from :py:func:`cdsg_plot.qcdb_plot.segment_colors`.
+
+    """
+    import collections
+    import matplotlib
+    import numpy as np
+    import plotly.graph_objects as go
+    from cdsg_plot.qcdb_plot import segment_colors
+
+    # numeric colors snapped to the centers of 64 bins before the jet lookup
+    rxnclrs = [rxn['color'] if 'color' in rxn else 'green' for rxn in data]
+    vals = np.array([np.nan if (clr is None or isinstance(clr, str)) else clr for clr in rxnclrs], dtype=float)
+    shades = np.where((vals >= 0.0) & (vals <= 1.0), (np.minimum(np.floor(vals * 64), 63) + 0.5) / 64, np.nan)
+    rgba = segment_colors('sapt', shades)
+
+    groups = collections.OrderedDict()
+    for irxn, rxn in enumerate(data):
+        clr = rxnclrs[irxn]
+        if not isinstance(clr, str):
+            clr = matplotlib.colors.to_hex(rgba[irxn])
+        if clr not in groups:
+            groups[clr] = ([], [], [], [], [], [])
+        slatx, slaty, slatc, thrdx, thrdy, thrdc = groups[clr]
+
+        xvals = rxn['data']
+        ident = '%s-%s' % (rxn.get('db', ''), rxn['sys'])
+        for weft in range(Nweft):
+            slatx.extend([xvals[weft], xvals[weft], None])
+        slaty.extend(posnS)
+        slatc.extend([ident] * len(posnS))
+        for weft in range(Nweft - 1):
+            thrdx.extend([xvals[weft], xvals[weft + 1], None])
+        thrdy.extend(posnT)
+        thrdc.extend([ident] * len(posnT))
+
+    hover = '%{customdata}: %{x:.4f}<extra></extra>'
+    traces = []
+    for clr, (slatx, slaty, slatc, thrdx, thrdy, thrdc) in groups.items():
+        traces.append(go.Scattergl(x=slatx, y=slaty, customdata=slatc,
+                                   mode='lines',
+                                   name=clr,
+                                   hovertemplate=hover,
+                                   line=dict(
+                                       color=clr,
+                                       dash='solid',
+                                       width=1.0,
+                                   ),
+                                  ))
+        traces.append(go.Scattergl(x=thrdx, y=thrdy, customdata=thrdc,
+                                   mode='lines',
+                                   name=clr,
+                                   opacity=0.6,
+                                   showlegend=False,
+                                   hovertemplate=hover,
+                                   line=dict(
+                                       color=clr,
+                                       dash='solid',
+                                       width=0.5,
+                                   ),
+                                  ))
+    return traces
+
+
 if __name__ == "__main__":
 
     merge_dats = [
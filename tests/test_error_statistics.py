@@ -0,0 +1,22 @@
+import io
+
+import matplotlib
+import numpy as np
+import pandas as pd
+
+from cdsg_plot.error_statistics import violin_plot
+
+matplotlib.use("Agg")
+
+
+def test_violin_plot_to_buffer(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"MP2": rng.normal(0.5, 5.0, 200), "HF": rng.normal(-0.5, 5.0, 200)})
+
+    buf = io.BytesIO()
+    files_saved = violin_plot(df, {"MP2 label": "MP2", "HF label": "HF"}, output_filename=None, ylim=[-20, 35],
+                usetex=False, rcParams=None, sink=buf)
+    assert buf.getvalue().startswith(b"\x89PNG")
+    assert files_saved == {"png": buf.getvalue()}
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,22 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+from cdsg_plot.heatmap import heatmap
+
+df = pd.DataFrame(np.random.default_rng(0).normal(size=(4, 5)), index=list("abcd"), columns=list("ABCDE"))
+
+
+def test_small_heatmap_without_annotations_skips_seaborn(monkeypatch):
+    # a None entry makes "import seaborn" raise ImportError
+    monkeypatch.setitem(sys.modules, "seaborn", None)
+    files_saved = heatmap(df, annot=False, graphicsformat=["png"], sink=True)
+    assert files_saved["png"].startswith(b"\x89PNG")
+
+
+def test_unknown_cluster_raises():
+    import pytest
+
+    with pytest.raises(ValueError, match="row"):
+        heatmap(df, cluster="row", graphicsformat=["png"], sink=True)
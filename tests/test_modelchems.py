@@ -0,0 +1,26 @@
+from cdsg_plot import modelchems, textables
+from cdsg_plot.modelchems import Method, Registry
+
+
+def test_registry_merges_like_a_dict():
+    reg = Registry(Method, ["name", "fullname", "latex"], [("MP2", "MP2", "MP2"), ("CCSD", "CCSD", "CCSD")])
+    assert reg.lookup("mp2").name == "MP2"
+    reg["FOO"] = Method("FOO", fullname="Foo Method")
+    reg.update({"BAR": Method("BAR")})
+    assert list(reg) == ["MP2", "CCSD", "FOO", "BAR"]
+    assert reg.lookup("foo method").name == "FOO"
+    del reg["FOO"]
+    assert "FOO" not in reg
+    assert reg.lookup("bar").name == "BAR"
+
+
+def test_fancy_mc_archive_follows_registries():
+    assert textables.fancy_mc_archive["MP2"] == modelchems.methods["MP2"].latex
+    assert textables.fancy_mc_archive["adz"] == modelchems.bases["adz"].latex
+    assert len(textables.fancy_mc_archive) == len(set(modelchems.methods) | set(modelchems.bases)
+                                                   | set(modelchems.errors))
+    modelchems.methods["ZZTEST"] = Method("ZZTEST", latex="zz")
+    try:
+        assert textables.fancy_mc_archive["ZZTEST"] == "zz"
+    finally:
+        del modelchems.methods["ZZTEST"]
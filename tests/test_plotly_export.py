@@ -0,0 +1,132 @@
+import io
+import os
+
+import pytest
+
+from cdsg_plot.plotly_export import ImageExporter
+from cdsg_plot.ternary import plotly_ternary
+from cdsg_plot.thread import plotly_threads
+
+dats = [
+    {"db": "S22", "sys": "15", "data": [-1.5090, -2.5263, -2.9452]},
+    {"db": "S22", "sys": "22", "data": [0.3046, -0.2632, -0.5070]},
+]
+sapt = [[-1, -1, -1, "cat"], [-1, -2, -3, "mouse"], [1, -2, -3]]
+
+
+class QueueOnly(ImageExporter):
+    """Exporter that records flushed queues instead of rendering."""
+
+    def __init__(self):
+        ImageExporter.__init__(self)
+        self.flushed = []
+
+    def flush(self):
+        self.flushed.extend(self._queue)
+        self._queue = []
+
+    def render(self, fig, ext):
+        return ("%s:%d" % (ext, len(fig.data))).encode()
+
+
+def test_threads_return_figure_when_saving(tmp_path):
+    import plotly.graph_objects as go
+
+    exporter = QueueOnly()
+    files_saved = {}
+    fig = plotly_threads(dats, labels=["d", "t", "dt"], title="ret", view=False, exporter=exporter,
+                         saveas=str(tmp_path) + os.sep, graphicsformat=["png", "pdf"], files_saved=files_saved)
+    exporter.flush()
+    assert isinstance(fig, go.Figure)
+    assert sorted(files_saved) == ["pdf", "png"]
+    assert [item[1] for item in exporter.flushed] == [files_saved["png"], files_saved["pdf"]]
+
+
+def test_ternary_return_figure_when_saving(tmp_path):
+    import plotly.graph_objects as go
+
+    exporter = QueueOnly()
+    files_saved = {}
+    fig = plotly_ternary(sapt, title="ret", view=False, exporter=exporter,
+                         saveas=str(tmp_path) + os.sep, files_saved=files_saved)
+    assert isinstance(fig, go.Figure)
+    assert list(files_saved) == ["pdf"]
+
+
+def test_image_exporter_writes_files(tmp_path):
+    pytest.importorskip("kaleido")
+
+    files_saved = {}
+    with ImageExporter() as exporter:
+        plotly_threads(dats, labels=["d", "t", "dt"], title="disk", view=False, exporter=exporter,
+                       saveas=str(tmp_path) + os.sep, graphicsformat=["png", "svg"], files_saved=files_saved)
+    for savefile in files_saved.values():
+        assert os.path.getsize(savefile) > 0
+
+
+def test_sink_renders_through_exporter():
+    buf = io.BytesIO()
+    files_saved = {}
+    plotly_ternary(sapt, title="mem", view=False, exporter=QueueOnly(), graphicsformat=["png"],
+                   sink=buf, files_saved=files_saved)
+    assert buf.getvalue() == b"png:1"
+    assert files_saved == {"png": b"png:1"}
+
+
+def test_image_exporter_writes_buffer():
+    pytest.importorskip("kaleido")
+
+    buf = io.BytesIO()
+    plotly_threads(dats, labels=["d", "t", "dt"], title="mem", view=False, graphicsformat=["png"], sink=buf)
+    assert buf.getvalue().startswith(b"\x89PNG")
+
+
+def test_write_compact_to_buffer(tmp_path):
+    from cdsg_plot.plotly_export import write_compact
+
+    buf = io.BytesIO()
+    fig = plotly_threads(dats, labels=["d", "t", "dt"], title="mem", view=False, webgl=True)
+    files_saved = write_compact(fig, saveas=str(tmp_path) + os.sep, exportformat=["json"], sink=buf)
+    assert files_saved["json"] == buf.getvalue()
+    assert os.listdir(tmp_path) == []
+
+
+def test_compact_round_trip_keeps_2d_shape(tmp_path):
+    import numpy as np
+    import plotly.graph_objects as go
+    from cdsg_plot.plotly_export import read_compact, write_compact
+
+    z = np.arange(40.).reshape(4, 10)
+    fig = go.Figure([go.Heatmap(z=z), go.Heatmap(z=z.tolist())])
+    files_saved = write_compact(fig, saveas=str(tmp_path) + os.sep, exportformat=["json"], compress=True)
+    assert files_saved["json"].endswith(".json.gz")
+    back = read_compact(files_saved["json"])
+    for trace in back.data:
+        assert np.array_equal(np.asarray(trace.z), z)
+
+
+def test_compact_html_is_plain_and_escaped(tmp_path):
+    import plotly.graph_objects as go
+    from cdsg_plot.plotly_export import write_compact
+
+    fig = go.Figure(go.Scatter(x=list(range(10)), y=list(range(10)), name="</script><b>x</b>"))
+    files_saved = write_compact(fig, saveas=str(tmp_path) + os.sep, exportformat=["html"],
+                                compress=True, include_plotlyjs=False)
+    assert files_saved["html"].endswith(".html")
+    with open(files_saved["html"], encoding="utf-8") as handle:
+        page = handle.read()
+    assert page.count("</script>") == 1
+    assert "<\\/script><b>x<\\/b>" in page
+
+
+def test_encode_array_keeps_close_large_values_distinct():
+    import base64
+    import numpy as np
+    from cdsg_plot.plotly_export import encode_array
+
+    x = 100000 + 0.001 * np.arange(10)
+    spec = encode_array(list(x))
+    assert spec["dtype"] == "f8"
+    back = np.frombuffer(base64.b64decode(spec["bdata"]), dtype=spec["dtype"])
+    assert np.array_equal(back, x)
+    assert encode_array([0.1 * i for i in range(10)])["dtype"] == "f4"
@@ -0,0 +1,251 @@
+import io
+import os
+
+import matplotlib
+import numpy as np
+
+from cdsg_plot.qcdb_plot import threads
+
+matplotlib.use("Agg")
+
+
+def png_pixels(data):
+    from PIL import Image
+
+    return np.asarray(Image.open(io.BytesIO(data)).convert("RGBA")).astype(int)
+
+
+def test_threads_density_colored_and_short_rows():
+    rng = np.random.default_rng(0)
+    data = [{"sys": str(i), "data": list(row)} for i, row in enumerate(rng.normal(0.0, 1.0, (500, 3)))]
+    data[0]["data"] = [0.5]
+    files_saved, _ = threads(data, labels=["a", "b", "c"], color="blue", density=True, labeled=False,
+                             view=False, graphicsformat=["png"], sink=True)
+    pixels = png_pixels(files_saved["png"])
+    opaque = pixels[pixels[..., 3] > 150][:, :3]
+    assert len(opaque)
+    assert (opaque == [0, 0, 255]).all()
+
+
+def test_place_labels_lanes_do_not_overlap():
+    from cdsg_plot.qcdb_plot import place_labels
+
+    rng = np.random.default_rng(1)
+    labels = [(float(x), "r%d" % i) for i, x in enumerate(rng.normal(0.0, 1.0, 400))]
+    placed = place_labels(labels, 0.02, lanes=3, seed=5)
+    assert placed == place_labels(labels, 0.02, lanes=3, seed=5)
+    for lane in range(3):
+        spans = sorted((x - 0.01 * (len(text) + 1), x + 0.01 * (len(text) + 1))
+                       for (x, text), ln in placed if ln == lane)
+        assert all(prev[1] <= nxt[0] for prev, nxt in zip(spans, spans[1:]))
+
+
+def test_ternary_error_density_needs_errors():
+    import pytest
+    from cdsg_plot.qcdb_plot import ternary
+
+    sapt = [[-1.0, -1.0, -1.0], [-1.0, -2.0, -3.0], [1.0, -2.0, -3.0]]
+    with pytest.raises(ValueError, match="errors"):
+        ternary(sapt, density="error", view=False, sink=True)
+    with pytest.raises(ValueError, match="errors"):
+        ternary(sapt, density="error", errors=[0.1], view=False, sink=True)
+    files_saved = ternary(sapt, density="error", errors=[0.1, -0.2, 0.3], view=False,
+                          graphicsformat=["png"], sink=True)
+    assert files_saved["png"].startswith(b"\x89PNG")
+
+
+def test_iowa_reports_rasterization():
+    from cdsg_plot.qcdb_plot import iowa
+
+    labels = ["%03dARG-%03dLYS-0" % (i, i) for i in range(30)] + ["%03dGLY-%03dALA-0" % (i, i) for i in range(30)]
+    errors = list(np.linspace(-1.0, 1.0, len(labels)))
+    files_saved = iowa(errors, labels, view=False, rasterize="report", graphicsformat=["pdf", "png"], sink=True)
+    raster = files_saved["raster"]
+    assert raster["points"] > 0 and raster["dpi"] > 0
+    assert set(raster["pdf"]) == {"bytes", "seconds", "vector_bytes", "vector_seconds"}
+    assert raster["pdf"]["bytes"] == len(files_saved["pdf"])
+    assert "png" not in raster
+    assert "raster" not in iowa(errors, labels, view=False, rasterize=True, graphicsformat=["pdf"], sink=True)
+
+
+def test_segment_colors_sapt_matches_jet():
+    from cdsg_plot.qcdb_plot import segment_colors
+
+    fracs = (np.arange(256) + 0.5) / 256
+    assert np.allclose(segment_colors("sapt", list(fracs)), matplotlib.cm.jet(np.arange(256)), atol=1.e-12)
+    assert np.allclose(segment_colors("sapt", [0.0, 1.0]), matplotlib.cm.jet([0, 255]), atol=1.e-12)
+
+
+def test_segment_colors_fallbacks():
+    from cdsg_plot.qcdb_plot import segment_colors
+
+    grey = matplotlib.colors.to_rgba("grey")
+    rgb = segment_colors("rgb", [0.1, 0.5, 0.9, None])
+    assert np.allclose(rgb, matplotlib.colors.to_rgba_array(["blue", "green", "red", "grey"]))
+    assert np.allclose(segment_colors("sapt", [None, -0.1, 1.5]), [grey] * 3)
+    assert np.allclose(segment_colors(None, [None, "red", "tab:orange"]),
+                       matplotlib.colors.to_rgba_array(["grey", "red", "tab:orange"]))
+    assert np.allclose(segment_colors("black", [None, 0.5]), [(0, 0, 0, 1)] * 2)
+    assert segment_colors(None, []).shape == (0, 4)
+
+
+def test_file_like_sink_takes_one_output():
+    import pytest
+    from cdsg_plot.qcdb_plot import liliowa_atlas
+
+    mcdats = {"a": [0.5, -0.5, 1.0, 0.0], "b": [-1.0, 0.25, 0.0, 0.75]}
+    with pytest.raises(ValueError, match="one output"):
+        liliowa_atlas(mcdats, sink=io.BytesIO())
+
+    outputs = []
+    files_saved = liliowa_atlas(mcdats, sink=lambda ext, data: outputs.append(ext))
+    assert outputs == ["png", "pdf", "json"] == list(files_saved)
+
+
+def _raster_plots():
+    from cdsg_plot.qcdb_plot import flat, ternary
+
+    rng = np.random.default_rng(2)
+    rows = rng.normal(0.0, 1.0, (300, 3))
+    sapt = [list(row) for row in rng.uniform(-1.0, 1.0, (300, 3))]
+    return {
+        "flat": lambda **kw: flat([{"data": [row[0]]} for row in rows], view=False, **kw),
+        "threads": lambda **kw: threads([{"sys": str(i), "data": list(row)} for i, row in enumerate(rows)],
+                                        labels=["a", "b", "c"], labeled=False, view=False, **kw)[0],
+        "ternary": lambda **kw: ternary(sapt, labeled=False, view=False, **kw),
+    }
+
+
+def test_rasterization_reported_only_on_request():
+    for name, plot in _raster_plots().items():
+        files_saved = plot(graphicsformat=["pdf", "png"], rasterize=True, sink=True)
+        assert sorted(files_saved) == ["pdf", "png"], name
+
+        files_saved = plot(graphicsformat=["pdf", "png"], rasterize="report", sink=True)
+        raster = files_saved.pop("raster")
+        assert sorted(files_saved) == ["pdf", "png"], name
+        assert raster["points"] > 0 and raster["dpi"] == 300, name
+        assert set(raster["pdf"]) == {"bytes", "seconds", "vector_bytes", "vector_seconds"}, name
+        assert raster["pdf"]["bytes"] == len(files_saved["pdf"]), name
+        assert "png" not in raster, name
+
+
+def test_cached_png_matches_savefig():
+    from cdsg_plot.qcdb_plot import flat, ternary
+
+    rng = np.random.default_rng(3)
+    flats = [[{"data": [x]} for x in rng.normal(0.0, scale, 150)] for scale in (1.0, 2.0)]
+    sapts = [[list(row) for row in rng.uniform(-1.0, 1.0, (npts, 3))] for npts in (150, 80)]
+    plots = [lambda cache, data=data: flat(data, mae=0.5, view=False, graphicsformat=["png"], sink=True, cache=cache)
+             for data in flats]
+    plots += [lambda cache, data=data: ternary(data, view=False, graphicsformat=["png"], sink=True, cache=cache)
+              for data in sapts]
+    for plot in plots + plots:
+        plain = png_pixels(plot(False)["png"])
+        cached = png_pixels(plot(True)["png"])
+        assert plain.shape == cached.shape
+        assert (plain == cached).all()
+
+
+def test_bars_paginates(tmp_path):
+    import re
+    from cdsg_plot.qcdb_plot import bars
+
+    data = [{"mc": "mc%d" % i, "data": [0.5, 0.1, 0.2, 0.3]} for i in range(7)]
+    data.insert(3, None)
+    files_saved = bars(data, title="paged", saveas=str(tmp_path) + "/", graphicsformat=["pdf", "png"],
+                       view=False, perpage=3)
+    pltfile = files_saved["pdf"][:-len(".pdf")]
+    assert files_saved["png"] == [pltfile + "_p%d.png" % (ipage + 1) for ipage in range(3)]
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(fl) for fl in files_saved["png"] + [files_saved["pdf"]])
+    with open(files_saved["pdf"], "rb") as handle:
+        assert len(re.findall(rb"/Type /Page\b", handle.read())) == 3
+
+    files_saved = bars(data[:3], title="single", saveas=str(tmp_path) + "/", graphicsformat=["png"], view=False, perpage=3)
+    assert isinstance(files_saved["png"], str) and os.path.isfile(files_saved["png"])
+
+
+def test_liliowa_atlas_tiles_match_liliowa():
+    import json
+    from cdsg_plot.qcdb_plot import liliowa, liliowa_atlas
+
+    rng = np.random.default_rng(4)
+    mcdats = {"a": list(rng.uniform(-2.0, 2.0, 4)), "b": list(rng.uniform(-2.0, 2.0, 9)),
+              "c": list(rng.uniform(-2.0, 2.0, 3)), "d": [1.5, None, -0.5, 0.25, -1.75]}
+    outputs = {}
+    liliowa_atlas(mcdats, tilesize=60, columns=3, graphicsformat=["png"],
+                  sink=lambda ext, data: outputs.setdefault(ext, data))
+    manifest = json.loads(outputs["json"])
+    atlas = png_pixels(outputs["png"])
+    assert (manifest["columns"], manifest["rows"]) == (3, 2)
+    assert atlas.shape == (120, 180, 4)
+    assert [(tile["x"], tile["y"]) for tile in manifest["tiles"].values()] == [(0, 0), (60, 0), (120, 0), (0, 60)]
+
+    for nm, vals in mcdats.items():
+        tile = manifest["tiles"][nm]
+        clip = atlas[tile["y"] : tile["y"] + tile["height"], tile["x"] : tile["x"] + tile["width"]]
+        single = png_pixels(liliowa([0.0 if v is None else v for v in vals], view=False, graphicsformat=["png"],
+                                    sink=True)["png"])
+        dim = int(np.ceil(np.sqrt(len(vals))))
+        centers = (np.arange(dim) + 0.5) / dim
+        for row in centers:
+            for col in centers:
+                expect = single[int(row * single.shape[0]), int(col * single.shape[1])]
+                found = clip[int(row * 60), int(col * 60)]
+                if nm == "d" and (row, col) == (centers[0], centers[1]):
+                    assert found[3] == 0  # None is left transparent
+                else:
+                    assert np.abs(found - expect).max() <= 1
+    assert (atlas[60:, 60:, 3] == 0).all()
+
+
+def test_shared_counts_match_histogram():
+    from cdsg_plot.qcdb_plot import _shared_counts
+
+    rng = np.random.default_rng(5)
+    values = rng.normal(0.0, 1.5, (4, 200))
+    values[1, ::7] = np.nan
+    values[2, :3] = [-3.0, 3.0, 9.0]
+    counts = _shared_counts(values, -3.0, 3.0, 24)
+    for row, count in zip(values, counts):
+        assert np.array_equal(count, np.histogram(row[~np.isnan(row)], bins=24, range=(-3.0, 3.0))[0])
+
+
+def test_disthist_multiples_share_bins(monkeypatch):
+    import matplotlib.pyplot as plt
+    from cdsg_plot.qcdb_plot import _binned_kde, disthist
+
+    rng = np.random.default_rng(6)
+    data = {"MP2": list(rng.normal(0.3, 1.0, 150)), "HF": list(rng.normal(-0.5, 2.0, 90)) + [None],
+            "CCSD": list(rng.normal(0.0, 0.3, 120))}
+    edges = np.linspace(-4.0, 4.0, 21)
+    monkeypatch.setattr(plt, "close", lambda *args: None)
+    for layout, nhist in (("multiples", 3), ("overlay", 1)):
+        files_saved = disthist(data, xmin=-4.0, xmax=4.0, bins=20, layout=layout, kde=True, view=False,
+                               graphicsformat=["png"], sink=True)
+        assert files_saved["png"].startswith(b"\x89PNG")
+        fig = plt.gcf()
+        # histogram axes come before their twins
+        hists = [ax for ax in fig.axes if ax.get_visible()]
+        assert len(hists) == 2 * nhist
+        hists = hists[:nhist]
+        if layout == "multiples":
+            assert [ax.get_title() for ax in hists] == list(data)
+            for ax, errs in zip(hists, data.values()):
+                expect = np.histogram([e for e in errs if e is not None], bins=edges)[0]
+                assert [patch.get_height() for patch in ax.patches] == list(expect)
+                assert np.allclose([patch.get_x() for patch in ax.patches], edges[:-1])
+        else:
+            assert len(hists[0].patches) == 3
+        # one dashed kde line per method on the twin axes
+        assert sum(line.get_linestyle() == "--" for ax in fig.axes for line in ax.lines) == 3
+    monkeypatch.undo()
+    plt.close("all")
+
+    # binned kde against the exact Gaussian sum with the same Silverman bandwidth
+    errs = np.array(data["MP2"])
+    grid, density = _binned_kde(errs[None, :], -4.0, 4.0)
+    bandwidth = 1.06 * np.std(errs, ddof=1) * len(errs) ** -0.2
+    exact = np.exp(-0.5 * ((grid[:, None] - errs[None, :]) / bandwidth) ** 2).sum(axis=1)
+    exact /= len(errs) * bandwidth * np.sqrt(2.0 * np.pi)
+    assert np.abs(density[0] - exact).max() < 0.01 * exact.max()
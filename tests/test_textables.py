@@ -0,0 +1,111 @@
+import io
+import os
+import itertools
+
+import pandas as pd
+
+from cdsg_plot import textables
+
+columnplan = [
+    ["l", r"""Method \& Basis Set""", "", textables.label, {}],
+    ["d", r"S22", "HB", textables.val, {"sset": "hb", "dbse": "S22"}],
+    ["d", r"S22", "TT", textables.val, {"sset": "default", "dbse": "S22"}],
+]
+
+
+def long_errors():
+    rows = []
+    for imc, (mtd, bas) in enumerate(itertools.product(["MP2", "CCSD"], ["adz", "atz"])):
+        for sset in ["hb", "default"]:
+            rows.append({"mtd": mtd, "opt": "CP", "bas": bas, "sset": sset, "dbse": "S22",
+                         "err": "mae", "value": 0.1 * imc + (sset == "hb")})
+    return pd.DataFrame(rows)
+
+
+def test_write_table_generic_writes_eagerly():
+    kwargs = dict(dbse=["S22"], serrors=long_errors(), mtd=["MP2", "CCSD"], bas=["adz", "atz"],
+                  columnplan=columnplan, theme="t", subjoin=False)
+    text, indices = textables.table_generic(**kwargs)
+
+    fp = io.StringIO()
+    written = textables.write_table_generic(fp, **kwargs)
+    assert fp.getvalue() == "\n".join(text) + "\n"
+    assert written == indices
+
+
+def test_table_figures_skips_inline_flat_cells():
+    plan = [
+        ["l", r"""Method \& Basis Set""", "", textables.label, {}],
+        ["c", r"S22", "HB", textables.flat, {"sset": "hb", "dbse": "S22"}],
+        ["c", r"S22", "TT", textables.flat, {"sset": "default", "dbse": "S22"}],
+    ]
+    plotdata = {"flat_S22-hb-%s-CP-%s" % mc: {"data": [{"data": [0.1, -0.2]}]}
+                for mc in itertools.product(["MP2", "CCSD"], ["adz", "atz"])}
+    figures = textables.table_figures(["S22"], long_errors(), ["MP2", "CCSD"], ["adz", "atz"], plan,
+                                      theme="t", subjoin=False, plotpath="fig/", plotdata=plotdata)
+    assert sorted(figures) == sorted("fig/flat_S22-default-%s-CP-%s.pdf" % mc
+                                     for mc in itertools.product(["MP2", "CCSD"], ["adz", "atz"]))
+
+
+def test_inline_flat_draws_tikz_without_matplotlib():
+    import subprocess
+    import sys
+
+    script = r"""
+import sys
+from cdsg_plot import textables
+from cdsg_plot.qcdb_plot import flat_tikz
+
+data = [{"data": [0.5, None, -1.0]}, {"data": [0.2], "color": "orange"}, {"data": [9.0]}]
+kw = {"matelem": " 0.10", "dbse": "S22", "sset": "hb", "mtd": "MP2", "opt": "CP", "bas": "adz",
+      "plotpath": "fig/", "plotdata": {"flat_S22-hb-MP2-CP-adz": {"data": data, "mae": 0.4}}}
+print(textables.flat(kw))
+print(flat_tikz(data, color="brown"))
+print("matplotlib" in sys.modules)
+"""
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    lines = out.splitlines()
+    assert lines[-1] == "False"
+    assert lines[0].startswith(r"\begin{tikzpicture}") and r"\includegraphics" not in out
+    grey = "color={rgb,1:red,0.502;green,0.502;blue,0.502}"
+    assert r"\draw[line width=0.1412pt,%s] (0.5,.145)--(0.5,.855) (-1,.145)--(-1,.855);" % grey in lines
+    assert r"\draw[line width=0.1412pt,color=orange] (0.2,.145)--(0.2,.855);" in lines
+    assert r"\draw[line width=3.388pt,color={rgb,1:red,0;green,0;blue,0}] (-0.4,0)--(-0.4,1);" in lines
+    assert r"\draw[line width=0.1412pt,color=brown] (0.5,.145)--(0.5,.855) (-1,.145)--(-1,.855) (0.2,.145)--(0.2,.855);" in lines
+    assert "9" not in "".join(line for line in lines if ".145" in line)
+    assert r"\usepackage{tikz}" in textables.begin_latex_document()
+
+
+def test_figure_bundle_pages_included(tmp_path, monkeypatch):
+    from cdsg_plot.qcdb_plot import FigureBundle, flat, liliowa
+
+    monkeypatch.chdir(tmp_path)
+    path = os.path.join("new", "dir", "figs.pdf")
+    with FigureBundle(path) as bundle:
+        for mtd in ["MP2", "CCSD"]:
+            saved = flat([{"data": [0.1]}, {"data": [-0.4]}], title="S22-hb-%s-CP-adz" % mtd, view=False, bundle=bundle)
+        assert saved == {"pdf": path, "page": 2}
+        liliowa([0.5, -0.5, 1.0, 0.0], saveas="liliowa_S22-hb-MP2-CP-adz", view=False, bundle=bundle)
+    assert os.path.isfile(path)
+
+    manifest = textables.read_bundle(path)
+    assert manifest["pages"] == {"flat_S22-hb-MP2-CP-adz": 1, "flat_S22-hb-CCSD-CP-adz": 2,
+                                 "liliowa_S22-hb-MP2-CP-adz": 3}
+    kw = {"matelem": " 0.10", "dbse": "S22", "sset": "hb", "opt": "CP", "bas": "adz", "plotpath": "fig/",
+          "plotbundle": manifest}
+    assert textables.flat(dict(kw, mtd="CCSD")) == r"\includegraphics[width=6.67cm,height=3.5mm,page=2]{%s}" % path
+    assert textables.liliowa(dict(kw, mtd="MP2")) == r"\includegraphics[height=3.5mm,page=3]{%s}" % path
+    assert textables.flat(dict(kw, mtd="HF")) == r"\includegraphics[width=6.67cm,height=3.5mm]{fig/flat_S22-hb-HF-CP-adz.pdf}"
+
+
+def test_figure_bundle_keeps_error_raised_in_block(tmp_path):
+    from cdsg_plot.qcdb_plot import FigureBundle, flat
+
+    path = str(tmp_path / "missing" / "figs")
+    try:
+        with FigureBundle(path) as bundle:
+            flat([{"data": [0.1]}], title="S22", view=False, bundle=bundle)
+            raise KeyError("original")
+    except KeyError as err:
+        assert err.args == ("original",)
+    assert textables.read_bundle(path + ".pdf")["pages"] == {"flat_S22": 1}
@@ -0,0 +1,13 @@
+import numpy as np
+
+from cdsg_plot.thread import plotly_threads
+
+
+def test_webgl_threads_bin_sapt_colors():
+    dats = [{"db": "S22", "sys": str(i), "color": clr, "data": [0.1, -0.2]}
+            for i, clr in enumerate(list(np.linspace(0.0, 1.0, 1001)) + [None, 1.5])]
+    fig = plotly_threads(dats, labels=["d", "t"], color="sapt", view=False, webgl=True)
+    colors = [trace.line.color for trace in fig.data[::2]]
+    # 64 jet shades plus one grey group for the missing and out-of-range colors
+    assert len(colors) == 65
+    assert colors[-1] == "#808080"